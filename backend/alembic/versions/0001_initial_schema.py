@@ -0,0 +1,875 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 01:03:25.539767
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('username', sa.String(length=100), nullable=False),
+    sa.Column('hashed_password', sa.String(length=255), nullable=False),
+    sa.Column('full_name', sa.String(length=255), nullable=True),
+    sa.Column('role', sa.Enum('ADMIN', 'MANAGER', 'PRODUCER', 'EDITOR', 'CAMERAMAN', 'ACCOUNTANT', 'HR', 'SALES', 'EMPLOYEE', name='userrole'), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_superuser', sa.Boolean(), nullable=True),
+    sa.Column('avatar_url', sa.String(length=500), nullable=True),
+    sa.Column('phone', sa.String(length=50), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_email'), ['email'], unique=True)
+        batch_op.create_index(batch_op.f('ix_users_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_username'), ['username'], unique=True)
+
+    op.create_table('departments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('code', sa.String(length=20), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('manager_id', sa.Integer(), nullable=True),
+    sa.Column('budget', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('code')
+    )
+    with op.batch_alter_table('departments', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_departments_id'), ['id'], unique=False)
+
+    op.create_table('employees',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('employee_code', sa.String(length=20), nullable=False),
+    sa.Column('department_id', sa.Integer(), nullable=True),
+    sa.Column('job_title', sa.String(length=100), nullable=False),
+    sa.Column('employment_type', sa.Enum('FULL_TIME', 'PART_TIME', 'CONTRACT', 'FREELANCE', 'INTERN', name='employmenttype'), nullable=True),
+    sa.Column('date_of_birth', sa.Date(), nullable=True),
+    sa.Column('address', sa.Text(), nullable=True),
+    sa.Column('emergency_contact', sa.String(length=255), nullable=True),
+    sa.Column('emergency_phone', sa.String(length=50), nullable=True),
+    sa.Column('hire_date', sa.Date(), nullable=False),
+    sa.Column('termination_date', sa.Date(), nullable=True),
+    sa.Column('salary', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('hourly_rate', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('skills', sa.Text(), nullable=True),
+    sa.Column('certifications', sa.Text(), nullable=True),
+    sa.Column('equipment_proficiency', sa.Text(), nullable=True),
+    sa.Column('annual_leave_balance', sa.Integer(), nullable=True),
+    sa.Column('sick_leave_balance', sa.Integer(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['department_id'], ['departments.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('employee_code'),
+    sa.UniqueConstraint('user_id')
+    )
+    with op.batch_alter_table('employees', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_employees_id'), ['id'], unique=False)
+
+    # departments and employees reference each other, so this key is added last
+    with op.batch_alter_table('departments', schema=None) as batch_op:
+        batch_op.create_foreign_key('fk_departments_manager_id_employees', 'employees', ['manager_id'], ['id'])
+
+    op.create_table('equipment',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('code', sa.String(length=50), nullable=False),
+    sa.Column('category', sa.Enum('CAMERA', 'LENS', 'LIGHTING', 'AUDIO', 'GRIP', 'SUPPORT', 'DRONE', 'MONITOR', 'STORAGE', 'COMPUTER', 'SOFTWARE', 'VEHICLE', 'OTHER', name='equipmentcategory'), nullable=False),
+    sa.Column('brand', sa.String(length=100), nullable=True),
+    sa.Column('model', sa.String(length=100), nullable=True),
+    sa.Column('serial_number', sa.String(length=100), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('status', sa.Enum('AVAILABLE', 'IN_USE', 'RESERVED', 'MAINTENANCE', 'DAMAGED', 'RETIRED', name='equipmentstatus'), nullable=True),
+    sa.Column('condition_notes', sa.Text(), nullable=True),
+    sa.Column('purchase_date', sa.Date(), nullable=True),
+    sa.Column('purchase_price', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('vendor', sa.String(length=255), nullable=True),
+    sa.Column('warranty_expiry', sa.Date(), nullable=True),
+    sa.Column('current_value', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('depreciation_rate', sa.Numeric(precision=5, scale=2), nullable=True),
+    sa.Column('storage_location', sa.String(length=255), nullable=True),
+    sa.Column('current_location', sa.String(length=255), nullable=True),
+    sa.Column('is_rentable', sa.Boolean(), nullable=True),
+    sa.Column('daily_rate', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('weekly_rate', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('specifications', sa.Text(), nullable=True),
+    sa.Column('accessories', sa.Text(), nullable=True),
+    sa.Column('insurance_policy', sa.String(length=100), nullable=True),
+    sa.Column('insured_value', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('last_maintenance_date', sa.Date(), nullable=True),
+    sa.Column('next_maintenance_date', sa.Date(), nullable=True),
+    sa.Column('image_url', sa.String(length=500), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('code')
+    )
+    with op.batch_alter_table('equipment', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_equipment_id'), ['id'], unique=False)
+
+    op.create_table('locations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('location_type', sa.Enum('STUDIO', 'OFFICE', 'OUTDOOR', 'RESIDENTIAL', 'COMMERCIAL', 'INDUSTRIAL', 'NATURAL', 'VEHICLE', 'OTHER', name='locationtype'), nullable=True),
+    sa.Column('address_line1', sa.String(length=255), nullable=True),
+    sa.Column('address_line2', sa.String(length=255), nullable=True),
+    sa.Column('city', sa.String(length=100), nullable=True),
+    sa.Column('state', sa.String(length=100), nullable=True),
+    sa.Column('country', sa.String(length=100), nullable=True),
+    sa.Column('postal_code', sa.String(length=20), nullable=True),
+    sa.Column('latitude', sa.Numeric(precision=10, scale=8), nullable=True),
+    sa.Column('longitude', sa.Numeric(precision=11, scale=8), nullable=True),
+    sa.Column('contact_name', sa.String(length=255), nullable=True),
+    sa.Column('contact_phone', sa.String(length=50), nullable=True),
+    sa.Column('contact_email', sa.String(length=255), nullable=True),
+    sa.Column('has_power', sa.Boolean(), nullable=True),
+    sa.Column('has_parking', sa.Boolean(), nullable=True),
+    sa.Column('has_bathroom', sa.Boolean(), nullable=True),
+    sa.Column('has_wifi', sa.Boolean(), nullable=True),
+    sa.Column('max_crew_size', sa.Integer(), nullable=True),
+    sa.Column('rental_rate', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('rental_terms', sa.Text(), nullable=True),
+    sa.Column('permit_required', sa.Boolean(), nullable=True),
+    sa.Column('permit_notes', sa.Text(), nullable=True),
+    sa.Column('insurance_required', sa.Boolean(), nullable=True),
+    sa.Column('noise_restrictions', sa.Text(), nullable=True),
+    sa.Column('time_restrictions', sa.Text(), nullable=True),
+    sa.Column('photos', sa.Text(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('locations', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_locations_id'), ['id'], unique=False)
+
+    op.create_table('clients',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('code', sa.String(length=20), nullable=False),
+    sa.Column('client_type', sa.Enum('AGENCY', 'BRAND', 'PRODUCTION_COMPANY', 'BROADCASTER', 'STREAMING_PLATFORM', 'INDIVIDUAL', 'NON_PROFIT', 'GOVERNMENT', 'OTHER', name='clienttype'), nullable=True),
+    sa.Column('email', sa.String(length=255), nullable=True),
+    sa.Column('phone', sa.String(length=50), nullable=True),
+    sa.Column('website', sa.String(length=255), nullable=True),
+    sa.Column('address_line1', sa.String(length=255), nullable=True),
+    sa.Column('address_line2', sa.String(length=255), nullable=True),
+    sa.Column('city', sa.String(length=100), nullable=True),
+    sa.Column('state', sa.String(length=100), nullable=True),
+    sa.Column('country', sa.String(length=100), nullable=True),
+    sa.Column('postal_code', sa.String(length=20), nullable=True),
+    sa.Column('industry', sa.String(length=100), nullable=True),
+    sa.Column('company_size', sa.String(length=50), nullable=True),
+    sa.Column('annual_revenue', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('account_manager_id', sa.Integer(), nullable=True),
+    sa.Column('billing_email', sa.String(length=255), nullable=True),
+    sa.Column('payment_terms', sa.Integer(), nullable=True),
+    sa.Column('tax_id', sa.String(length=50), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['account_manager_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('code')
+    )
+    with op.batch_alter_table('clients', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_clients_id'), ['id'], unique=False)
+
+    op.create_table('leave_requests',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('leave_type', sa.Enum('ANNUAL', 'SICK', 'PERSONAL', 'MATERNITY', 'PATERNITY', 'UNPAID', name='leavetype'), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('end_date', sa.Date(), nullable=False),
+    sa.Column('total_days', sa.Integer(), nullable=False),
+    sa.Column('reason', sa.Text(), nullable=True),
+    sa.Column('status', sa.Enum('PENDING', 'APPROVED', 'REJECTED', 'CANCELLED', name='leavestatus'), nullable=True),
+    sa.Column('approved_by_id', sa.Integer(), nullable=True),
+    sa.Column('approved_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('rejection_reason', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['approved_by_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('leave_requests', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_leave_requests_id'), ['id'], unique=False)
+
+    op.create_table('maintenance_records',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('equipment_id', sa.Integer(), nullable=False),
+    sa.Column('maintenance_type', sa.Enum('ROUTINE', 'REPAIR', 'CALIBRATION', 'CLEANING', 'UPGRADE', name='maintenancetype'), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('scheduled_date', sa.Date(), nullable=True),
+    sa.Column('completed_date', sa.Date(), nullable=True),
+    sa.Column('cost', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('vendor', sa.String(length=255), nullable=True),
+    sa.Column('performed_by', sa.String(length=255), nullable=True),
+    sa.Column('performed_by_id', sa.Integer(), nullable=True),
+    sa.Column('findings', sa.Text(), nullable=True),
+    sa.Column('parts_replaced', sa.Text(), nullable=True),
+    sa.Column('next_maintenance_date', sa.Date(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['equipment_id'], ['equipment.id'], ),
+    sa.ForeignKeyConstraint(['performed_by_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('maintenance_records', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_maintenance_records_id'), ['id'], unique=False)
+
+    op.create_table('contacts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=True),
+    sa.Column('first_name', sa.String(length=100), nullable=False),
+    sa.Column('last_name', sa.String(length=100), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=True),
+    sa.Column('phone', sa.String(length=50), nullable=True),
+    sa.Column('mobile', sa.String(length=50), nullable=True),
+    sa.Column('job_title', sa.String(length=100), nullable=True),
+    sa.Column('department', sa.String(length=100), nullable=True),
+    sa.Column('linkedin', sa.String(length=255), nullable=True),
+    sa.Column('twitter', sa.String(length=255), nullable=True),
+    sa.Column('is_primary', sa.Boolean(), nullable=True),
+    sa.Column('is_decision_maker', sa.Boolean(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('contacts', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_contacts_id'), ['id'], unique=False)
+
+    op.create_table('projects',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('code', sa.String(length=20), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('project_type', sa.Enum('COMMERCIAL', 'CORPORATE', 'DOCUMENTARY', 'MUSIC_VIDEO', 'SHORT_FILM', 'FEATURE_FILM', 'TV_SERIES', 'SOCIAL_MEDIA', 'LIVE_EVENT', 'ANIMATION', 'OTHER', name='projecttype'), nullable=True),
+    sa.Column('status', sa.Enum('PLANNING', 'PRE_PRODUCTION', 'PRODUCTION', 'POST_PRODUCTION', 'REVIEW', 'COMPLETED', 'ON_HOLD', 'CANCELLED', name='projectstatus'), nullable=True),
+    sa.Column('client_id', sa.Integer(), nullable=True),
+    sa.Column('project_manager_id', sa.Integer(), nullable=True),
+    sa.Column('director_id', sa.Integer(), nullable=True),
+    sa.Column('producer_id', sa.Integer(), nullable=True),
+    sa.Column('start_date', sa.Date(), nullable=True),
+    sa.Column('target_end_date', sa.Date(), nullable=True),
+    sa.Column('actual_end_date', sa.Date(), nullable=True),
+    sa.Column('estimated_budget', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('actual_budget', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('video_format', sa.String(length=50), nullable=True),
+    sa.Column('aspect_ratio', sa.String(length=20), nullable=True),
+    sa.Column('duration_minutes', sa.Integer(), nullable=True),
+    sa.Column('deliverables', sa.Text(), nullable=True),
+    sa.Column('progress_percentage', sa.Integer(), nullable=True),
+    sa.Column('is_archived', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+    sa.ForeignKeyConstraint(['director_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['producer_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['project_manager_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('code')
+    )
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_projects_id'), ['id'], unique=False)
+
+    op.create_table('attendance',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('check_in', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('check_out', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('total_hours', sa.Numeric(precision=5, scale=2), nullable=True),
+    sa.Column('overtime_hours', sa.Numeric(precision=5, scale=2), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('location', sa.String(length=255), nullable=True),
+    sa.Column('project_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('attendance', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_attendance_id'), ['id'], unique=False)
+
+    op.create_table('budgets',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('category', sa.Enum('PRE_PRODUCTION', 'PRODUCTION', 'POST_PRODUCTION', 'TALENT', 'CREW', 'EQUIPMENT', 'LOCATION', 'TRAVEL', 'CONTINGENCY', 'OTHER', name='budgetcategory'), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('allocated_amount', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('spent_amount', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('remaining_amount', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('currency', sa.String(length=3), nullable=True),
+    sa.Column('warning_threshold', sa.Integer(), nullable=True),
+    sa.Column('critical_threshold', sa.Integer(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('budgets', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_budgets_id'), ['id'], unique=False)
+
+    op.create_table('deals',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('contact_id', sa.Integer(), nullable=True),
+    sa.Column('stage', sa.Enum('DISCOVERY', 'PROPOSAL', 'NEGOTIATION', 'CONTRACT', 'CLOSED_WON', 'CLOSED_LOST', name='dealstage'), nullable=True),
+    sa.Column('amount', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('probability', sa.Integer(), nullable=True),
+    sa.Column('expected_revenue', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('expected_close_date', sa.Date(), nullable=True),
+    sa.Column('actual_close_date', sa.Date(), nullable=True),
+    sa.Column('owner_id', sa.Integer(), nullable=True),
+    sa.Column('project_id', sa.Integer(), nullable=True),
+    sa.Column('win_reason', sa.Text(), nullable=True),
+    sa.Column('loss_reason', sa.Text(), nullable=True),
+    sa.Column('competitor', sa.String(length=255), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+    sa.ForeignKeyConstraint(['contact_id'], ['contacts.id'], ),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('deals', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_deals_id'), ['id'], unique=False)
+
+    op.create_table('equipment_bookings',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('equipment_id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=True),
+    sa.Column('booked_by_id', sa.Integer(), nullable=False),
+    sa.Column('start_date', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('end_date', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('checked_out_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('checked_out_by_id', sa.Integer(), nullable=True),
+    sa.Column('returned_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('returned_to_id', sa.Integer(), nullable=True),
+    sa.Column('status', sa.Enum('PENDING', 'CONFIRMED', 'CHECKED_OUT', 'RETURNED', 'CANCELLED', name='bookingstatus'), nullable=True),
+    sa.Column('return_condition', sa.Text(), nullable=True),
+    sa.Column('damage_reported', sa.Boolean(), nullable=True),
+    sa.Column('damage_notes', sa.Text(), nullable=True),
+    sa.Column('purpose', sa.Text(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['booked_by_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['checked_out_by_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['equipment_id'], ['equipment.id'], ),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.ForeignKeyConstraint(['returned_to_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('equipment_bookings', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_equipment_bookings_id'), ['id'], unique=False)
+
+    op.create_table('expenses',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=True),
+    sa.Column('employee_id', sa.Integer(), nullable=True),
+    sa.Column('expense_number', sa.String(length=50), nullable=False),
+    sa.Column('category', sa.Enum('EQUIPMENT_RENTAL', 'TALENT', 'CREW', 'LOCATION', 'CATERING', 'TRANSPORTATION', 'ACCOMMODATION', 'POST_PRODUCTION', 'MUSIC_LICENSING', 'PROPS', 'WARDROBE', 'INSURANCE', 'PERMITS', 'SOFTWARE', 'MARKETING', 'OFFICE', 'UTILITIES', 'OTHER', name='expensecategory'), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('currency', sa.String(length=3), nullable=True),
+    sa.Column('expense_date', sa.Date(), nullable=False),
+    sa.Column('vendor_name', sa.String(length=255), nullable=True),
+    sa.Column('vendor_invoice', sa.String(length=100), nullable=True),
+    sa.Column('status', sa.Enum('PENDING', 'APPROVED', 'REJECTED', 'REIMBURSED', name='expensestatus'), nullable=True),
+    sa.Column('approved_by_id', sa.Integer(), nullable=True),
+    sa.Column('approved_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('is_reimbursable', sa.Boolean(), nullable=True),
+    sa.Column('reimbursed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('receipt_path', sa.String(length=500), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('rejection_reason', sa.Text(), nullable=True),
+    sa.Column('submitted_by_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['approved_by_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.ForeignKeyConstraint(['submitted_by_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('expense_number')
+    )
+    with op.batch_alter_table('expenses', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_expenses_id'), ['id'], unique=False)
+
+    op.create_table('invoices',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('invoice_number', sa.String(length=50), nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=True),
+    sa.Column('billing_name', sa.String(length=255), nullable=True),
+    sa.Column('billing_address', sa.Text(), nullable=True),
+    sa.Column('billing_email', sa.String(length=255), nullable=True),
+    sa.Column('issue_date', sa.Date(), nullable=False),
+    sa.Column('due_date', sa.Date(), nullable=False),
+    sa.Column('status', sa.Enum('DRAFT', 'SENT', 'VIEWED', 'PARTIAL', 'PAID', 'OVERDUE', 'CANCELLED', name='invoicestatus'), nullable=True),
+    sa.Column('subtotal', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('tax_rate', sa.Numeric(precision=5, scale=2), nullable=True),
+    sa.Column('tax_amount', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('discount_percentage', sa.Numeric(precision=5, scale=2), nullable=True),
+    sa.Column('discount_amount', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('total_amount', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('amount_paid', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('balance_due', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('currency', sa.String(length=3), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('terms', sa.Text(), nullable=True),
+    sa.Column('payment_terms', sa.Integer(), nullable=True),
+    sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('viewed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_by_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+    sa.ForeignKeyConstraint(['created_by_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('invoice_number')
+    )
+    with op.batch_alter_table('invoices', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_invoices_id'), ['id'], unique=False)
+
+    op.create_table('production_schedules',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('shoot_type', sa.Enum('STUDIO', 'ON_LOCATION', 'GREEN_SCREEN', 'INTERVIEW', 'B_ROLL', 'AERIAL', 'UNDERWATER', 'LIVE_EVENT', 'OTHER', name='shoottype'), nullable=True),
+    sa.Column('status', sa.Enum('TENTATIVE', 'CONFIRMED', 'IN_PROGRESS', 'COMPLETED', 'POSTPONED', 'CANCELLED', name='schedulestatus'), nullable=True),
+    sa.Column('location_id', sa.Integer(), nullable=True),
+    sa.Column('location_notes', sa.Text(), nullable=True),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('call_time', sa.Time(), nullable=True),
+    sa.Column('start_time', sa.Time(), nullable=True),
+    sa.Column('end_time', sa.Time(), nullable=True),
+    sa.Column('wrap_time', sa.Time(), nullable=True),
+    sa.Column('weather_backup_date', sa.Date(), nullable=True),
+    sa.Column('scenes', sa.Text(), nullable=True),
+    sa.Column('shot_count', sa.Integer(), nullable=True),
+    sa.Column('general_notes', sa.Text(), nullable=True),
+    sa.Column('parking_info', sa.Text(), nullable=True),
+    sa.Column('catering_info', sa.Text(), nullable=True),
+    sa.Column('nearest_hospital', sa.String(length=255), nullable=True),
+    sa.Column('production_manager_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['location_id'], ['locations.id'], ),
+    sa.ForeignKeyConstraint(['production_manager_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('production_schedules', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_production_schedules_id'), ['id'], unique=False)
+
+    op.create_table('sprints',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('goal', sa.Text(), nullable=True),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('end_date', sa.Date(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_completed', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('sprints', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_sprints_id'), ['id'], unique=False)
+
+    op.create_table('crew_assignments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('schedule_id', sa.Integer(), nullable=False),
+    sa.Column('employee_id', sa.Integer(), nullable=True),
+    sa.Column('external_name', sa.String(length=255), nullable=True),
+    sa.Column('external_email', sa.String(length=255), nullable=True),
+    sa.Column('external_phone', sa.String(length=50), nullable=True),
+    sa.Column('role', sa.Enum('DIRECTOR', 'PRODUCER', 'CINEMATOGRAPHER', 'CAMERA_OPERATOR', 'SOUND_MIXER', 'BOOM_OPERATOR', 'GAFFER', 'GRIP', 'PRODUCTION_ASSISTANT', 'MAKEUP_ARTIST', 'WARDROBE', 'EDITOR', 'COLORIST', 'VFX_ARTIST', 'MOTION_GRAPHICS', 'DRONE_OPERATOR', 'SCRIPT_SUPERVISOR', 'ART_DIRECTOR', 'SET_DESIGNER', 'RUNNER', 'OTHER', name='crewrole'), nullable=False),
+    sa.Column('call_time', sa.Time(), nullable=True),
+    sa.Column('day_rate', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('is_confirmed', sa.Boolean(), nullable=True),
+    sa.Column('confirmation_sent', sa.Boolean(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ),
+    sa.ForeignKeyConstraint(['schedule_id'], ['production_schedules.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('crew_assignments', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_crew_assignments_id'), ['id'], unique=False)
+
+    op.create_table('invoice_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('invoice_id', sa.Integer(), nullable=False),
+    sa.Column('description', sa.String(length=500), nullable=False),
+    sa.Column('quantity', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('unit_price', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('project_phase', sa.String(length=100), nullable=True),
+    sa.Column('rate_type', sa.String(length=20), nullable=True),
+    sa.Column('hours', sa.Numeric(precision=8, scale=2), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['invoice_id'], ['invoices.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('invoice_items', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_invoice_items_id'), ['id'], unique=False)
+
+    op.create_table('leads',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('contact_id', sa.Integer(), nullable=True),
+    sa.Column('contact_name', sa.String(length=255), nullable=True),
+    sa.Column('contact_email', sa.String(length=255), nullable=True),
+    sa.Column('contact_phone', sa.String(length=50), nullable=True),
+    sa.Column('company_name', sa.String(length=255), nullable=True),
+    sa.Column('source', sa.Enum('WEBSITE', 'REFERRAL', 'SOCIAL_MEDIA', 'COLD_CALL', 'EMAIL_CAMPAIGN', 'TRADE_SHOW', 'PARTNERSHIP', 'REPEAT_CLIENT', 'OTHER', name='leadsource'), nullable=True),
+    sa.Column('status', sa.Enum('NEW', 'CONTACTED', 'QUALIFIED', 'PROPOSAL_SENT', 'NEGOTIATION', 'WON', 'LOST', name='leadstatus'), nullable=True),
+    sa.Column('estimated_value', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('probability', sa.Integer(), nullable=True),
+    sa.Column('assigned_to_id', sa.Integer(), nullable=True),
+    sa.Column('project_type_interest', sa.String(length=100), nullable=True),
+    sa.Column('next_follow_up', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('converted_to_deal_id', sa.Integer(), nullable=True),
+    sa.Column('converted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['assigned_to_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['contact_id'], ['contacts.id'], ),
+    sa.ForeignKeyConstraint(['converted_to_deal_id'], ['deals.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('leads', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_leads_id'), ['id'], unique=False)
+
+    op.create_table('payment_records',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('invoice_id', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('payment_date', sa.Date(), nullable=False),
+    sa.Column('payment_method', sa.Enum('BANK_TRANSFER', 'CREDIT_CARD', 'CHECK', 'CASH', 'PAYPAL', 'OTHER', name='paymentmethod'), nullable=False),
+    sa.Column('reference_number', sa.String(length=100), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('received_by_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['invoice_id'], ['invoices.id'], ),
+    sa.ForeignKeyConstraint(['received_by_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('payment_records', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_payment_records_id'), ['id'], unique=False)
+
+    op.create_table('shoot_days',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('schedule_id', sa.Integer(), nullable=False),
+    sa.Column('day_number', sa.Integer(), nullable=True),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('actual_start', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('actual_end', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('scenes_completed', sa.Text(), nullable=True),
+    sa.Column('shots_completed', sa.Integer(), nullable=True),
+    sa.Column('total_shots', sa.Integer(), nullable=True),
+    sa.Column('delays', sa.Text(), nullable=True),
+    sa.Column('issues', sa.Text(), nullable=True),
+    sa.Column('director_notes', sa.Text(), nullable=True),
+    sa.Column('producer_notes', sa.Text(), nullable=True),
+    sa.Column('weather_conditions', sa.String(length=100), nullable=True),
+    sa.Column('footage_shot', sa.String(length=50), nullable=True),
+    sa.Column('data_captured', sa.String(length=50), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['schedule_id'], ['production_schedules.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('shoot_days', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_shoot_days_id'), ['id'], unique=False)
+
+    op.create_table('tasks',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('sprint_id', sa.Integer(), nullable=True),
+    sa.Column('parent_task_id', sa.Integer(), nullable=True),
+    sa.Column('task_key', sa.String(length=30), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('task_type', sa.Enum('TASK', 'BUG', 'STORY', 'EPIC', 'SUBTASK', 'MILESTONE', name='tasktype'), nullable=True),
+    sa.Column('status', sa.Enum('BACKLOG', 'TODO', 'IN_PROGRESS', 'IN_REVIEW', 'BLOCKED', 'DONE', name='taskstatus'), nullable=True),
+    sa.Column('priority', sa.Enum('LOWEST', 'LOW', 'MEDIUM', 'HIGH', 'HIGHEST', name='taskpriority'), nullable=True),
+    sa.Column('assignee_id', sa.Integer(), nullable=True),
+    sa.Column('created_by_id', sa.Integer(), nullable=False),
+    sa.Column('estimated_hours', sa.Numeric(precision=8, scale=2), nullable=True),
+    sa.Column('logged_hours', sa.Numeric(precision=8, scale=2), nullable=True),
+    sa.Column('due_date', sa.Date(), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('stage', sa.String(length=50), nullable=True),
+    sa.Column('scene_number', sa.String(length=20), nullable=True),
+    sa.Column('shot_list', sa.Text(), nullable=True),
+    sa.Column('position', sa.Integer(), nullable=True),
+    sa.Column('labels', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['assignee_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['created_by_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['parent_task_id'], ['tasks.id'], ),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.ForeignKeyConstraint(['sprint_id'], ['sprints.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('task_key')
+    )
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_tasks_id'), ['id'], unique=False)
+
+    op.create_table('comments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('author_id', sa.Integer(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('parent_comment_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['author_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['parent_comment_id'], ['comments.id'], ),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_comments_id'), ['id'], unique=False)
+
+    op.create_table('interactions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=True),
+    sa.Column('contact_id', sa.Integer(), nullable=True),
+    sa.Column('deal_id', sa.Integer(), nullable=True),
+    sa.Column('lead_id', sa.Integer(), nullable=True),
+    sa.Column('interaction_type', sa.Enum('CALL', 'EMAIL', 'MEETING', 'PRESENTATION', 'DEMO', 'NOTE', name='interactiontype'), nullable=False),
+    sa.Column('subject', sa.String(length=255), nullable=False),
+    sa.Column('content', sa.Text(), nullable=True),
+    sa.Column('scheduled_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('duration_minutes', sa.Integer(), nullable=True),
+    sa.Column('outcome', sa.Text(), nullable=True),
+    sa.Column('follow_up_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('follow_up_notes', sa.Text(), nullable=True),
+    sa.Column('created_by_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+    sa.ForeignKeyConstraint(['contact_id'], ['contacts.id'], ),
+    sa.ForeignKeyConstraint(['created_by_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['deal_id'], ['deals.id'], ),
+    sa.ForeignKeyConstraint(['lead_id'], ['leads.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('interactions', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_interactions_id'), ['id'], unique=False)
+
+    op.create_table('task_attachments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('filename', sa.String(length=255), nullable=False),
+    sa.Column('file_path', sa.String(length=500), nullable=False),
+    sa.Column('file_size', sa.Integer(), nullable=True),
+    sa.Column('mime_type', sa.String(length=100), nullable=True),
+    sa.Column('uploaded_by_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ),
+    sa.ForeignKeyConstraint(['uploaded_by_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('task_attachments', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_task_attachments_id'), ['id'], unique=False)
+
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('task_attachments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_task_attachments_id'))
+
+    op.drop_table('task_attachments')
+    with op.batch_alter_table('interactions', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_interactions_id'))
+
+    op.drop_table('interactions')
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_comments_id'))
+
+    op.drop_table('comments')
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_tasks_id'))
+
+    op.drop_table('tasks')
+    with op.batch_alter_table('shoot_days', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_shoot_days_id'))
+
+    op.drop_table('shoot_days')
+    with op.batch_alter_table('payment_records', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_payment_records_id'))
+
+    op.drop_table('payment_records')
+    with op.batch_alter_table('leads', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_leads_id'))
+
+    op.drop_table('leads')
+    with op.batch_alter_table('invoice_items', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_invoice_items_id'))
+
+    op.drop_table('invoice_items')
+    with op.batch_alter_table('crew_assignments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_crew_assignments_id'))
+
+    op.drop_table('crew_assignments')
+    with op.batch_alter_table('sprints', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_sprints_id'))
+
+    op.drop_table('sprints')
+    with op.batch_alter_table('production_schedules', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_production_schedules_id'))
+
+    op.drop_table('production_schedules')
+    with op.batch_alter_table('invoices', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_invoices_id'))
+
+    op.drop_table('invoices')
+    with op.batch_alter_table('expenses', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_expenses_id'))
+
+    op.drop_table('expenses')
+    with op.batch_alter_table('equipment_bookings', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_equipment_bookings_id'))
+
+    op.drop_table('equipment_bookings')
+    with op.batch_alter_table('deals', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_deals_id'))
+
+    op.drop_table('deals')
+    with op.batch_alter_table('budgets', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_budgets_id'))
+
+    op.drop_table('budgets')
+    with op.batch_alter_table('attendance', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_attendance_id'))
+
+    op.drop_table('attendance')
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_projects_id'))
+
+    op.drop_table('projects')
+    with op.batch_alter_table('contacts', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_contacts_id'))
+
+    op.drop_table('contacts')
+    with op.batch_alter_table('maintenance_records', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_maintenance_records_id'))
+
+    op.drop_table('maintenance_records')
+    with op.batch_alter_table('leave_requests', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_leave_requests_id'))
+
+    op.drop_table('leave_requests')
+    with op.batch_alter_table('clients', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_clients_id'))
+
+    op.drop_table('clients')
+    with op.batch_alter_table('locations', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_locations_id'))
+
+    op.drop_table('locations')
+    with op.batch_alter_table('equipment', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_equipment_id'))
+
+    op.drop_table('equipment')
+    with op.batch_alter_table('employees', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_employees_id'))
+
+    with op.batch_alter_table('departments', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_departments_manager_id_employees', type_='foreignkey')
+
+    op.drop_table('employees')
+    with op.batch_alter_table('departments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_departments_id'))
+
+    op.drop_table('departments')
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_username'))
+        batch_op.drop_index(batch_op.f('ix_users_id'))
+        batch_op.drop_index(batch_op.f('ix_users_email'))
+
+    op.drop_table('users')
+
+    # PostgreSQL keeps enum types after their tables are dropped
+    if op.get_bind().dialect.name == 'postgresql':
+        for enum_name in (
+            'bookingstatus',
+            'budgetcategory',
+            'clienttype',
+            'crewrole',
+            'dealstage',
+            'employmenttype',
+            'equipmentcategory',
+            'equipmentstatus',
+            'expensecategory',
+            'expensestatus',
+            'interactiontype',
+            'invoicestatus',
+            'leadsource',
+            'leadstatus',
+            'leavestatus',
+            'leavetype',
+            'locationtype',
+            'maintenancetype',
+            'paymentmethod',
+            'projectstatus',
+            'projecttype',
+            'schedulestatus',
+            'shoottype',
+            'taskpriority',
+            'taskstatus',
+            'tasktype',
+            'userrole',
+        ):
+            sa.Enum(name=enum_name).drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,243 @@
+"""route indexes
+
+Revision ID: 0001a
+Revises: 0001
+Create Date: 2026-10-17 01:03:25.539767
+
+Indexes on foreign keys and the filter/order columns of list and dashboard
+routes. Kept apart from 0001 so that databases created by create_all before
+migrations existed can be stamped at 0001 and still receive them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001a'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('employees', schema=None) as batch_op:
+        batch_op.create_index('ix_employees_department_id', ['department_id'], unique=False)
+        batch_op.create_index('ix_employees_is_active', ['is_active'], unique=False)
+
+    with op.batch_alter_table('equipment', schema=None) as batch_op:
+        batch_op.create_index('ix_equipment_active_category', ['category'], unique=False, postgresql_where=sa.text('is_active = true'), sqlite_where=sa.text('is_active = 1'))
+        batch_op.create_index('ix_equipment_active_status', ['status'], unique=False, postgresql_where=sa.text('is_active = true'), sqlite_where=sa.text('is_active = 1'))
+
+    with op.batch_alter_table('locations', schema=None) as batch_op:
+        batch_op.create_index('ix_locations_active_type', ['location_type'], unique=False, postgresql_where=sa.text('is_active = true'), sqlite_where=sa.text('is_active = 1'))
+
+    with op.batch_alter_table('clients', schema=None) as batch_op:
+        batch_op.create_index('ix_clients_account_manager_id', ['account_manager_id'], unique=False)
+        batch_op.create_index('ix_clients_is_active', ['is_active'], unique=False)
+
+    with op.batch_alter_table('leave_requests', schema=None) as batch_op:
+        batch_op.create_index('ix_leave_requests_employee_id', ['employee_id'], unique=False)
+        batch_op.create_index('ix_leave_requests_status', ['status'], unique=False)
+
+    with op.batch_alter_table('maintenance_records', schema=None) as batch_op:
+        batch_op.create_index('ix_maintenance_records_equipment_created', ['equipment_id', 'created_at'], unique=False)
+
+    with op.batch_alter_table('contacts', schema=None) as batch_op:
+        batch_op.create_index('ix_contacts_active_client', ['client_id'], unique=False, postgresql_where=sa.text('is_active = true'), sqlite_where=sa.text('is_active = 1'))
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.create_index('ix_projects_active_client', ['client_id'], unique=False, postgresql_where=sa.text('is_archived = false'), sqlite_where=sa.text('is_archived = 0'))
+        batch_op.create_index('ix_projects_active_status', ['status'], unique=False, postgresql_where=sa.text('is_archived = false'), sqlite_where=sa.text('is_archived = 0'))
+        batch_op.create_index('ix_projects_recent', ['updated_at', 'created_at'], unique=False)
+        batch_op.create_index('ix_projects_status', ['status'], unique=False)
+
+    with op.batch_alter_table('attendance', schema=None) as batch_op:
+        batch_op.create_index('ix_attendance_employee_date', ['employee_id', 'date'], unique=False)
+
+    with op.batch_alter_table('budgets', schema=None) as batch_op:
+        batch_op.create_index('ix_budgets_project_id', ['project_id'], unique=False)
+
+    with op.batch_alter_table('deals', schema=None) as batch_op:
+        batch_op.create_index('ix_deals_client_id', ['client_id'], unique=False)
+        batch_op.create_index('ix_deals_owner_id', ['owner_id'], unique=False)
+        batch_op.create_index('ix_deals_stage_amount', ['stage', 'amount'], unique=False)
+
+    with op.batch_alter_table('equipment_bookings', schema=None) as batch_op:
+        batch_op.create_index('ix_equipment_bookings_equipment_window', ['equipment_id', 'start_date', 'end_date'], unique=False)
+        batch_op.create_index('ix_equipment_bookings_project_start', ['project_id', 'start_date'], unique=False)
+        batch_op.create_index('ix_equipment_bookings_start_date', ['start_date'], unique=False)
+        batch_op.create_index('ix_equipment_bookings_status_start', ['status', 'start_date'], unique=False)
+
+    with op.batch_alter_table('expenses', schema=None) as batch_op:
+        batch_op.create_index('ix_expenses_created_at', ['created_at'], unique=False)
+        batch_op.create_index('ix_expenses_employee_created', ['employee_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_expenses_project_created', ['project_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_expenses_status_created', ['status', 'created_at'], unique=False)
+
+    with op.batch_alter_table('invoices', schema=None) as batch_op:
+        batch_op.create_index('ix_invoices_client_created', ['client_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_invoices_created_at', ['created_at'], unique=False)
+        batch_op.create_index('ix_invoices_project_created', ['project_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_invoices_status_created', ['status', 'created_at'], unique=False)
+
+    with op.batch_alter_table('production_schedules', schema=None) as batch_op:
+        batch_op.create_index('ix_production_schedules_date_status', ['date', 'status'], unique=False)
+        batch_op.create_index('ix_production_schedules_project_date', ['project_id', 'date'], unique=False)
+        batch_op.create_index('ix_production_schedules_status_date', ['status', 'date'], unique=False)
+
+    with op.batch_alter_table('sprints', schema=None) as batch_op:
+        batch_op.create_index('ix_sprints_project_id', ['project_id'], unique=False)
+
+    with op.batch_alter_table('crew_assignments', schema=None) as batch_op:
+        batch_op.create_index('ix_crew_assignments_employee_id', ['employee_id'], unique=False)
+        batch_op.create_index('ix_crew_assignments_schedule_id', ['schedule_id'], unique=False)
+
+    with op.batch_alter_table('invoice_items', schema=None) as batch_op:
+        batch_op.create_index('ix_invoice_items_invoice_id', ['invoice_id'], unique=False)
+
+    with op.batch_alter_table('leads', schema=None) as batch_op:
+        batch_op.create_index('ix_leads_assigned_to_id', ['assigned_to_id'], unique=False)
+        batch_op.create_index('ix_leads_created_at', ['created_at'], unique=False)
+        batch_op.create_index('ix_leads_status', ['status'], unique=False)
+
+    with op.batch_alter_table('payment_records', schema=None) as batch_op:
+        batch_op.create_index('ix_payment_records_invoice_id', ['invoice_id'], unique=False)
+
+    with op.batch_alter_table('shoot_days', schema=None) as batch_op:
+        batch_op.create_index('ix_shoot_days_schedule_date', ['schedule_id', 'date'], unique=False)
+
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.create_index('ix_tasks_assignee_status_due', ['assignee_id', 'status', 'due_date'], unique=False)
+        batch_op.create_index('ix_tasks_created_by_id', ['created_by_id'], unique=False)
+        batch_op.create_index('ix_tasks_parent_task_id', ['parent_task_id'], unique=False)
+        batch_op.create_index('ix_tasks_position', ['position'], unique=False)
+        batch_op.create_index('ix_tasks_project_position', ['project_id', 'position'], unique=False)
+        batch_op.create_index('ix_tasks_project_status_position', ['project_id', 'status', 'position'], unique=False)
+        batch_op.create_index('ix_tasks_recent', ['updated_at', 'created_at'], unique=False)
+        batch_op.create_index('ix_tasks_sprint_position', ['sprint_id', 'position'], unique=False)
+        batch_op.create_index('ix_tasks_status_position', ['status', 'position'], unique=False)
+
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.create_index('ix_comments_author_id', ['author_id'], unique=False)
+        batch_op.create_index('ix_comments_task_created', ['task_id', 'created_at'], unique=False)
+
+    with op.batch_alter_table('interactions', schema=None) as batch_op:
+        batch_op.create_index('ix_interactions_client_created', ['client_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_interactions_created_at', ['created_at'], unique=False)
+        batch_op.create_index('ix_interactions_deal_created', ['deal_id', 'created_at'], unique=False)
+
+    with op.batch_alter_table('task_attachments', schema=None) as batch_op:
+        batch_op.create_index('ix_task_attachments_task_id', ['task_id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('task_attachments', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_attachments_task_id')
+
+    with op.batch_alter_table('interactions', schema=None) as batch_op:
+        batch_op.drop_index('ix_interactions_deal_created')
+        batch_op.drop_index('ix_interactions_created_at')
+        batch_op.drop_index('ix_interactions_client_created')
+
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.drop_index('ix_comments_task_created')
+        batch_op.drop_index('ix_comments_author_id')
+
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_status_position')
+        batch_op.drop_index('ix_tasks_sprint_position')
+        batch_op.drop_index('ix_tasks_recent')
+        batch_op.drop_index('ix_tasks_project_status_position')
+        batch_op.drop_index('ix_tasks_project_position')
+        batch_op.drop_index('ix_tasks_position')
+        batch_op.drop_index('ix_tasks_parent_task_id')
+        batch_op.drop_index('ix_tasks_created_by_id')
+        batch_op.drop_index('ix_tasks_assignee_status_due')
+
+    with op.batch_alter_table('shoot_days', schema=None) as batch_op:
+        batch_op.drop_index('ix_shoot_days_schedule_date')
+
+    with op.batch_alter_table('payment_records', schema=None) as batch_op:
+        batch_op.drop_index('ix_payment_records_invoice_id')
+
+    with op.batch_alter_table('leads', schema=None) as batch_op:
+        batch_op.drop_index('ix_leads_status')
+        batch_op.drop_index('ix_leads_created_at')
+        batch_op.drop_index('ix_leads_assigned_to_id')
+
+    with op.batch_alter_table('invoice_items', schema=None) as batch_op:
+        batch_op.drop_index('ix_invoice_items_invoice_id')
+
+    with op.batch_alter_table('crew_assignments', schema=None) as batch_op:
+        batch_op.drop_index('ix_crew_assignments_schedule_id')
+        batch_op.drop_index('ix_crew_assignments_employee_id')
+
+    with op.batch_alter_table('sprints', schema=None) as batch_op:
+        batch_op.drop_index('ix_sprints_project_id')
+
+    with op.batch_alter_table('production_schedules', schema=None) as batch_op:
+        batch_op.drop_index('ix_production_schedules_status_date')
+        batch_op.drop_index('ix_production_schedules_project_date')
+        batch_op.drop_index('ix_production_schedules_date_status')
+
+    with op.batch_alter_table('invoices', schema=None) as batch_op:
+        batch_op.drop_index('ix_invoices_status_created')
+        batch_op.drop_index('ix_invoices_project_created')
+        batch_op.drop_index('ix_invoices_created_at')
+        batch_op.drop_index('ix_invoices_client_created')
+
+    with op.batch_alter_table('expenses', schema=None) as batch_op:
+        batch_op.drop_index('ix_expenses_status_created')
+        batch_op.drop_index('ix_expenses_project_created')
+        batch_op.drop_index('ix_expenses_employee_created')
+        batch_op.drop_index('ix_expenses_created_at')
+
+    with op.batch_alter_table('equipment_bookings', schema=None) as batch_op:
+        batch_op.drop_index('ix_equipment_bookings_status_start')
+        batch_op.drop_index('ix_equipment_bookings_start_date')
+        batch_op.drop_index('ix_equipment_bookings_project_start')
+        batch_op.drop_index('ix_equipment_bookings_equipment_window')
+
+    with op.batch_alter_table('deals', schema=None) as batch_op:
+        batch_op.drop_index('ix_deals_stage_amount')
+        batch_op.drop_index('ix_deals_owner_id')
+        batch_op.drop_index('ix_deals_client_id')
+
+    with op.batch_alter_table('budgets', schema=None) as batch_op:
+        batch_op.drop_index('ix_budgets_project_id')
+
+    with op.batch_alter_table('attendance', schema=None) as batch_op:
+        batch_op.drop_index('ix_attendance_employee_date')
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_index('ix_projects_status')
+        batch_op.drop_index('ix_projects_recent')
+        batch_op.drop_index('ix_projects_active_status', postgresql_where=sa.text('is_archived = false'), sqlite_where=sa.text('is_archived = 0'))
+        batch_op.drop_index('ix_projects_active_client', postgresql_where=sa.text('is_archived = false'), sqlite_where=sa.text('is_archived = 0'))
+
+    with op.batch_alter_table('contacts', schema=None) as batch_op:
+        batch_op.drop_index('ix_contacts_active_client', postgresql_where=sa.text('is_active = true'), sqlite_where=sa.text('is_active = 1'))
+
+    with op.batch_alter_table('maintenance_records', schema=None) as batch_op:
+        batch_op.drop_index('ix_maintenance_records_equipment_created')
+
+    with op.batch_alter_table('leave_requests', schema=None) as batch_op:
+        batch_op.drop_index('ix_leave_requests_status')
+        batch_op.drop_index('ix_leave_requests_employee_id')
+
+    with op.batch_alter_table('clients', schema=None) as batch_op:
+        batch_op.drop_index('ix_clients_is_active')
+        batch_op.drop_index('ix_clients_account_manager_id')
+
+    with op.batch_alter_table('locations', schema=None) as batch_op:
+        batch_op.drop_index('ix_locations_active_type', postgresql_where=sa.text('is_active = true'), sqlite_where=sa.text('is_active = 1'))
+
+    with op.batch_alter_table('equipment', schema=None) as batch_op:
+        batch_op.drop_index('ix_equipment_active_status', postgresql_where=sa.text('is_active = true'), sqlite_where=sa.text('is_active = 1'))
+        batch_op.drop_index('ix_equipment_active_category', postgresql_where=sa.text('is_active = true'), sqlite_where=sa.text('is_active = 1'))
+
+    with op.batch_alter_table('employees', schema=None) as batch_op:
+        batch_op.drop_index('ix_employees_is_active')
+        batch_op.drop_index('ix_employees_department_id')
@@ -0,0 +1,94 @@
+"""task ranks
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 01:51:43.038630
+
+"""
+from typing import List, Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of the rank helpers in app/core/ranking.py as of this revision,
+# so later changes to the app cannot change what this migration writes
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+_VALUE = {digit: value for value, digit in enumerate(DIGITS)}
+
+
+def _midpoint(low: str, high: Optional[str]) -> str:
+    """Shortest digit string strictly between fractions `low` and `high` (None = 1)."""
+    if high is not None:
+        common = 0
+        while common < len(high) and (low[common] if common < len(low) else "0") == high[common]:
+            common += 1
+        if common:
+            return high[:common] + _midpoint(low[common:], high[common:])
+    low_digit = _VALUE[low[0]] if low else 0
+    high_digit = _VALUE[high[0]] if high is not None else len(DIGITS)
+    if high_digit - low_digit > 1:
+        return DIGITS[(low_digit + high_digit) // 2]
+    if high is not None and len(high) > 1:
+        return high[0]
+    return DIGITS[low_digit] + _midpoint(low[1:], None)
+
+
+def ranks_between(before: Optional[str], after: Optional[str], count: int) -> List[str]:
+    """`count` ascending ranks between `before` and `after`, evenly spread so they stay short."""
+    if count <= 0:
+        return []
+    middle = _midpoint(before or "", after)
+    half = count // 2
+    return ranks_between(before, middle, half) + [middle] + ranks_between(middle, after, count - half - 1)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('rank', sa.String(length=64), nullable=True))
+
+    # Rank each board column in its current (position, id) order
+    bind = op.get_bind()
+    tasks = sa.table(
+        'tasks',
+        sa.column('id', sa.Integer),
+        sa.column('project_id', sa.Integer),
+        sa.column('status', sa.String),
+        sa.column('position', sa.Integer),
+        sa.column('rank', sa.String),
+    )
+    columns = {}
+    rows = bind.execute(
+        sa.select(tasks.c.id, tasks.c.project_id, tasks.c.status)
+        .order_by(tasks.c.project_id, tasks.c.status, tasks.c.position, tasks.c.id)
+    )
+    for task_id, project_id, status in rows:
+        columns.setdefault((project_id, status), []).append(task_id)
+    for task_ids in columns.values():
+        bind.execute(
+            tasks.update().where(tasks.c.id == sa.bindparam('task_id')).values(rank=sa.bindparam('new_rank')),
+            [
+                {'task_id': task_id, 'new_rank': rank}
+                for task_id, rank in zip(task_ids, ranks_between(None, None, len(task_ids)))
+            ]
+        )
+
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.alter_column('rank', existing_type=sa.String(length=64), nullable=False)
+        batch_op.create_index('ix_tasks_project_status_rank', ['project_id', 'status', 'rank'], unique=False)
+
+
+def downgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_project_status_rank')
+        batch_op.drop_column('rank')
+
+    # ### end Alembic commands ###
@@ -0,0 +1,154 @@
+"""
+Maximum SQL statements per request for every API route, checked when
+QUERY_BUDGET_MODE is "warn" or "raise". Most routes authorize from the
+access token's claims and run no authentication query. Routes that run no
+SQL need no entry. Keys match GET /api/v1/admin/db/routes.
+
+Lower a budget when a route gets cheaper; raising one needs a reason.
+Writes to a table counted in stats_counters add one upsert, plus a locked
+read of the old row for updates that change a counted column. Writes that
+appear in the activity feed add one activity_events insert.
+Routes that work through their input in batches call count_batch() once
+per batch, and their budget is per batch.
+"""
+
+ROUTE_QUERY_BUDGETS = {
+    # Auth: user lookup, refresh token insert
+    "POST /api/v1/auth/login": 2,
+    "POST /api/v1/auth/login/json": 2,
+    # Spend the refresh token, reload the user, insert the rotated token
+    "POST /api/v1/auth/refresh": 3,
+    "POST /api/v1/auth/logout": 1,
+    "GET /api/v1/auth/me": 1,
+
+    # Users
+    "GET /api/v1/users/": 1,
+    "POST /api/v1/users/": 2,
+    "GET /api/v1/users/{user_id}": 1,
+    # Deactivation also revokes refresh tokens
+    "PUT /api/v1/users/{user_id}": 2,
+    # ORM delete loads the employee, task and comment relationships to unlink them
+    "DELETE /api/v1/users/{user_id}": 7,
+
+    # HR
+    "GET /api/v1/hr/departments": 1,
+    "POST /api/v1/hr/departments": 1,
+    "GET /api/v1/hr/departments/{dept_id}": 1,
+    "PUT /api/v1/hr/departments/{dept_id}": 1,
+    "GET /api/v1/hr/employees": 1,
+    "POST /api/v1/hr/employees": 2,
+    "GET /api/v1/hr/employees/{emp_id}": 1,
+    "PUT /api/v1/hr/employees/{emp_id}": 3,
+    "GET /api/v1/hr/leave-requests": 1,
+    "POST /api/v1/hr/leave-requests": 2,
+    "PUT /api/v1/hr/leave-requests/{leave_id}": 3,
+    "GET /api/v1/hr/attendance": 1,
+    "POST /api/v1/hr/attendance": 1,
+
+    # Projects
+    "GET /api/v1/projects/": 1,
+    "POST /api/v1/projects/": 3,
+    "GET /api/v1/projects/{project_id}": 1,
+    "PUT /api/v1/projects/{project_id}": 4,
+    "DELETE /api/v1/projects/{project_id}": 4,
+    "GET /api/v1/projects/{project_id}/sprints": 1,
+    "POST /api/v1/projects/sprints": 1,
+    "PUT /api/v1/projects/sprints/{sprint_id}": 1,
+    "GET /api/v1/projects/tasks/all": 1,
+    "GET /api/v1/projects/{project_id}/tasks": 1,
+    "GET /api/v1/projects/{project_id}/board": 1,
+    # Take the key number from the project, last backlog rank, insert, counter upsert, activity event
+    "POST /api/v1/projects/tasks": 5,
+    # Project lookup, then per batch: reference check, key block, last backlog rank,
+    # multi-row insert, counter upsert, activity events
+    "POST /api/v1/projects/{project_id}/tasks/import": 7,
+    "GET /api/v1/projects/tasks/{task_id}": 1,
+    # A status change also reads the last rank of the new column
+    "PUT /api/v1/projects/tasks/{task_id}": 5,
+    # Lock the tasks, last ranks of the columns they move to, one UPDATE for all,
+    # counter upsert, activity events as one executemany
+    "PUT /api/v1/projects/tasks/bulk": 5,
+    # Read task and neighbours (or the column's last rank), then as PUT
+    "PUT /api/v1/projects/tasks/{task_id}/move": 6,
+    # ORM delete loads subtasks, comments and attachments to unlink them
+    "DELETE /api/v1/projects/tasks/{task_id}": 7,
+    "GET /api/v1/projects/tasks/{task_id}/comments": 1,
+    "POST /api/v1/projects/tasks/{task_id}/comments": 1,
+
+    # CRM
+    "GET /api/v1/crm/clients": 1,
+    "POST /api/v1/crm/clients": 2,
+    "GET /api/v1/crm/clients/{client_id}": 1,
+    "PUT /api/v1/crm/clients/{client_id}": 3,
+    "GET /api/v1/crm/contacts": 1,
+    "POST /api/v1/crm/contacts": 1,
+    "GET /api/v1/crm/contacts/{contact_id}": 1,
+    "PUT /api/v1/crm/contacts/{contact_id}": 1,
+    "GET /api/v1/crm/leads": 1,
+    "POST /api/v1/crm/leads": 3,
+    "GET /api/v1/crm/leads/{lead_id}": 1,
+    "PUT /api/v1/crm/leads/{lead_id}": 4,
+    "GET /api/v1/crm/deals": 1,
+    "POST /api/v1/crm/deals": 3,
+    "GET /api/v1/crm/deals/{deal_id}": 1,
+    "PUT /api/v1/crm/deals/{deal_id}": 4,
+    "GET /api/v1/crm/interactions": 1,
+    "POST /api/v1/crm/interactions": 1,
+
+    # Accounting; invoice reads add one selectin query for items
+    "GET /api/v1/accounting/invoices": 2,
+    "POST /api/v1/accounting/invoices": 4,
+    "GET /api/v1/accounting/invoices/{invoice_id}": 2,
+    "PUT /api/v1/accounting/invoices/{invoice_id}": 5,
+    "POST /api/v1/accounting/invoices/{invoice_id}/payments": 5,
+    "GET /api/v1/accounting/invoices/{invoice_id}/payments": 1,
+    "GET /api/v1/accounting/expenses": 1,
+    "POST /api/v1/accounting/expenses": 1,
+    "GET /api/v1/accounting/expenses/{expense_id}": 1,
+    "PUT /api/v1/accounting/expenses/{expense_id}": 1,
+    "GET /api/v1/accounting/budgets": 1,
+    "POST /api/v1/accounting/budgets": 1,
+    "PUT /api/v1/accounting/budgets/{budget_id}": 1,
+
+    # Equipment
+    "GET /api/v1/equipment/": 1,
+    "POST /api/v1/equipment/": 2,
+    "GET /api/v1/equipment/{equipment_id}": 1,
+    "PUT /api/v1/equipment/{equipment_id}": 3,
+    "DELETE /api/v1/equipment/{equipment_id}": 3,
+    "GET /api/v1/equipment/bookings/all": 1,
+    "GET /api/v1/equipment/{equipment_id}/bookings": 1,
+    # Equipment lookup, overlap check, insert, activity event
+    "POST /api/v1/equipment/bookings": 4,
+    "PUT /api/v1/equipment/bookings/{booking_id}": 5,
+    "GET /api/v1/equipment/{equipment_id}/maintenance": 1,
+    "POST /api/v1/equipment/maintenance": 2,
+    "PUT /api/v1/equipment/maintenance/{maintenance_id}": 1,
+
+    # Production
+    "GET /api/v1/production/locations": 1,
+    "POST /api/v1/production/locations": 1,
+    "GET /api/v1/production/locations/{location_id}": 1,
+    "PUT /api/v1/production/locations/{location_id}": 1,
+    "GET /api/v1/production/schedules": 1,
+    "POST /api/v1/production/schedules": 3,
+    "GET /api/v1/production/schedules/{schedule_id}": 1,
+    "PUT /api/v1/production/schedules/{schedule_id}": 4,
+    # ORM delete loads crew assignments and shoot days to unlink them
+    "DELETE /api/v1/production/schedules/{schedule_id}": 7,
+    "GET /api/v1/production/schedules/{schedule_id}/crew": 1,
+    "POST /api/v1/production/crew": 1,
+    "PUT /api/v1/production/crew/{assignment_id}": 1,
+    "DELETE /api/v1/production/crew/{assignment_id}": 2,
+    "GET /api/v1/production/schedules/{schedule_id}/shoot-days": 1,
+    "POST /api/v1/production/shoot-days": 1,
+    "PUT /api/v1/production/shoot-days/{shoot_day_id}": 1,
+
+    # Dashboard; stats read stats_counters only
+    "GET /api/v1/dashboard/stats": 1,
+    "GET /api/v1/dashboard/recent-activity": 3,
+    "GET /api/v1/dashboard/activity": 1,
+    # The initial stats snapshot; pushed updates run outside the request
+    "GET /api/v1/dashboard/stream": 1,
+    "GET /api/v1/dashboard/my-tasks": 1,
+}
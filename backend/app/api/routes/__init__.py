@@ -8,6 +8,7 @@ from .accounting import router as accounting_router
 from .equipment import router as equipment_router
 from .production import router as production_router
 from .dashboard import router as dashboard_router
+from .admin import router as admin_router
 
 api_router = APIRouter()
 
@@ -20,3 +21,4 @@ api_router.include_router(accounting_router, prefix="/accounting", tags=["Accoun
 api_router.include_router(equipment_router, prefix="/equipment", tags=["Equipment"])
 api_router.include_router(production_router, prefix="/production", tags=["Production"])
 api_router.include_router(dashboard_router, prefix="/dashboard", tags=["Dashboard"])
+api_router.include_router(admin_router, prefix="/admin", tags=["Admin"])
@@ -1,12 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert, case, literal
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import List
 from datetime import datetime
 import uuid
 
-from ...core import get_db
+from ...core import get_db, get_read_db
+from ...core.activity import record_activity
+from ...core.crud import insert_returning, update_returning
+from ...core.stats_cache import dashboard_cache
+from ...core.stats_counters import apply_counters, lock_counted
 from ...models.user import User
+from ...models.activity import ActivityAction
 from ...models.accounting import Invoice, InvoiceItem, Expense, Budget, PaymentRecord, InvoiceStatus, ExpenseStatus
 from ...schemas.accounting import (
     InvoiceCreate, InvoiceUpdate, InvoiceResponse,
@@ -27,10 +34,10 @@ async def list_invoices(
     status: InvoiceStatus = None,
     client_id: int = None,
     project_id: int = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = select(Invoice)
+    query = select(Invoice).options(selectinload(Invoice.items))
     if status:
         query = query.where(Invoice.status == status)
     if client_id:
@@ -55,45 +62,54 @@ async def create_invoice(
     tax_amount = (subtotal - discount_amount) * invoice_data.get("tax_rate", 0) / 100
     total_amount = subtotal - discount_amount + tax_amount
     
-    invoice = Invoice(
+    invoice = await insert_returning(db, Invoice, {
         **invoice_data,
-        subtotal=subtotal,
-        discount_amount=discount_amount,
-        tax_amount=tax_amount,
-        total_amount=total_amount,
-        balance_due=total_amount,
-        created_by_id=current_user.id
-    )
-    
-    db.add(invoice)
-    await db.flush()
+        "subtotal": subtotal,
+        "discount_amount": discount_amount,
+        "tax_amount": tax_amount,
+        "total_amount": total_amount,
+        "balance_due": total_amount,
+        "created_by_id": current_user.id
+    })
+    await apply_counters(db, Invoice, None, invoice)
     
-    # Add items
-    for item_data in invoice_in.items:
-        item = InvoiceItem(
-            invoice_id=invoice.id,
-            description=item_data.description,
-            quantity=item_data.quantity,
-            unit_price=item_data.unit_price,
-            amount=item_data.quantity * item_data.unit_price,
-            project_phase=item_data.project_phase,
-            rate_type=item_data.rate_type,
-            hours=item_data.hours
+    # Add items in one executemany INSERT ... RETURNING
+    items = []
+    if invoice_in.items:
+        result = await db.scalars(
+            insert(InvoiceItem).returning(InvoiceItem),
+            [
+                {
+                    "invoice_id": invoice.id,
+                    "description": item_data.description,
+                    "quantity": item_data.quantity,
+                    "unit_price": item_data.unit_price,
+                    "amount": item_data.quantity * item_data.unit_price,
+                    "project_phase": item_data.project_phase,
+                    "rate_type": item_data.rate_type,
+                    "hours": item_data.hours
+                }
+                for item_data in invoice_in.items
+            ]
         )
-        db.add(item)
+        items = list(result)
+    set_committed_value(invoice, "items", items)
     
+    await record_activity(db, invoice, ActivityAction.CREATED, current_user)
     await db.commit()
-    await db.refresh(invoice)
+    dashboard_cache.invalidate("finance")
     return invoice
 
 
 @router.get("/invoices/{invoice_id}", response_model=InvoiceResponse)
 async def get_invoice(
     invoice_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Invoice).where(Invoice.id == invoice_id))
+    result = await db.execute(
+        select(Invoice).where(Invoice.id == invoice_id).options(selectinload(Invoice.items))
+    )
     invoice = result.scalar_one_or_none()
     if not invoice:
         raise HTTPException(status_code=404, detail="Invoice not found")
@@ -107,22 +123,24 @@ async def update_invoice(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Invoice).where(Invoice.id == invoice_id))
-    invoice = result.scalar_one_or_none()
-    if not invoice:
-        raise HTTPException(status_code=404, detail="Invoice not found")
-    
     update_data = invoice_in.model_dump(exclude_unset=True)
     
     # Track if sent
-    if update_data.get("status") == InvoiceStatus.SENT and not invoice.sent_at:
-        invoice.sent_at = datetime.utcnow()
+    if update_data.get("status") == InvoiceStatus.SENT:
+        update_data["sent_at"] = func.coalesce(Invoice.sent_at, datetime.utcnow())
     
-    for field, value in update_data.items():
-        setattr(invoice, field, value)
+    old = await lock_counted(db, Invoice, invoice_id, update_data)
+    invoice = await update_returning(
+        db, Invoice, invoice_id, update_data, options=[selectinload(Invoice.items)]
+    )
+    if not invoice:
+        raise HTTPException(status_code=404, detail="Invoice not found")
+    if old is not None:
+        await apply_counters(db, Invoice, old, invoice)
     
+    await record_activity(db, invoice, ActivityAction.UPDATED, current_user)
     await db.commit()
-    await db.refresh(invoice)
+    dashboard_cache.invalidate("finance")
     return invoice
 
 
@@ -134,35 +152,38 @@ async def record_payment(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Invoice).where(Invoice.id == invoice_id))
-    invoice = result.scalar_one_or_none()
+    # Apply the payment to the invoice in SQL so concurrent payments cannot overwrite each other
+    amount_paid = Invoice.amount_paid + payment_in.amount
+    balance_due = Invoice.total_amount - amount_paid
+    old = await lock_counted(db, Invoice, invoice_id)
+    invoice = await update_returning(db, Invoice, invoice_id, {
+        "amount_paid": amount_paid,
+        "balance_due": balance_due,
+        "status": case(
+            (balance_due <= 0, literal(InvoiceStatus.PAID, Invoice.status.type)),
+            (amount_paid > 0, literal(InvoiceStatus.PARTIAL, Invoice.status.type)),
+            else_=Invoice.status
+        )
+    })
     if not invoice:
         raise HTTPException(status_code=404, detail="Invoice not found")
+    await apply_counters(db, Invoice, old, invoice)
     
-    payment = PaymentRecord(
+    payment = await insert_returning(db, PaymentRecord, {
         **payment_in.model_dump(),
-        received_by_id=current_user.id
-    )
-    db.add(payment)
-    
-    # Update invoice
-    invoice.amount_paid += payment_in.amount
-    invoice.balance_due = invoice.total_amount - invoice.amount_paid
-    
-    if invoice.balance_due <= 0:
-        invoice.status = InvoiceStatus.PAID
-    elif invoice.amount_paid > 0:
-        invoice.status = InvoiceStatus.PARTIAL
+        "received_by_id": current_user.id
+    })
     
+    await record_activity(db, invoice, ActivityAction.PAYMENT_RECORDED, current_user)
     await db.commit()
-    await db.refresh(payment)
+    dashboard_cache.invalidate("finance")
     return payment
 
 
 @router.get("/invoices/{invoice_id}/payments", response_model=List[PaymentRecordResponse])
 async def list_invoice_payments(
     invoice_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(
@@ -179,7 +200,7 @@ async def list_expenses(
     status: ExpenseStatus = None,
     project_id: int = None,
     employee_id: int = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(Expense)
@@ -202,20 +223,18 @@ async def create_expense(
     # Generate expense number
     expense_number = f"EXP-{datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:6].upper()}"
     
-    expense = Expense(
+    expense = await insert_returning(db, Expense, {
         **expense_in.model_dump(),
-        expense_number=expense_number
-    )
-    db.add(expense)
+        "expense_number": expense_number
+    })
     await db.commit()
-    await db.refresh(expense)
     return expense
 
 
 @router.get("/expenses/{expense_id}", response_model=ExpenseResponse)
 async def get_expense(
     expense_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(select(Expense).where(Expense.id == expense_id))
@@ -232,25 +251,20 @@ async def update_expense(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Expense).where(Expense.id == expense_id))
-    expense = result.scalar_one_or_none()
-    if not expense:
-        raise HTTPException(status_code=404, detail="Expense not found")
-    
     update_data = expense_in.model_dump(exclude_unset=True)
     
     # Track approval
     if update_data.get("status") == ExpenseStatus.APPROVED:
-        expense.approved_by_id = current_user.id
-        expense.approved_at = datetime.utcnow()
+        update_data["approved_by_id"] = current_user.id
+        update_data["approved_at"] = datetime.utcnow()
     elif update_data.get("status") == ExpenseStatus.REIMBURSED:
-        expense.reimbursed_at = datetime.utcnow()
+        update_data["reimbursed_at"] = datetime.utcnow()
     
-    for field, value in update_data.items():
-        setattr(expense, field, value)
+    expense = await update_returning(db, Expense, expense_id, update_data)
+    if not expense:
+        raise HTTPException(status_code=404, detail="Expense not found")
     
     await db.commit()
-    await db.refresh(expense)
     return expense
 
 
@@ -260,7 +274,7 @@ async def list_budgets(
     skip: int = 0,
     limit: int = 100,
     project_id: int = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(Budget)
@@ -276,13 +290,11 @@ async def create_budget(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    budget = Budget(
+    budget = await insert_returning(db, Budget, {
         **budget_in.model_dump(),
-        remaining_amount=budget_in.allocated_amount
-    )
-    db.add(budget)
+        "remaining_amount": budget_in.allocated_amount
+    })
     await db.commit()
-    await db.refresh(budget)
     return budget
 
 
@@ -293,19 +305,16 @@ async def update_budget(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Budget).where(Budget.id == budget_id))
-    budget = result.scalar_one_or_none()
-    if not budget:
-        raise HTTPException(status_code=404, detail="Budget not found")
-    
     update_data = budget_in.model_dump(exclude_unset=True)
     
-    for field, value in update_data.items():
-        setattr(budget, field, value)
+    # Recalculate remaining from the new values, falling back to the stored ones
+    allocated = update_data["allocated_amount"] if "allocated_amount" in update_data else Budget.allocated_amount
+    spent = update_data["spent_amount"] if "spent_amount" in update_data else Budget.spent_amount
+    update_data["remaining_amount"] = allocated - spent
     
-    # Recalculate remaining
-    budget.remaining_amount = budget.allocated_amount - budget.spent_amount
+    budget = await update_returning(db, Budget, budget_id, update_data)
+    if not budget:
+        raise HTTPException(status_code=404, detail="Budget not found")
     
     await db.commit()
-    await db.refresh(budget)
     return budget
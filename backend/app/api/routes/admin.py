@@ -0,0 +1,65 @@
+from fastapi import APIRouter, Depends
+from typing import Dict, Any
+
+from ...core.database import engine, read_engine
+from ...core.pool import pool_status
+from ...core.query_stats import route_stats
+from ...core.principal_cache import principal_cache
+from ...core.security import decoded_token_cache
+from ...core.pubsub import dashboard_events
+from ...core.stats_cache import dashboard_cache
+from ...models.user import User
+from .auth import get_current_admin_user
+
+router = APIRouter()
+
+
+@router.get("/db/pool")
+async def get_pool_status(
+    current_user: User = Depends(get_current_admin_user)
+) -> Dict[str, Any]:
+    """Report live connection pool usage and checkout wait times, per engine"""
+    pools = {"primary": pool_status(engine.pool)}
+    if read_engine is not engine:
+        pools["replica"] = pool_status(read_engine.pool)
+    return pools
+
+
+@router.get("/db/routes")
+async def get_route_query_stats(
+    current_user: User = Depends(get_current_admin_user)
+) -> Dict[str, Any]:
+    """Report per-route query counts, DB time and slowest statement, busiest first"""
+    return route_stats.snapshot()
+
+
+@router.get("/auth/principal-cache")
+async def get_principal_cache_stats(
+    current_user: User = Depends(get_current_admin_user)
+) -> Dict[str, Any]:
+    """Report the authenticated-user cache size and hit rate for this worker"""
+    return principal_cache.stats()
+
+
+@router.get("/auth/token-cache")
+async def get_token_cache_stats(
+    current_user: User = Depends(get_current_admin_user)
+) -> Dict[str, Any]:
+    """Report the decoded-token memo size and hit rate for this worker"""
+    return decoded_token_cache.stats()
+
+
+@router.get("/dashboard/stats-cache")
+async def get_dashboard_cache_stats(
+    current_user: User = Depends(get_current_admin_user)
+) -> Dict[str, Any]:
+    """Report cached dashboard sections with their age and the hit rate for this worker"""
+    return dashboard_cache.stats()
+
+
+@router.get("/dashboard/stream")
+async def get_dashboard_stream_stats(
+    current_user: User = Depends(get_current_admin_user)
+) -> Dict[str, Any]:
+    """Report open dashboard stream connections and events published by this worker"""
+    return dashboard_events.stats()
@@ -1,35 +1,89 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from datetime import timedelta
+from sqlalchemy import select, insert, update
+from sqlalchemy.orm import make_transient_to_detached
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+import uuid
 
-from ...core import get_db, verify_password, create_access_token, decode_token, settings
-from ...models.user import User
-from ...schemas.user import Token, UserResponse, UserCreate, LoginRequest
+from ...core import (
+    get_db, verify_password_async, create_access_token, decode_token,
+    create_refresh_token, hash_refresh_token, settings
+)
+from ...core.principal_cache import principal_cache
+from ...core.rate_limit import client_ip, login_rate_limiter
+from ...core.token_revocation import revocation_list
+from ...models.user import User, UserRole, RefreshToken
+from ...schemas.user import Token, UserResponse, UserCreate, LoginRequest, RefreshRequest
 
 router = APIRouter()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login", auto_error=False)
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
+async def issue_tokens(db: AsyncSession, user: User, family_id: Optional[str] = None) -> dict:
+    """Create an access token carrying the user's role and active claims plus a stored refresh token."""
+    access_token = create_access_token(
+        data={
+            "sub": str(user.id),
+            "username": user.username,
+            "role": user.role.value,
+            "active": user.is_active,
+            "su": user.is_superuser
+        },
+        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+    refresh_token = create_refresh_token()
+    await db.execute(
+        insert(RefreshToken).values(
+            user_id=user.id,
+            token_hash=hash_refresh_token(refresh_token),
+            family_id=family_id or uuid.uuid4().hex,
+            expires_at=datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        )
     )
+    await db.commit()
     
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+        "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    }
+
+
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+
+async def get_token_payload(token: str = Depends(oauth2_scheme)) -> dict:
+    """Validated claims of the bearer access token."""
     payload = decode_token(token)
-    if payload is None:
+    if payload is None or payload.get("type") != "access" or payload.get("sub") is None:
         raise credentials_exception
-    
-    user_id: int = payload.get("sub")
-    if user_id is None:
+    if revocation_list.is_revoked(payload):
         raise credentials_exception
+    return payload
+
+
+async def get_current_user(
+    payload: dict = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """The full user row, for handlers that need more than the token claims."""
+    user_id = int(payload["sub"])
+    
+    cached = principal_cache.get(user_id)
+    if cached is not None:
+        # Rebuild a detached instance so no two requests share one ORM object
+        user = User(**cached)
+        make_transient_to_detached(user)
+        return user
     
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
@@ -37,23 +91,48 @@ async def get_current_user(
     if user is None:
         raise credentials_exception
     
+    principal_cache.set(user_id, {attr.key: getattr(user, attr.key) for attr in User.__mapper__.column_attrs})
     return user
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
+    payload: dict = Depends(get_token_payload)
 ) -> User:
-    if not current_user.is_active:
+    """
+    The caller as a detached User built from the token's claims, without a
+    database round trip. Only id, username, role, is_active and is_superuser
+    are loaded; depend on get_current_user for anything else.
+    """
+    if not payload.get("active"):
         raise HTTPException(status_code=400, detail="Inactive user")
+    user = User(
+        id=int(payload["sub"]),
+        username=payload.get("username"),
+        role=UserRole(payload["role"]),
+        is_active=True,
+        is_superuser=bool(payload.get("su"))
+    )
+    make_transient_to_detached(user)
+    return user
+
+
+async def get_current_admin_user(
+    current_user: User = Depends(get_current_active_user)
+) -> User:
+    if not current_user.is_superuser and current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
     return current_user
 
 
 @router.post("/login", response_model=Token)
 async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: AsyncSession = Depends(get_db)
 ):
     """Login and get access token"""
+    await login_rate_limiter.check(client_ip(request), form_data.username)
+    
     result = await db.execute(
         select(User).where(
             (User.username == form_data.username) | (User.email == form_data.username)
@@ -61,7 +140,10 @@ async def login(
     )
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    # End the read transaction so the pooled connection is free while bcrypt runs
+    await db.commit()
+    
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -71,20 +153,18 @@ async def login(
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     
-    access_token = create_access_token(
-        data={"sub": user.id},
-        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    )
-    
-    return {"access_token": access_token, "token_type": "bearer"}
+    return await issue_tokens(db, user)
 
 
 @router.post("/login/json", response_model=Token)
 async def login_json(
+    request: Request,
     login_data: LoginRequest,
     db: AsyncSession = Depends(get_db)
 ):
     """Login with JSON body"""
+    await login_rate_limiter.check(client_ip(request), login_data.username)
+    
     result = await db.execute(
         select(User).where(
             (User.username == login_data.username) | (User.email == login_data.username)
@@ -92,7 +172,10 @@ async def login_json(
     )
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    # End the read transaction so the pooled connection is free while bcrypt runs
+    await db.commit()
+    
+    if not user or not await verify_password_async(login_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password"
@@ -101,15 +184,83 @@ async def login_json(
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     
-    access_token = create_access_token(
-        data={"sub": user.id},
-        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return await issue_tokens(db, user)
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh_access_token(
+    refresh_in: RefreshRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """Rotate a refresh token: the presented one is spent and a new pair issued"""
+    token_hash = hash_refresh_token(refresh_in.refresh_token)
+    now = datetime.now(timezone.utc)
+    
+    # Spend the token atomically so two concurrent refreshes cannot both succeed
+    result = await db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.revoked_at.is_(None),
+            RefreshToken.expires_at > now
+        )
+        .values(revoked_at=now)
+        .returning(RefreshToken.user_id, RefreshToken.family_id)
+    )
+    spent = result.one_or_none()
+    
+    if spent is None:
+        # A rotated token presented again means it leaked: end the whole session
+        await db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.family_id.in_(
+                    select(RefreshToken.family_id).where(RefreshToken.token_hash == token_hash)
+                ),
+                RefreshToken.revoked_at.is_(None)
+            )
+            .values(revoked_at=now)
+        )
+        await db.commit()
+        raise credentials_exception
+    
+    result = await db.execute(select(User).where(User.id == spent.user_id))
+    user = result.scalar_one_or_none()
+    if user is None or not user.is_active:
+        await db.commit()
+        raise credentials_exception
+    
+    return await issue_tokens(db, user, family_id=spent.family_id)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    refresh_in: RefreshRequest,
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+):
+    """Revoke the refresh token's session and, if sent, the current access token"""
+    await db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.family_id.in_(
+                select(RefreshToken.family_id)
+                .where(RefreshToken.token_hash == hash_refresh_token(refresh_in.refresh_token))
+            ),
+            RefreshToken.revoked_at.is_(None)
+        )
+        .values(revoked_at=datetime.now(timezone.utc))
     )
+    await db.commit()
     
-    return {"access_token": access_token, "token_type": "bearer"}
+    payload = decode_token(token) if token else None
+    if payload is not None and payload.get("jti"):
+        revocation_list.revoke_token(payload["jti"], payload["exp"])
 
 
 @router.get("/me", response_model=UserResponse)
-async def read_users_me(current_user: User = Depends(get_current_active_user)):
+async def read_users_me(current_user: User = Depends(get_current_user)):
     """Get current user info"""
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
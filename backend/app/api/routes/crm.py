@@ -3,8 +3,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from typing import List
 
-from ...core import get_db
+from ...core import get_db, get_read_db
+from ...core.activity import record_activity
+from ...core.crud import insert_returning, update_returning
+from ...core.stats_cache import dashboard_cache
+from ...core.stats_counters import apply_counters, lock_counted
 from ...models.user import User
+from ...models.activity import ActivityAction
 from ...models.crm import Client, Contact, Lead, Deal, Interaction
 from ...schemas.crm import (
     ClientCreate, ClientUpdate, ClientResponse,
@@ -14,6 +19,7 @@ from ...schemas.crm import (
     InteractionCreate, InteractionResponse
 )
 from .auth import get_current_active_user
+from .dashboard import publish_activity
 
 router = APIRouter()
 
@@ -24,7 +30,7 @@ async def list_clients(
     skip: int = 0,
     limit: int = 100,
     is_active: bool = True,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(Client).where(Client.is_active == is_active)
@@ -38,17 +44,17 @@ async def create_client(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    client = Client(**client_in.model_dump())
-    db.add(client)
+    client = await insert_returning(db, Client, client_in.model_dump())
+    await apply_counters(db, Client, None, client)
     await db.commit()
-    await db.refresh(client)
+    dashboard_cache.invalidate("crm")
     return client
 
 
 @router.get("/clients/{client_id}", response_model=ClientResponse)
 async def get_client(
     client_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(select(Client).where(Client.id == client_id))
@@ -65,16 +71,16 @@ async def update_client(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Client).where(Client.id == client_id))
-    client = result.scalar_one_or_none()
+    update_data = client_in.model_dump(exclude_unset=True)
+    old = await lock_counted(db, Client, client_id, update_data)
+    client = await update_returning(db, Client, client_id, update_data)
     if not client:
         raise HTTPException(status_code=404, detail="Client not found")
-    
-    for field, value in client_in.model_dump(exclude_unset=True).items():
-        setattr(client, field, value)
+    if old is not None:
+        await apply_counters(db, Client, old, client)
     
     await db.commit()
-    await db.refresh(client)
+    dashboard_cache.invalidate("crm")
     return client
 
 
@@ -84,7 +90,7 @@ async def list_contacts(
     skip: int = 0,
     limit: int = 100,
     client_id: int = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(Contact).where(Contact.is_active == True)
@@ -100,17 +106,15 @@ async def create_contact(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    contact = Contact(**contact_in.model_dump())
-    db.add(contact)
+    contact = await insert_returning(db, Contact, contact_in.model_dump())
     await db.commit()
-    await db.refresh(contact)
     return contact
 
 
 @router.get("/contacts/{contact_id}", response_model=ContactResponse)
 async def get_contact(
     contact_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(select(Contact).where(Contact.id == contact_id))
@@ -127,16 +131,11 @@ async def update_contact(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Contact).where(Contact.id == contact_id))
-    contact = result.scalar_one_or_none()
+    contact = await update_returning(db, Contact, contact_id, contact_in.model_dump(exclude_unset=True))
     if not contact:
         raise HTTPException(status_code=404, detail="Contact not found")
     
-    for field, value in contact_in.model_dump(exclude_unset=True).items():
-        setattr(contact, field, value)
-    
     await db.commit()
-    await db.refresh(contact)
     return contact
 
 
@@ -147,7 +146,7 @@ async def list_leads(
     limit: int = 100,
     status: str = None,
     assigned_to_id: int = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(Lead)
@@ -165,17 +164,19 @@ async def create_lead(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    lead = Lead(**lead_in.model_dump())
-    db.add(lead)
+    lead = await insert_returning(db, Lead, lead_in.model_dump())
+    await apply_counters(db, Lead, None, lead)
+    await record_activity(db, lead, ActivityAction.CREATED, current_user)
     await db.commit()
-    await db.refresh(lead)
+    dashboard_cache.invalidate("crm")
+    publish_activity(lead)
     return lead
 
 
 @router.get("/leads/{lead_id}", response_model=LeadResponse)
 async def get_lead(
     lead_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(select(Lead).where(Lead.id == lead_id))
@@ -192,16 +193,17 @@ async def update_lead(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Lead).where(Lead.id == lead_id))
-    lead = result.scalar_one_or_none()
+    update_data = lead_in.model_dump(exclude_unset=True)
+    old = await lock_counted(db, Lead, lead_id, update_data)
+    lead = await update_returning(db, Lead, lead_id, update_data)
     if not lead:
         raise HTTPException(status_code=404, detail="Lead not found")
+    if old is not None:
+        await apply_counters(db, Lead, old, lead)
     
-    for field, value in lead_in.model_dump(exclude_unset=True).items():
-        setattr(lead, field, value)
-    
+    await record_activity(db, lead, ActivityAction.UPDATED, current_user)
     await db.commit()
-    await db.refresh(lead)
+    dashboard_cache.invalidate("crm")
     return lead
 
 
@@ -213,7 +215,7 @@ async def list_deals(
     stage: str = None,
     client_id: int = None,
     owner_id: int = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(Deal)
@@ -235,17 +237,18 @@ async def create_deal(
 ):
     deal_data = deal_in.model_dump()
     deal_data["expected_revenue"] = deal_data["amount"] * deal_data["probability"] / 100
-    deal = Deal(**deal_data)
-    db.add(deal)
+    deal = await insert_returning(db, Deal, deal_data)
+    await apply_counters(db, Deal, None, deal)
+    await record_activity(db, deal, ActivityAction.CREATED, current_user)
     await db.commit()
-    await db.refresh(deal)
+    dashboard_cache.invalidate("crm")
     return deal
 
 
 @router.get("/deals/{deal_id}", response_model=DealResponse)
 async def get_deal(
     deal_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(select(Deal).where(Deal.id == deal_id))
@@ -262,21 +265,23 @@ async def update_deal(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Deal).where(Deal.id == deal_id))
-    deal = result.scalar_one_or_none()
-    if not deal:
-        raise HTTPException(status_code=404, detail="Deal not found")
-    
     update_data = deal_in.model_dump(exclude_unset=True)
     
-    for field, value in update_data.items():
-        setattr(deal, field, value)
+    # Recalculate expected revenue from the new values, falling back to the stored ones
+    amount = update_data["amount"] if "amount" in update_data else Deal.amount
+    probability = update_data["probability"] if "probability" in update_data else Deal.probability
+    update_data["expected_revenue"] = amount * probability / 100
     
-    # Recalculate expected revenue
-    deal.expected_revenue = deal.amount * deal.probability / 100
+    old = await lock_counted(db, Deal, deal_id, update_data)
+    deal = await update_returning(db, Deal, deal_id, update_data)
+    if not deal:
+        raise HTTPException(status_code=404, detail="Deal not found")
+    if old is not None:
+        await apply_counters(db, Deal, old, deal)
     
+    await record_activity(db, deal, ActivityAction.UPDATED, current_user)
     await db.commit()
-    await db.refresh(deal)
+    dashboard_cache.invalidate("crm")
     return deal
 
 
@@ -287,7 +292,7 @@ async def list_interactions(
     limit: int = 100,
     client_id: int = None,
     deal_id: int = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(Interaction)
@@ -305,8 +310,6 @@ async def create_interaction(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    interaction = Interaction(**interaction_in.model_dump())
-    db.add(interaction)
+    interaction = await insert_returning(db, Interaction, interaction_in.model_dump())
     await db.commit()
-    await db.refresh(interaction)
     return interaction
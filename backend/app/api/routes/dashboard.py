@@ -1,10 +1,24 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from typing import Dict, Any
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import select, or_
+from typing import Dict, Any, Optional, Set
 from datetime import datetime, timedelta
+import asyncio
+import contextvars
+import json
+import logging
+import time
 
-from ...core import get_db
+from ...core import get_db, get_read_db, get_read_session_maker
+from ...core.activity import ACTIVITY_MODULES, activity_feed
+from ...core.config import settings
+from ...core.pagination import InvalidCursor
+from ...core.concurrent_reads import gather_sections
+from ...core.database import async_session_maker
+from ...core.pubsub import dashboard_events
+from ...core.stats_cache import dashboard_cache
+from ...core.stats_counters import COUNTERS, CounterSnapshot, load_counters
 from ...models.user import User
 from ...models.project import Project, Task, ProjectStatus, TaskStatus
 from ...models.crm import Client, Lead, Deal, LeadStatus, DealStage
@@ -12,188 +26,367 @@ from ...models.accounting import Invoice, Expense, InvoiceStatus
 from ...models.equipment import Equipment, EquipmentStatus
 from ...models.hr import Employee, LeaveRequest, LeaveStatus
 from ...models.production import ProductionSchedule, ScheduleStatus
+from ...models.stats import StatsCounter
 from .auth import get_current_active_user
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
-@router.get("/stats")
-async def get_dashboard_stats(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
-) -> Dict[str, Any]:
-    """Get comprehensive dashboard statistics"""
-    
-    # Project stats
-    active_projects = await db.execute(
-        select(func.count(Project.id)).where(
-            Project.is_archived == False,
-            Project.status.notin_([ProjectStatus.COMPLETED, ProjectStatus.CANCELLED])
-        )
-    )
-    completed_projects = await db.execute(
-        select(func.count(Project.id)).where(Project.status == ProjectStatus.COMPLETED)
-    )
-    
-    # Task stats
-    total_tasks = await db.execute(select(func.count(Task.id)))
-    tasks_in_progress = await db.execute(
-        select(func.count(Task.id)).where(Task.status == TaskStatus.IN_PROGRESS)
-    )
-    tasks_completed = await db.execute(
-        select(func.count(Task.id)).where(Task.status == TaskStatus.DONE)
-    )
-    
-    # CRM stats
-    active_clients = await db.execute(
-        select(func.count(Client.id)).where(Client.is_active == True)
-    )
-    new_leads = await db.execute(
-        select(func.count(Lead.id)).where(Lead.status == LeadStatus.NEW)
-    )
-    open_deals = await db.execute(
-        select(func.count(Deal.id)).where(
-            Deal.stage.notin_([DealStage.CLOSED_WON, DealStage.CLOSED_LOST])
-        )
-    )
-    deal_value = await db.execute(
-        select(func.sum(Deal.amount)).where(
-            Deal.stage.notin_([DealStage.CLOSED_WON, DealStage.CLOSED_LOST])
-        )
-    )
-    
-    # Financial stats
-    pending_invoices = await db.execute(
-        select(func.count(Invoice.id)).where(
-            Invoice.status.in_([InvoiceStatus.SENT, InvoiceStatus.VIEWED, InvoiceStatus.PARTIAL])
-        )
-    )
-    pending_invoice_amount = await db.execute(
-        select(func.sum(Invoice.balance_due)).where(
-            Invoice.status.in_([InvoiceStatus.SENT, InvoiceStatus.VIEWED, InvoiceStatus.PARTIAL])
+CLOSED_DEAL_STAGES = [DealStage.CLOSED_WON, DealStage.CLOSED_LOST]
+PENDING_INVOICE_STATUSES = [InvoiceStatus.SENT, InvoiceStatus.VIEWED, InvoiceStatus.PARTIAL]
+
+
+# Sections are computed from the stats_counters snapshot; NULL column values
+# match neither side of a filter, as they would in SQL
+def project_stats(counters: CounterSnapshot) -> Dict[str, Any]:
+    return {
+        "active": counters.count(
+            Project,
+            lambda status, is_archived: is_archived is False
+            and status is not None and status not in (ProjectStatus.COMPLETED, ProjectStatus.CANCELLED)
+        ),
+        "completed": counters.count(Project, lambda status, is_archived: status == ProjectStatus.COMPLETED)
+    }
+
+
+def task_stats(counters: CounterSnapshot) -> Dict[str, Any]:
+    return {
+        "total": counters.count(Task),
+        "in_progress": counters.count(Task, lambda status: status == TaskStatus.IN_PROGRESS),
+        "completed": counters.count(Task, lambda status: status == TaskStatus.DONE)
+    }
+
+
+def crm_stats(counters: CounterSnapshot) -> Dict[str, Any]:
+    def is_open(stage):
+        return stage is not None and stage not in CLOSED_DEAL_STAGES
+
+    return {
+        "active_clients": counters.count(Client, lambda is_active: is_active is True),
+        "new_leads": counters.count(Lead, lambda status: status == LeadStatus.NEW),
+        "open_deals": counters.count(Deal, is_open),
+        "pipeline_value": counters.total(Deal, is_open)
+    }
+
+
+def finance_stats(counters: CounterSnapshot) -> Dict[str, Any]:
+    def is_pending(status):
+        return status in PENDING_INVOICE_STATUSES
+
+    return {
+        "pending_invoices": counters.count(Invoice, is_pending),
+        "pending_amount": counters.total(Invoice, is_pending),
+        "overdue_invoices": counters.count(Invoice, lambda status: status == InvoiceStatus.OVERDUE)
+    }
+
+
+def equipment_stats(counters: CounterSnapshot) -> Dict[str, Any]:
+    return {
+        "available": counters.count(
+            Equipment, lambda is_active, status: is_active is True and status == EquipmentStatus.AVAILABLE
+        ),
+        "in_use": counters.count(
+            Equipment, lambda is_active, status: is_active is True and status == EquipmentStatus.IN_USE
         )
-    )
-    overdue_invoices = await db.execute(
-        select(func.count(Invoice.id)).where(Invoice.status == InvoiceStatus.OVERDUE)
-    )
-    
-    # Equipment stats
-    available_equipment = await db.execute(
-        select(func.count(Equipment.id)).where(
-            Equipment.is_active == True,
-            Equipment.status == EquipmentStatus.AVAILABLE
+    }
+
+
+def hr_stats(counters: CounterSnapshot) -> Dict[str, Any]:
+    return {
+        "total_employees": counters.count(Employee, lambda is_active: is_active is True),
+        "pending_leave_requests": counters.count(LeaveRequest, lambda status: status == LeaveStatus.PENDING)
+    }
+
+
+def production_stats(counters: CounterSnapshot) -> Dict[str, Any]:
+    today = datetime.utcnow().date()
+    return {
+        "upcoming_shoots": counters.count(
+            ProductionSchedule,
+            lambda date, status: date is not None and date >= today
+            and status in (ScheduleStatus.TENTATIVE, ScheduleStatus.CONFIRMED)
         )
-    )
-    equipment_in_use = await db.execute(
-        select(func.count(Equipment.id)).where(
-            Equipment.is_active == True,
-            Equipment.status == EquipmentStatus.IN_USE
+    }
+
+
+DASHBOARD_SECTIONS = {
+    "projects": project_stats,
+    "tasks": task_stats,
+    "crm": crm_stats,
+    "finance": finance_stats,
+    "equipment": equipment_stats,
+    "hr": hr_stats,
+    "production": production_stats,
+}
+
+
+async def load_dashboard_counters(db: AsyncSession) -> CounterSnapshot:
+    # Past shoot days are never read, so skip their buckets
+    return await load_counters(
+        db,
+        or_(
+            StatsCounter.metric != COUNTERS[ProductionSchedule].metric,
+            StatsCounter.bucket >= datetime.utcnow().date().isoformat()
         )
     )
+
+
+async def dashboard_stats(db: AsyncSession) -> Dict[str, Any]:
+    """
+    All sections, served from dashboard_cache until a write invalidates them;
+    cache_age_seconds is the age of the oldest one.
+    """
+    stats: Dict[str, Any] = {}
+    computed_at: Dict[str, float] = {}
+    generations: Dict[str, int] = {}
+    for name in DASHBOARD_SECTIONS:
+        cached = dashboard_cache.get(name)
+        if cached is None:
+            generations[name] = dashboard_cache.generation(name)
+        else:
+            computed_at[name], stats[name] = cached
     
-    # HR stats
-    total_employees = await db.execute(
-        select(func.count(Employee.id)).where(Employee.is_active == True)
-    )
-    pending_leave = await db.execute(
-        select(func.count(LeaveRequest.id)).where(LeaveRequest.status == LeaveStatus.PENDING)
-    )
-    
-    # Production stats - upcoming shoots
-    today = datetime.utcnow().date()
-    upcoming_shoots = await db.execute(
-        select(func.count(ProductionSchedule.id)).where(
-            ProductionSchedule.date >= today,
-            ProductionSchedule.status.in_([ScheduleStatus.TENTATIVE, ScheduleStatus.CONFIRMED])
-        )
-    )
+    if generations:
+        started = time.time()
+        counters = await load_dashboard_counters(db)
+        for name, generation in generations.items():
+            stats[name] = DASHBOARD_SECTIONS[name](counters)
+            dashboard_cache.set(name, stats[name], generation, started)
+            computed_at[name] = started
     
     return {
-        "projects": {
-            "active": active_projects.scalar() or 0,
-            "completed": completed_projects.scalar() or 0
-        },
-        "tasks": {
-            "total": total_tasks.scalar() or 0,
-            "in_progress": tasks_in_progress.scalar() or 0,
-            "completed": tasks_completed.scalar() or 0
-        },
-        "crm": {
-            "active_clients": active_clients.scalar() or 0,
-            "new_leads": new_leads.scalar() or 0,
-            "open_deals": open_deals.scalar() or 0,
-            "pipeline_value": float(deal_value.scalar() or 0)
-        },
-        "finance": {
-            "pending_invoices": pending_invoices.scalar() or 0,
-            "pending_amount": float(pending_invoice_amount.scalar() or 0),
-            "overdue_invoices": overdue_invoices.scalar() or 0
-        },
-        "equipment": {
-            "available": available_equipment.scalar() or 0,
-            "in_use": equipment_in_use.scalar() or 0
-        },
-        "hr": {
-            "total_employees": total_employees.scalar() or 0,
-            "pending_leave_requests": pending_leave.scalar() or 0
-        },
-        "production": {
-            "upcoming_shoots": upcoming_shoots.scalar() or 0
-        }
+        **{name: stats[name] for name in DASHBOARD_SECTIONS},
+        "cache_age_seconds": round(time.time() - min(computed_at.values()), 3)
     }
 
 
-@router.get("/recent-activity")
-async def get_recent_activity(
-    limit: int = 10,
-    db: AsyncSession = Depends(get_db),
+@router.get("/stats")
+async def get_dashboard_stats(
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Dict[str, Any]:
-    """Get recent activity across all modules"""
-    
-    # Recent projects
-    recent_projects_result = await db.execute(
+    """Get comprehensive dashboard statistics from the stats_counters table"""
+    return await dashboard_stats(db)
+
+
+class StatsPublisher:
+    """
+    Turns dashboard_cache invalidations into "stats" events on
+    dashboard_events. Invalidations within DASHBOARD_STREAM_DEBOUNCE_SECONDS
+    share one counters query, and only metrics whose value differs from the
+    last published one are sent, as absolute values.
+    """
+
+    def __init__(self, debounce_seconds: float):
+        self.debounce_seconds = debounce_seconds
+        self._dirty: Set[str] = set()
+        self._published: Dict[str, Dict[str, Any]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def mark_dirty(self, section: str):
+        if section not in DASHBOARD_SECTIONS:
+            return
+        if not dashboard_events.has_subscribers:
+            # Nobody to diff for; the next subscriber starts from a full snapshot
+            self._published.pop(section, None)
+            return
+        self._dirty.add(section)
+        self._schedule()
+
+    def _schedule(self):
+        if self._flush_task is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        # A fresh context keeps the flush's SQL out of the writing request's query stats
+        self._flush_task = loop.create_task(self._flush(), context=contextvars.Context())
+
+    async def _flush(self):
+        try:
+            await asyncio.sleep(self.debounce_seconds)
+            sections, self._dirty = self._dirty, set()
+            generations = {name: dashboard_cache.generation(name) for name in sections}
+            started = time.time()
+            # The primary: these follow this worker's own commits, which a replica may not have yet
+            async with async_session_maker() as db:
+                counters = await load_dashboard_counters(db)
+        except Exception:
+            logger.exception("Dashboard stats flush failed")
+            dashboard_events.publish("resync", {})
+            return
+        finally:
+            self._flush_task = None
+
+        changed: Dict[str, Dict[str, Any]] = {}
+        for name in sorted(sections):
+            values = DASHBOARD_SECTIONS[name](counters)
+            dashboard_cache.set(name, values, generations[name], started)
+            published = self._published.setdefault(name, {})
+            delta = {key: value for key, value in values.items() if published.get(key) != value}
+            if delta:
+                published.update(delta)
+                changed[name] = delta
+        if changed:
+            dashboard_events.publish("stats", changed)
+        if self._dirty:
+            # Invalidated while the counters were loading
+            self._schedule()
+
+
+stats_publisher = StatsPublisher(debounce_seconds=settings.DASHBOARD_STREAM_DEBOUNCE_SECONDS)
+dashboard_cache.add_invalidation_listener(stats_publisher.mark_dirty)
+
+
+def project_activity(p: Project) -> Dict[str, Any]:
+    return {"id": p.id, "name": p.name, "code": p.code, "status": p.status.value}
+
+
+def task_activity(t: Task) -> Dict[str, Any]:
+    return {"id": t.id, "title": t.title, "task_key": t.task_key, "status": t.status.value}
+
+
+def lead_activity(l: Lead) -> Dict[str, Any]:
+    return {"id": l.id, "title": l.title, "status": l.status.value}
+
+
+ACTIVITY_FEEDS = {
+    Project: ("recent_projects", project_activity),
+    Task: ("recent_tasks", task_activity),
+    Lead: ("recent_leads", lead_activity),
+}
+
+
+def publish_activity(row):
+    """Push a created or updated row to stream subscribers; call after commit."""
+    if dashboard_events.has_subscribers:
+        feed, serialize = ACTIVITY_FEEDS[type(row)]
+        dashboard_events.publish("activity", {"feed": feed, "item": serialize(row)})
+
+
+async def recent_projects(db: AsyncSession, limit: int):
+    result = await db.execute(
         select(Project)
         .order_by(Project.updated_at.desc().nullsfirst(), Project.created_at.desc())
-        .limit(5)
+        .limit(limit)
     )
-    recent_projects = recent_projects_result.scalars().all()
-    
-    # Recent tasks
-    recent_tasks_result = await db.execute(
+    return [project_activity(p) for p in result.scalars().all()]
+
+
+async def recent_tasks(db: AsyncSession, limit: int):
+    result = await db.execute(
         select(Task)
         .order_by(Task.updated_at.desc().nullsfirst(), Task.created_at.desc())
-        .limit(5)
+        .limit(limit)
     )
-    recent_tasks = recent_tasks_result.scalars().all()
-    
-    # Recent leads
-    recent_leads_result = await db.execute(
+    return [task_activity(t) for t in result.scalars().all()]
+
+
+async def recent_leads(db: AsyncSession, limit: int):
+    result = await db.execute(
         select(Lead)
         .order_by(Lead.created_at.desc())
-        .limit(5)
+        .limit(limit)
+    )
+    return [lead_activity(l) for l in result.scalars().all()]
+
+
+@router.get("/recent-activity")
+async def get_recent_activity(
+    limit: int = 5,
+    session_maker: async_sessionmaker = Depends(get_read_session_maker),
+    current_user: User = Depends(get_current_active_user)
+) -> Dict[str, Any]:
+    """
+    Get recent activity across all modules, `limit` items per feed. A feed
+    that failed or timed out comes back empty and is named in `errors`.
+    """
+    limit = max(1, min(limit, 50))
+    feeds, errors = await gather_sections(session_maker, {
+        "recent_projects": lambda db: recent_projects(db, limit),
+        "recent_tasks": lambda db: recent_tasks(db, limit),
+        "recent_leads": lambda db: recent_leads(db, limit),
+    }, fallback=list)
+    return {**feeds, "errors": errors}
+
+
+@router.get("/activity")
+async def get_activity_feed(
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    module: Optional[str] = None,
+    actor_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+) -> Dict[str, Any]:
+    """
+    Activity across modules from activity_events, newest first. Pass the
+    returned next_cursor to get the following page; it is None on the last.
+    """
+    if module is not None and module not in ACTIVITY_MODULES:
+        raise HTTPException(status_code=400, detail=f"module must be one of {', '.join(ACTIVITY_MODULES)}")
+    try:
+        return await activity_feed(
+            db, cursor=cursor, limit=max(1, min(limit, 100)), module=module, actor_id=actor_id
+        )
+    except InvalidCursor as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+def sse_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.get("/stream")
+async def stream_dashboard(
+    session_maker: async_sessionmaker = Depends(get_read_session_maker),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Server-sent events for the dashboard: a full "stats" snapshot, then
+    "stats" events carrying only the metrics that changed, "activity" events
+    ({feed, item}) for created or updated projects, tasks and leads, and
+    "resync" when the client fell too far behind and should refetch.
+    A ": ping" comment is sent when idle so proxies keep the connection open.
+    """
+    # Subscribe before the snapshot so no change between the two is lost
+    subscription = dashboard_events.subscribe()
+    try:
+        async with session_maker() as db:
+            snapshot = await dashboard_stats(db)
+    except BaseException:
+        dashboard_events.unsubscribe(subscription)
+        raise
+
+    async def events():
+        try:
+            yield sse_event("stats", snapshot)
+            # Starlette cancels this generator when the client disconnects
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(
+                        subscription.get(), settings.DASHBOARD_STREAM_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                yield sse_event(event, data)
+        finally:
+            dashboard_events.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
-    recent_leads = recent_leads_result.scalars().all()
-    
-    return {
-        "recent_projects": [
-            {"id": p.id, "name": p.name, "code": p.code, "status": p.status.value}
-            for p in recent_projects
-        ],
-        "recent_tasks": [
-            {"id": t.id, "title": t.title, "task_key": t.task_key, "status": t.status.value}
-            for t in recent_tasks
-        ],
-        "recent_leads": [
-            {"id": l.id, "title": l.title, "status": l.status.value}
-            for l in recent_leads
-        ]
-    }
 
 
 @router.get("/my-tasks")
 async def get_my_tasks(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get tasks assigned to current user"""
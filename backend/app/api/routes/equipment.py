@@ -1,11 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 from typing import List
 from datetime import datetime
 
-from ...core import get_db
+from ...core import get_db, get_read_db
+from ...core.activity import record_activity
+from ...core.crud import insert_returning, update_returning
+from ...core.stats_cache import dashboard_cache
+from ...core.stats_counters import apply_counters, lock_counted
 from ...models.user import User
+from ...models.activity import ActivityAction
 from ...models.equipment import Equipment, EquipmentBooking, MaintenanceRecord, EquipmentStatus, BookingStatus
 from ...schemas.equipment import (
     EquipmentCreate, EquipmentUpdate, EquipmentResponse,
@@ -25,7 +30,7 @@ async def list_equipment(
     category: str = None,
     status: EquipmentStatus = None,
     is_available: bool = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(Equipment).where(Equipment.is_active == True)
@@ -45,17 +50,17 @@ async def create_equipment(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    equipment = Equipment(**equipment_in.model_dump())
-    db.add(equipment)
+    equipment = await insert_returning(db, Equipment, equipment_in.model_dump())
+    await apply_counters(db, Equipment, None, equipment)
     await db.commit()
-    await db.refresh(equipment)
+    dashboard_cache.invalidate("equipment")
     return equipment
 
 
 @router.get("/{equipment_id}", response_model=EquipmentResponse)
 async def get_equipment(
     equipment_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(select(Equipment).where(Equipment.id == equipment_id))
@@ -72,16 +77,16 @@ async def update_equipment(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Equipment).where(Equipment.id == equipment_id))
-    equipment = result.scalar_one_or_none()
+    update_data = equipment_in.model_dump(exclude_unset=True)
+    old = await lock_counted(db, Equipment, equipment_id, update_data)
+    equipment = await update_returning(db, Equipment, equipment_id, update_data)
     if not equipment:
         raise HTTPException(status_code=404, detail="Equipment not found")
-    
-    for field, value in equipment_in.model_dump(exclude_unset=True).items():
-        setattr(equipment, field, value)
+    if old is not None:
+        await apply_counters(db, Equipment, old, equipment)
     
     await db.commit()
-    await db.refresh(equipment)
+    dashboard_cache.invalidate("equipment")
     return equipment
 
 
@@ -91,13 +96,14 @@ async def delete_equipment(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Equipment).where(Equipment.id == equipment_id))
-    equipment = result.scalar_one_or_none()
+    old = await lock_counted(db, Equipment, equipment_id)
+    equipment = await update_returning(db, Equipment, equipment_id, {"is_active": False})
     if not equipment:
         raise HTTPException(status_code=404, detail="Equipment not found")
+    await apply_counters(db, Equipment, old, equipment)
     
-    equipment.is_active = False
     await db.commit()
+    dashboard_cache.invalidate("equipment")
 
 
 # Bookings
@@ -108,7 +114,7 @@ async def list_all_bookings(
     status: BookingStatus = None,
     equipment_id: int = None,
     project_id: int = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(EquipmentBooking)
@@ -125,7 +131,7 @@ async def list_all_bookings(
 @router.get("/{equipment_id}/bookings", response_model=List[EquipmentBookingResponse])
 async def list_equipment_bookings(
     equipment_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(
@@ -160,10 +166,9 @@ async def create_booking(
     if overlap_result.scalar_one_or_none():
         raise HTTPException(status_code=400, detail="Equipment is already booked for this period")
     
-    booking = EquipmentBooking(**booking_in.model_dump())
-    db.add(booking)
+    booking = await insert_returning(db, EquipmentBooking, booking_in.model_dump())
+    await record_activity(db, booking, ActivityAction.CREATED, current_user)
     await db.commit()
-    await db.refresh(booking)
     return booking
 
 
@@ -174,34 +179,34 @@ async def update_booking(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(EquipmentBooking).where(EquipmentBooking.id == booking_id))
-    booking = result.scalar_one_or_none()
-    if not booking:
-        raise HTTPException(status_code=404, detail="Booking not found")
-    
     update_data = booking_in.model_dump(exclude_unset=True)
     
     # Handle status changes
+    equipment_status = None
     if update_data.get("status") == BookingStatus.CHECKED_OUT:
-        booking.checked_out_at = datetime.utcnow()
-        booking.checked_out_by_id = current_user.id
-        # Update equipment status
-        eq_result = await db.execute(select(Equipment).where(Equipment.id == booking.equipment_id))
-        equipment = eq_result.scalar_one()
-        equipment.status = EquipmentStatus.IN_USE
+        update_data["checked_out_at"] = datetime.utcnow()
+        update_data["checked_out_by_id"] = current_user.id
+        equipment_status = EquipmentStatus.IN_USE
     elif update_data.get("status") == BookingStatus.RETURNED:
-        booking.returned_at = datetime.utcnow()
-        booking.returned_to_id = current_user.id
-        # Update equipment status
-        eq_result = await db.execute(select(Equipment).where(Equipment.id == booking.equipment_id))
-        equipment = eq_result.scalar_one()
-        equipment.status = EquipmentStatus.AVAILABLE
+        update_data["returned_at"] = datetime.utcnow()
+        update_data["returned_to_id"] = current_user.id
+        equipment_status = EquipmentStatus.AVAILABLE
     
-    for field, value in update_data.items():
-        setattr(booking, field, value)
+    booking = await update_returning(db, EquipmentBooking, booking_id, update_data)
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    
+    # Update equipment status in the same transaction
+    if equipment_status is not None:
+        old = await lock_counted(db, Equipment, booking.equipment_id)
+        equipment = await update_returning(db, Equipment, booking.equipment_id, {"status": equipment_status})
+        if old is not None:
+            await apply_counters(db, Equipment, old, equipment)
     
+    await record_activity(db, booking, ActivityAction.UPDATED, current_user)
     await db.commit()
-    await db.refresh(booking)
+    if equipment_status is not None:
+        dashboard_cache.invalidate("equipment")
     return booking
 
 
@@ -209,7 +214,7 @@ async def update_booking(
 @router.get("/{equipment_id}/maintenance", response_model=List[MaintenanceRecordResponse])
 async def list_maintenance_records(
     equipment_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(
@@ -226,17 +231,17 @@ async def create_maintenance_record(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    maintenance = MaintenanceRecord(**maintenance_in.model_dump())
-    db.add(maintenance)
+    maintenance = await insert_returning(db, MaintenanceRecord, maintenance_in.model_dump())
     
     # Update equipment maintenance dates
-    eq_result = await db.execute(select(Equipment).where(Equipment.id == maintenance_in.equipment_id))
-    equipment = eq_result.scalar_one_or_none()
-    if equipment and maintenance_in.next_maintenance_date:
-        equipment.next_maintenance_date = maintenance_in.next_maintenance_date
+    if maintenance_in.next_maintenance_date:
+        await db.execute(
+            update(Equipment)
+            .where(Equipment.id == maintenance_in.equipment_id)
+            .values(next_maintenance_date=maintenance_in.next_maintenance_date)
+        )
     
     await db.commit()
-    await db.refresh(maintenance)
     return maintenance
 
 
@@ -247,24 +252,22 @@ async def update_maintenance_record(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(MaintenanceRecord).where(MaintenanceRecord.id == maintenance_id))
-    maintenance = result.scalar_one_or_none()
+    update_data = maintenance_in.model_dump(exclude_unset=True)
+    
+    maintenance = await update_returning(db, MaintenanceRecord, maintenance_id, update_data)
     if not maintenance:
         raise HTTPException(status_code=404, detail="Maintenance record not found")
     
-    update_data = maintenance_in.model_dump(exclude_unset=True)
-    
-    # If completing maintenance, update equipment
+    # If completing maintenance, update equipment in the same transaction
     if update_data.get("completed_date"):
-        eq_result = await db.execute(select(Equipment).where(Equipment.id == maintenance.equipment_id))
-        equipment = eq_result.scalar_one()
-        equipment.last_maintenance_date = update_data["completed_date"]
+        equipment_values = {"last_maintenance_date": update_data["completed_date"]}
         if update_data.get("next_maintenance_date"):
-            equipment.next_maintenance_date = update_data["next_maintenance_date"]
-    
-    for field, value in update_data.items():
-        setattr(maintenance, field, value)
+            equipment_values["next_maintenance_date"] = update_data["next_maintenance_date"]
+        await db.execute(
+            update(Equipment)
+            .where(Equipment.id == maintenance.equipment_id)
+            .values(**equipment_values)
+        )
     
     await db.commit()
-    await db.refresh(maintenance)
     return maintenance
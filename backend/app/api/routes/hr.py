@@ -4,7 +4,10 @@ from sqlalchemy import select
 from typing import List
 from datetime import datetime
 
-from ...core import get_db
+from ...core import get_db, get_read_db
+from ...core.crud import insert_returning, update_returning
+from ...core.stats_cache import dashboard_cache
+from ...core.stats_counters import apply_counters, lock_counted
 from ...models.user import User
 from ...models.hr import Department, Employee, LeaveRequest, Attendance, LeaveStatus
 from ...schemas.hr import (
@@ -23,7 +26,7 @@ router = APIRouter()
 async def list_departments(
     skip: int = 0,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(select(Department).offset(skip).limit(limit))
@@ -36,17 +39,15 @@ async def create_department(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    dept = Department(**dept_in.model_dump())
-    db.add(dept)
+    dept = await insert_returning(db, Department, dept_in.model_dump())
     await db.commit()
-    await db.refresh(dept)
     return dept
 
 
 @router.get("/departments/{dept_id}", response_model=DepartmentResponse)
 async def get_department(
     dept_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(select(Department).where(Department.id == dept_id))
@@ -63,16 +64,11 @@ async def update_department(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Department).where(Department.id == dept_id))
-    dept = result.scalar_one_or_none()
+    dept = await update_returning(db, Department, dept_id, dept_in.model_dump(exclude_unset=True))
     if not dept:
         raise HTTPException(status_code=404, detail="Department not found")
     
-    for field, value in dept_in.model_dump(exclude_unset=True).items():
-        setattr(dept, field, value)
-    
     await db.commit()
-    await db.refresh(dept)
     return dept
 
 
@@ -82,7 +78,7 @@ async def list_employees(
     skip: int = 0,
     limit: int = 100,
     department_id: int = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(Employee)
@@ -98,17 +94,17 @@ async def create_employee(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    emp = Employee(**emp_in.model_dump())
-    db.add(emp)
+    emp = await insert_returning(db, Employee, emp_in.model_dump())
+    await apply_counters(db, Employee, None, emp)
     await db.commit()
-    await db.refresh(emp)
+    dashboard_cache.invalidate("hr")
     return emp
 
 
 @router.get("/employees/{emp_id}", response_model=EmployeeResponse)
 async def get_employee(
     emp_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(select(Employee).where(Employee.id == emp_id))
@@ -125,16 +121,16 @@ async def update_employee(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Employee).where(Employee.id == emp_id))
-    emp = result.scalar_one_or_none()
+    update_data = emp_in.model_dump(exclude_unset=True)
+    old = await lock_counted(db, Employee, emp_id, update_data)
+    emp = await update_returning(db, Employee, emp_id, update_data)
     if not emp:
         raise HTTPException(status_code=404, detail="Employee not found")
-    
-    for field, value in emp_in.model_dump(exclude_unset=True).items():
-        setattr(emp, field, value)
+    if old is not None:
+        await apply_counters(db, Employee, old, emp)
     
     await db.commit()
-    await db.refresh(emp)
+    dashboard_cache.invalidate("hr")
     return emp
 
 
@@ -145,7 +141,7 @@ async def list_leave_requests(
     limit: int = 100,
     status: LeaveStatus = None,
     employee_id: int = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(LeaveRequest)
@@ -166,13 +162,13 @@ async def create_leave_request(
     # Calculate total days
     total_days = (leave_in.end_date - leave_in.start_date).days + 1
     
-    leave = LeaveRequest(
+    leave = await insert_returning(db, LeaveRequest, {
         **leave_in.model_dump(),
-        total_days=total_days
-    )
-    db.add(leave)
+        "total_days": total_days
+    })
+    await apply_counters(db, LeaveRequest, None, leave)
     await db.commit()
-    await db.refresh(leave)
+    dashboard_cache.invalidate("hr")
     return leave
 
 
@@ -183,11 +179,6 @@ async def update_leave_request(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(LeaveRequest).where(LeaveRequest.id == leave_id))
-    leave = result.scalar_one_or_none()
-    if not leave:
-        raise HTTPException(status_code=404, detail="Leave request not found")
-    
     update_data = leave_in.model_dump(exclude_unset=True)
     
     # Set approved_by and approved_at if status is changing to approved
@@ -195,11 +186,15 @@ async def update_leave_request(
         update_data["approved_by_id"] = current_user.id
         update_data["approved_at"] = datetime.utcnow()
     
-    for field, value in update_data.items():
-        setattr(leave, field, value)
+    old = await lock_counted(db, LeaveRequest, leave_id, update_data)
+    leave = await update_returning(db, LeaveRequest, leave_id, update_data)
+    if not leave:
+        raise HTTPException(status_code=404, detail="Leave request not found")
+    if old is not None:
+        await apply_counters(db, LeaveRequest, old, leave)
     
     await db.commit()
-    await db.refresh(leave)
+    dashboard_cache.invalidate("hr")
     return leave
 
 
@@ -209,7 +204,7 @@ async def list_attendance(
     skip: int = 0,
     limit: int = 100,
     employee_id: int = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(Attendance)
@@ -225,14 +220,13 @@ async def create_attendance(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    att = Attendance(**att_in.model_dump())
+    att_data = att_in.model_dump()
     
     # Calculate total hours if both check_in and check_out provided
-    if att.check_in and att.check_out:
-        delta = att.check_out - att.check_in
-        att.total_hours = round(delta.total_seconds() / 3600, 2)
+    if att_data.get("check_in") and att_data.get("check_out"):
+        delta = att_data["check_out"] - att_data["check_in"]
+        att_data["total_hours"] = round(delta.total_seconds() / 3600, 2)
     
-    db.add(att)
+    att = await insert_returning(db, Attendance, att_data)
     await db.commit()
-    await db.refresh(att)
     return att
@@ -3,8 +3,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List
 
-from ...core import get_db
+from ...core import get_db, get_read_db
+from ...core.activity import record_activity
+from ...core.crud import insert_returning, update_returning
+from ...core.stats_cache import dashboard_cache
+from ...core.stats_counters import apply_counters, lock_counted
 from ...models.user import User
+from ...models.activity import ActivityAction
 from ...models.production import ProductionSchedule, CrewAssignment, Location, ShootDay, ScheduleStatus
 from ...schemas.production import (
     ProductionScheduleCreate, ProductionScheduleUpdate, ProductionScheduleResponse,
@@ -23,7 +28,7 @@ async def list_locations(
     skip: int = 0,
     limit: int = 100,
     location_type: str = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(Location).where(Location.is_active == True)
@@ -39,17 +44,15 @@ async def create_location(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    location = Location(**location_in.model_dump())
-    db.add(location)
+    location = await insert_returning(db, Location, location_in.model_dump())
     await db.commit()
-    await db.refresh(location)
     return location
 
 
 @router.get("/locations/{location_id}", response_model=LocationResponse)
 async def get_location(
     location_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(select(Location).where(Location.id == location_id))
@@ -66,16 +69,11 @@ async def update_location(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Location).where(Location.id == location_id))
-    location = result.scalar_one_or_none()
+    location = await update_returning(db, Location, location_id, location_in.model_dump(exclude_unset=True))
     if not location:
         raise HTTPException(status_code=404, detail="Location not found")
     
-    for field, value in location_in.model_dump(exclude_unset=True).items():
-        setattr(location, field, value)
-    
     await db.commit()
-    await db.refresh(location)
     return location
 
 
@@ -86,7 +84,7 @@ async def list_schedules(
     limit: int = 100,
     project_id: int = None,
     status: ScheduleStatus = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(ProductionSchedule)
@@ -104,17 +102,18 @@ async def create_schedule(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    schedule = ProductionSchedule(**schedule_in.model_dump())
-    db.add(schedule)
+    schedule = await insert_returning(db, ProductionSchedule, schedule_in.model_dump())
+    await apply_counters(db, ProductionSchedule, None, schedule)
+    await record_activity(db, schedule, ActivityAction.CREATED, current_user)
     await db.commit()
-    await db.refresh(schedule)
+    dashboard_cache.invalidate("production")
     return schedule
 
 
 @router.get("/schedules/{schedule_id}", response_model=ProductionScheduleResponse)
 async def get_schedule(
     schedule_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(select(ProductionSchedule).where(ProductionSchedule.id == schedule_id))
@@ -131,16 +130,17 @@ async def update_schedule(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(ProductionSchedule).where(ProductionSchedule.id == schedule_id))
-    schedule = result.scalar_one_or_none()
+    update_data = schedule_in.model_dump(exclude_unset=True)
+    old = await lock_counted(db, ProductionSchedule, schedule_id, update_data)
+    schedule = await update_returning(db, ProductionSchedule, schedule_id, update_data)
     if not schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
+    if old is not None:
+        await apply_counters(db, ProductionSchedule, old, schedule)
     
-    for field, value in schedule_in.model_dump(exclude_unset=True).items():
-        setattr(schedule, field, value)
-    
+    await record_activity(db, schedule, ActivityAction.UPDATED, current_user)
     await db.commit()
-    await db.refresh(schedule)
+    dashboard_cache.invalidate("production")
     return schedule
 
 
@@ -150,20 +150,25 @@ async def delete_schedule(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(ProductionSchedule).where(ProductionSchedule.id == schedule_id))
+    result = await db.execute(
+        select(ProductionSchedule).where(ProductionSchedule.id == schedule_id).with_for_update()
+    )
     schedule = result.scalar_one_or_none()
     if not schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
     
+    await apply_counters(db, ProductionSchedule, schedule, None)
+    await record_activity(db, schedule, ActivityAction.DELETED, current_user)
     await db.delete(schedule)
     await db.commit()
+    dashboard_cache.invalidate("production")
 
 
 # Crew Assignments
 @router.get("/schedules/{schedule_id}/crew", response_model=List[CrewAssignmentResponse])
 async def list_crew_assignments(
     schedule_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(
@@ -178,10 +183,8 @@ async def create_crew_assignment(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    assignment = CrewAssignment(**assignment_in.model_dump())
-    db.add(assignment)
+    assignment = await insert_returning(db, CrewAssignment, assignment_in.model_dump())
     await db.commit()
-    await db.refresh(assignment)
     return assignment
 
 
@@ -192,16 +195,11 @@ async def update_crew_assignment(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(CrewAssignment).where(CrewAssignment.id == assignment_id))
-    assignment = result.scalar_one_or_none()
+    assignment = await update_returning(db, CrewAssignment, assignment_id, assignment_in.model_dump(exclude_unset=True))
     if not assignment:
         raise HTTPException(status_code=404, detail="Crew assignment not found")
     
-    for field, value in assignment_in.model_dump(exclude_unset=True).items():
-        setattr(assignment, field, value)
-    
     await db.commit()
-    await db.refresh(assignment)
     return assignment
 
 
@@ -224,7 +222,7 @@ async def delete_crew_assignment(
 @router.get("/schedules/{schedule_id}/shoot-days", response_model=List[ShootDayResponse])
 async def list_shoot_days(
     schedule_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(
@@ -241,10 +239,8 @@ async def create_shoot_day(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    shoot_day = ShootDay(**shoot_day_in.model_dump())
-    db.add(shoot_day)
+    shoot_day = await insert_returning(db, ShootDay, shoot_day_in.model_dump())
     await db.commit()
-    await db.refresh(shoot_day)
     return shoot_day
 
 
@@ -255,14 +251,9 @@ async def update_shoot_day(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(ShootDay).where(ShootDay.id == shoot_day_id))
-    shoot_day = result.scalar_one_or_none()
+    shoot_day = await update_returning(db, ShootDay, shoot_day_id, shoot_day_in.model_dump(exclude_unset=True))
     if not shoot_day:
         raise HTTPException(status_code=404, detail="Shoot day not found")
     
-    for field, value in shoot_day_in.model_dump(exclude_unset=True).items():
-        setattr(shoot_day, field, value)
-    
     await db.commit()
-    await db.refresh(shoot_day)
     return shoot_day
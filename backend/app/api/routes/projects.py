@@ -1,19 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from typing import List
+from sqlalchemy import select, func, update, insert, literal, tuple_, union_all
+from sqlalchemy.orm import aliased
+from pydantic import ValidationError
+from typing import Dict, List, Optional, Set, Tuple, Union
 from datetime import datetime
 
-from ...core import get_db
+from ...core import get_db, get_read_db
+from ...core.activity import record_activities, record_activity
+from ...core.config import settings
+from ...core.crud import insert_returning, update_many_returning, update_returning
+from ...core.pagination import InvalidCursor, decode_cursor, encode_cursor
+from ...core.query_stats import count_batch
+from ...core.ranking import last_rank, last_ranks, rank_between, rank_rebalancer
+from ...core.stats_cache import dashboard_cache
+from ...core.stats_counters import apply_counter_changes, apply_counters, lock_counted
+from ...core.task_import import (
+    IMPORT_READERS, ImportFileError, batched, iter_lines, parse_task, validation_messages
+)
 from ...models.user import User
+from ...models.activity import ActivityAction
 from ...models.project import Project, Sprint, Task, Comment, TaskStatus
 from ...schemas.project import (
     ProjectCreate, ProjectUpdate, ProjectResponse,
     SprintCreate, SprintUpdate, SprintResponse,
-    TaskCreate, TaskUpdate, TaskResponse,
+    TaskCreate, TaskUpdate, TaskResponse, TaskPage, TaskMove, TaskBulkUpdate, BoardResponse,
+    TaskImportRowError, TaskImportResult,
     CommentCreate, CommentResponse
 )
 from .auth import get_current_active_user
+from .dashboard import publish_activity
 
 router = APIRouter()
 
@@ -25,7 +41,7 @@ async def list_projects(
     limit: int = 100,
     status: str = None,
     client_id: int = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(Project).where(Project.is_archived == False)
@@ -43,17 +59,19 @@ async def create_project(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    project = Project(**project_in.model_dump())
-    db.add(project)
+    project = await insert_returning(db, Project, project_in.model_dump())
+    await apply_counters(db, Project, None, project)
+    await record_activity(db, project, ActivityAction.CREATED, current_user)
     await db.commit()
-    await db.refresh(project)
+    dashboard_cache.invalidate("projects")
+    publish_activity(project)
     return project
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(select(Project).where(Project.id == project_id))
@@ -70,16 +88,18 @@ async def update_project(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
+    update_data = project_in.model_dump(exclude_unset=True)
+    old = await lock_counted(db, Project, project_id, update_data)
+    project = await update_returning(db, Project, project_id, update_data)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
+    if old is not None:
+        await apply_counters(db, Project, old, project)
     
-    for field, value in project_in.model_dump(exclude_unset=True).items():
-        setattr(project, field, value)
-    
+    await record_activity(db, project, ActivityAction.UPDATED, current_user)
     await db.commit()
-    await db.refresh(project)
+    dashboard_cache.invalidate("projects")
+    publish_activity(project)
     return project
 
 
@@ -89,21 +109,23 @@ async def delete_project(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
+    # Soft delete - archive instead
+    old = await lock_counted(db, Project, project_id)
+    project = await update_returning(db, Project, project_id, {"is_archived": True})
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
+    await apply_counters(db, Project, old, project)
     
-    # Soft delete - archive instead
-    project.is_archived = True
+    await record_activity(db, project, ActivityAction.DELETED, current_user)
     await db.commit()
+    dashboard_cache.invalidate("projects")
 
 
 # Sprints
 @router.get("/{project_id}/sprints", response_model=List[SprintResponse])
 async def list_sprints(
     project_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(select(Sprint).where(Sprint.project_id == project_id))
@@ -116,10 +138,8 @@ async def create_sprint(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    sprint = Sprint(**sprint_in.model_dump())
-    db.add(sprint)
+    sprint = await insert_returning(db, Sprint, sprint_in.model_dump())
     await db.commit()
-    await db.refresh(sprint)
     return sprint
 
 
@@ -130,36 +150,53 @@ async def update_sprint(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Sprint).where(Sprint.id == sprint_id))
-    sprint = result.scalar_one_or_none()
+    sprint = await update_returning(db, Sprint, sprint_id, sprint_in.model_dump(exclude_unset=True))
     if not sprint:
         raise HTTPException(status_code=404, detail="Sprint not found")
     
-    for field, value in sprint_in.model_dump(exclude_unset=True).items():
-        setattr(sprint, field, value)
-    
     await db.commit()
-    await db.refresh(sprint)
     return sprint
 
 
 # Tasks
-@router.get("/tasks/all", response_model=List[TaskResponse])
+@router.get("/tasks/all", response_model=Union[List[TaskResponse], TaskPage])
 async def list_all_tasks(
     skip: int = 0,
     limit: int = 100,
     status: TaskStatus = None,
     assignee_id: int = None,
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = select(Task)
+    """
+    Tasks by position. Pass `cursor` (empty for the first page) to page by
+    (position, id) instead of `skip`: the result is then a TaskPage whose
+    next_cursor continues after its last task. Every page costs the same
+    however deep it is, and edits to earlier tasks do not shift it.
+    """
+    query = select(Task).order_by(Task.position, Task.id)
     if status:
         query = query.where(Task.status == status)
     if assignee_id:
         query = query.where(Task.assignee_id == assignee_id)
-    result = await db.execute(query.order_by(Task.position).offset(skip).limit(limit))
-    return result.scalars().all()
+    if cursor is None:
+        result = await db.execute(query.offset(skip).limit(limit))
+        return result.scalars().all()
+
+    limit = max(1, min(limit, 500))
+    if cursor:
+        try:
+            position, task_id = decode_cursor(cursor, 2)
+        except InvalidCursor as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        query = query.where(tuple_(Task.position, Task.id) > tuple_(position, task_id))
+    result = await db.execute(query.limit(limit + 1))
+    tasks = result.scalars().all()
+    return {
+        "items": tasks[:limit],
+        "next_cursor": encode_cursor(tasks[limit - 1].position, tasks[limit - 1].id) if len(tasks) > limit else None,
+    }
 
 
 @router.get("/{project_id}/tasks", response_model=List[TaskResponse])
@@ -167,7 +204,7 @@ async def list_project_tasks(
     project_id: int,
     status: TaskStatus = None,
     sprint_id: int = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     query = select(Task).where(Task.project_id == project_id)
@@ -179,37 +216,231 @@ async def list_project_tasks(
     return result.scalars().all()
 
 
+@router.get("/{project_id}/board", response_model=BoardResponse)
+async def get_board(
+    project_id: int,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    The project's tasks in one column per status, in rank order, with each
+    column's full count, from a single query. Columns list at most `limit`
+    tasks.
+    """
+    ranked = (
+        select(
+            Task,
+            func.count().over(partition_by=Task.status).label("column_count"),
+            func.row_number().over(partition_by=Task.status, order_by=(Task.rank, Task.id)).label("column_row"),
+        )
+        .where(Task.project_id == project_id)
+        .subquery()
+    )
+    ranked_task = aliased(Task, ranked)
+    result = await db.execute(
+        select(ranked_task, ranked.c.column_count)
+        .where(ranked.c.column_row <= max(1, min(limit, 500)))
+        .order_by(ranked.c.rank, ranked.c.id)
+    )
+    
+    columns = {status: {"status": status, "count": 0, "tasks": []} for status in TaskStatus}
+    for task, column_count in result:
+        columns[task.status]["count"] = column_count
+        columns[task.status]["tasks"].append(task)
+    return {"project_id": project_id, "columns": list(columns.values())}
+
+
+async def reserve_task_numbers(db: AsyncSession, project_id: int, count: int = 1) -> Optional[Tuple[str, int]]:
+    """
+    Take `count` consecutive task numbers from the project's sequence with one
+    UPDATE ... RETURNING and return (project code, first number), or None if
+    the project does not exist. The row stays locked until commit, so
+    concurrent inserts into one project queue here instead of colliding on
+    task_key; a rollback returns the numbers.
+    """
+    result = await db.execute(
+        update(Project)
+        .where(Project.id == project_id)
+        # Keep updated_at: adding a task is not an edit of the project
+        .values(next_task_number=Project.next_task_number + count, updated_at=Project.updated_at)
+        .returning(Project.code, Project.next_task_number)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+    return row.code, row.next_task_number - count
+
+
 @router.post("/tasks", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
     task_in: TaskCreate,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    # Generate task key
-    result = await db.execute(
-        select(func.count(Task.id)).where(Task.project_id == task_in.project_id)
-    )
-    task_count = result.scalar() + 1
-    
-    # Get project code
-    proj_result = await db.execute(select(Project).where(Project.id == task_in.project_id))
-    project = proj_result.scalar_one_or_none()
-    if not project:
+    reserved = await reserve_task_numbers(db, task_in.project_id)
+    if reserved is None:
         raise HTTPException(status_code=404, detail="Project not found")
+    code, number = reserved
     
-    task_key = f"{project.code}-{task_count}"
-    
-    task = Task(**task_in.model_dump(), task_key=task_key)
-    db.add(task)
+    # New tasks go to the bottom of the backlog column
+    rank = rank_between(await last_rank(db, task_in.project_id, TaskStatus.BACKLOG), None)
+    task = await insert_returning(db, Task, {
+        **task_in.model_dump(),
+        "task_key": f"{code}-{number}",
+        "status": TaskStatus.BACKLOG,
+        "rank": rank
+    })
+    await apply_counters(db, Task, None, task)
+    await record_activity(db, task, ActivityAction.CREATED, current_user)
     await db.commit()
-    await db.refresh(task)
+    dashboard_cache.invalidate("tasks")
+    publish_activity(task)
     return task
 
 
+async def invalid_task_references(db: AsyncSession, project_id: int, tasks: List[TaskCreate]) -> Dict[int, List[str]]:
+    """
+    Errors by index into `tasks` for sprints and parent tasks that are not in
+    the project, and users that do not exist, checked with one query.
+    """
+    wanted: Dict[str, Set[int]] = {"sprint": set(), "task": set(), "user": set()}
+    for task_in in tasks:
+        if task_in.sprint_id is not None:
+            wanted["sprint"].add(task_in.sprint_id)
+        if task_in.parent_task_id is not None:
+            wanted["task"].add(task_in.parent_task_id)
+        wanted["user"].update(i for i in (task_in.assignee_id, task_in.created_by_id) if i is not None)
+    
+    lookups = {
+        "sprint": select(literal("sprint"), Sprint.id).where(Sprint.project_id == project_id, Sprint.id.in_(wanted["sprint"])),
+        "task": select(literal("task"), Task.id).where(Task.project_id == project_id, Task.id.in_(wanted["task"])),
+        "user": select(literal("user"), User.id).where(User.id.in_(wanted["user"])),
+    }
+    queries = [lookups[kind] for kind, ids in wanted.items() if ids]
+    if not queries:
+        return {}
+    result = await db.execute(union_all(*queries))
+    found = {(kind, row_id) for kind, row_id in result}
+    
+    checks = (
+        ("sprint_id", "sprint", "Sprint {} is not in this project"),
+        ("parent_task_id", "task", "Task {} is not in this project"),
+        ("assignee_id", "user", "User {} not found"),
+        ("created_by_id", "user", "User {} not found"),
+    )
+    errors: Dict[int, List[str]] = {}
+    for index, task_in in enumerate(tasks):
+        for field, kind, message in checks:
+            value = getattr(task_in, field)
+            if value is not None and (kind, value) not in found:
+                errors.setdefault(index, []).append(f"{field}: {message.format(value)}")
+    return errors
+
+
+async def insert_task_batch(db: AsyncSession, project_id: int, tasks: List[TaskCreate], current_user: User) -> bool:
+    """
+    Insert validated tasks at the bottom of the backlog, as create_task does
+    for one, and commit. Keys are reserved as one block and the rows go in
+    as one multi-row INSERT. False if the project does not exist.
+    """
+    reserved = await reserve_task_numbers(db, project_id, len(tasks))
+    if reserved is None:
+        return False
+    code, number = reserved
+    
+    rank = await last_rank(db, project_id, TaskStatus.BACKLOG)
+    rows = []
+    for offset, task_in in enumerate(tasks):
+        rank = rank_between(rank, None)
+        rows.append({
+            **task_in.model_dump(),
+            "task_key": f"{code}-{number + offset}",
+            "status": TaskStatus.BACKLOG,
+            "rank": rank
+        })
+    # Core insert: the ORM would split the rows into one statement per set of non-null columns
+    # RETURNING order is not guaranteed without falling back to one INSERT per row, so match on task_key
+    result = await db.execute(insert(Task.__table__).returning(Task.id, Task.task_key), rows)
+    ids = dict((task_key, task_id) for task_id, task_key in result)
+    # Transient objects for the counter and activity helpers; never added to the session
+    created = [Task(id=ids[row["task_key"]], **row) for row in rows]
+    await apply_counter_changes(db, Task, [(None, task) for task in created])
+    await record_activities(db, created, ActivityAction.CREATED, current_user)
+    await db.commit()
+    return True
+
+
+@router.post("/{project_id}/tasks/import", response_model=TaskImportResult)
+async def import_tasks(
+    project_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Create tasks from a CSV file with a header row (text/csv) or an NDJSON
+    file (application/x-ndjson), sent as the request body. Columns are
+    TaskCreate fields; project_id comes from the path and created_by_id
+    defaults to the caller. The body is read as it arrives and each batch
+    of TASK_IMPORT_BATCH_SIZE rows is validated, inserted and committed on
+    its own. Invalid rows are skipped and reported by line.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    reader = IMPORT_READERS.get(content_type)
+    if reader is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Send the file as one of: {', '.join(IMPORT_READERS)}"
+        )
+    
+    # Before reading the body, so a file of only invalid rows still gets 404 for a missing project
+    result = await db.execute(select(Project.id).where(Project.id == project_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    # End the read transaction so no connection or snapshot is held while the body streams in
+    await db.commit()
+    
+    report = TaskImportResult(created=0, failed=0, errors=[])
+    try:
+        async for batch in batched(reader(iter_lines(request.stream())), settings.TASK_IMPORT_BATCH_SIZE):
+            count_batch()
+            rejected: List[Tuple[int, List[str]]] = []
+            lines, tasks = [], []
+            for line, values in batch:
+                if isinstance(values, str):
+                    rejected.append((line, [values]))
+                    continue
+                try:
+                    tasks.append(parse_task(values, project_id, current_user.id))
+                    lines.append(line)
+                except ValidationError as exc:
+                    rejected.append((line, validation_messages(exc)))
+            
+            if tasks:
+                invalid = await invalid_task_references(db, project_id, tasks)
+                rejected.extend((lines[index], errors) for index, errors in invalid.items())
+                tasks = [task_in for index, task_in in enumerate(tasks) if index not in invalid]
+            if tasks:
+                if not await insert_task_batch(db, project_id, tasks, current_user):
+                    raise HTTPException(status_code=404, detail="Project not found")
+                report.created += len(tasks)
+                dashboard_cache.invalidate("tasks")
+            
+            report.failed += len(rejected)
+            room = settings.TASK_IMPORT_MAX_ERRORS - len(report.errors)
+            report.errors.extend(
+                TaskImportRowError(line=line, errors=errors) for line, errors in sorted(rejected)[:max(room, 0)]
+            )
+    except ImportFileError as exc:
+        report.aborted = str(exc)
+    return report
+
+
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(select(Task).where(Task.id == task_id))
@@ -219,6 +450,81 @@ async def get_task(
     return task
 
 
+def track_status_change(update_data: dict):
+    """Stamp started_at/completed_at when `update_data` moves a task to in progress/done, keeping the first time."""
+    if "status" in update_data:
+        if update_data["status"] == TaskStatus.IN_PROGRESS:
+            update_data["started_at"] = func.coalesce(Task.started_at, datetime.utcnow())
+        elif update_data["status"] == TaskStatus.DONE:
+            update_data["completed_at"] = func.coalesce(Task.completed_at, datetime.utcnow())
+
+
+# Registered ahead of /tasks/{task_id}, which would otherwise take "bulk" for an id
+@router.put("/tasks/bulk", response_model=List[TaskResponse])
+async def bulk_update_tasks(
+    bulk_in: TaskBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Update many tasks in one transaction, e.g. when planning a sprint. All
+    rows are written by a single UPDATE; tasks changing status go to the
+    bottom of their new column in request order. Returns the tasks in
+    request order.
+    """
+    patch_ids = [patch.id for patch in bulk_in.patches]
+    if len(set(patch_ids)) != len(patch_ids):
+        raise HTTPException(status_code=400, detail="A task can only have one patch")
+    changes = bulk_in.changes.model_dump(exclude_unset=True) if bulk_in.changes else {}
+    updates = {task_id: dict(changes) for task_id in bulk_in.ids}
+    for patch in bulk_in.patches:
+        updates.setdefault(patch.id, {}).update(patch.model_dump(exclude_unset=True, exclude={"id"}))
+    if not updates:
+        raise HTTPException(status_code=400, detail="No tasks to update")
+    if len(updates) > settings.TASK_BULK_UPDATE_MAX:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.TASK_BULK_UPDATE_MAX} tasks can be updated at once"
+        )
+    
+    # Locked in id order, so concurrent bulk updates cannot deadlock on each other
+    result = await db.execute(
+        select(Task.id, Task.project_id, Task.status)
+        .where(Task.id.in_(updates))
+        .order_by(Task.id)
+        .with_for_update()
+    )
+    old_rows = {row.id: row for row in result}
+    missing = [task_id for task_id in updates if task_id not in old_rows]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Tasks not found: {', '.join(map(str, missing))}")
+    
+    moved = {
+        task_id: values["status"]
+        for task_id, values in updates.items()
+        if "status" in values and values["status"] != old_rows[task_id].status
+    }
+    if moved:
+        ends = await last_ranks(db, {(old_rows[task_id].project_id, s) for task_id, s in moved.items()})
+        for task_id, new_status in moved.items():
+            column = (old_rows[task_id].project_id, new_status)
+            ends[column] = updates[task_id]["rank"] = rank_between(ends.get(column), None)
+    for values in updates.values():
+        track_status_change(values)
+    
+    tasks = await update_many_returning(db, Task, updates)
+    await apply_counter_changes(db, Task, [(old_rows[t.id], t) for t in tasks if "status" in updates[t.id]])
+    await record_activities(db, tasks, ActivityAction.UPDATED, current_user)
+    await db.commit()
+    dashboard_cache.invalidate("tasks")
+    for task in tasks:
+        publish_activity(task)
+        rank_rebalancer.check(task)
+    
+    by_id = {task.id: task for task in tasks}
+    return [by_id[task_id] for task_id in updates]
+
+
 @router.put("/tasks/{task_id}", response_model=TaskResponse)
 async def update_task(
     task_id: int,
@@ -226,25 +532,87 @@ async def update_task(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
+    update_data = task_in.model_dump(exclude_unset=True)
+    track_status_change(update_data)
+    
+    old = await lock_counted(db, Task, task_id, update_data)
+    if old is not None and "status" in update_data and old.status != update_data["status"]:
+        # A task changing column goes to the bottom of its new one
+        project_id = select(Task.project_id).where(Task.id == task_id).scalar_subquery()
+        update_data["rank"] = rank_between(await last_rank(db, project_id, update_data["status"]), None)
+    task = await update_returning(db, Task, task_id, update_data)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
+    if old is not None:
+        await apply_counters(db, Task, old, task)
     
-    update_data = task_in.model_dump(exclude_unset=True)
+    await record_activity(db, task, ActivityAction.UPDATED, current_user)
+    await db.commit()
+    dashboard_cache.invalidate("tasks")
+    publish_activity(task)
+    rank_rebalancer.check(task)
+    return task
+
+
+@router.put("/tasks/{task_id}/move", response_model=TaskResponse)
+async def move_task(
+    task_id: int,
+    move: TaskMove,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Drag and drop on the board: give the task a rank between its new
+    neighbours, so only its own row is written however long the column is.
+    """
+    neighbour_ids = [i for i in (move.before_id, move.after_id) if i is not None]
+    if task_id in neighbour_ids:
+        raise HTTPException(status_code=400, detail="A task cannot be its own neighbour")
+    result = await db.execute(
+        select(Task.id, Task.project_id, Task.status, Task.rank).where(Task.id.in_([task_id, *neighbour_ids]))
+    )
+    rows = {row.id: row for row in result}
+    if task_id not in rows:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if any(i not in rows for i in neighbour_ids):
+        raise HTTPException(status_code=404, detail="Neighbour task not found")
     
-    # Track status changes
-    if "status" in update_data:
-        if update_data["status"] == TaskStatus.IN_PROGRESS and not task.started_at:
-            task.started_at = datetime.utcnow()
-        elif update_data["status"] == TaskStatus.DONE and not task.completed_at:
-            task.completed_at = datetime.utcnow()
+    current = rows[task_id]
+    neighbours = [rows[i] for i in neighbour_ids]
+    target_status = move.status or (neighbours[0].status if neighbours else current.status)
+    if any(n.project_id != current.project_id or n.status != target_status for n in neighbours):
+        raise HTTPException(status_code=400, detail="Neighbours must be in the same project and column")
+    
+    before = rows[move.before_id].rank if move.before_id is not None else None
+    after = rows[move.after_id].rank if move.after_id is not None else None
+    if not neighbours:
+        before = await last_rank(db, current.project_id, target_status)
+    try:
+        rank = rank_between(before, after)
+    except ValueError:
+        # Neighbours share a rank (concurrent drops into one gap) or were reordered meanwhile
+        rank_rebalancer.schedule(current.project_id, target_status)
+        raise HTTPException(status_code=409, detail="The column was reordered; reload the board and retry")
     
-    for field, value in update_data.items():
-        setattr(task, field, value)
+    update_data = {"rank": rank}
+    if target_status != current.status:
+        update_data["status"] = target_status
+        track_status_change(update_data)
+    
+    old = await lock_counted(db, Task, task_id, update_data)
+    task = await update_returning(db, Task, task_id, update_data)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if old is not None:
+        await apply_counters(db, Task, old, task)
+    if "status" in update_data:
+        await record_activity(db, task, ActivityAction.UPDATED, current_user)
     
     await db.commit()
-    await db.refresh(task)
+    if "status" in update_data:
+        dashboard_cache.invalidate("tasks")
+        publish_activity(task)
+    rank_rebalancer.check(task)
     return task
 
 
@@ -254,20 +622,23 @@ async def delete_task(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Task).where(Task.id == task_id))
+    result = await db.execute(select(Task).where(Task.id == task_id).with_for_update())
     task = result.scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
+    await apply_counters(db, Task, task, None)
+    await record_activity(db, task, ActivityAction.DELETED, current_user)
     await db.delete(task)
     await db.commit()
+    dashboard_cache.invalidate("tasks")
 
 
 # Comments
 @router.get("/tasks/{task_id}/comments", response_model=List[CommentResponse])
 async def list_comments(
     task_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     result = await db.execute(
@@ -283,13 +654,11 @@ async def create_comment(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    comment = Comment(
-        task_id=task_id,
-        author_id=current_user.id,
-        content=comment_in.content,
-        parent_comment_id=comment_in.parent_comment_id
-    )
-    db.add(comment)
+    comment = await insert_returning(db, Comment, {
+        "task_id": task_id,
+        "author_id": current_user.id,
+        "content": comment_in.content,
+        "parent_comment_id": comment_in.parent_comment_id
+    })
     await db.commit()
-    await db.refresh(comment)
     return comment
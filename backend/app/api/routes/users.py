@@ -1,10 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, delete
 from typing import List
+from datetime import datetime, timezone
 
-from ...core import get_db, get_password_hash
-from ...models.user import User
+from ...core import get_db, get_read_db, get_password_hash_async
+from ...core.crud import insert_returning, update_returning
+from ...core.principal_cache import principal_cache
+from ...core.token_revocation import revocation_list
+from ...models.user import User, RefreshToken
 from ...schemas.user import UserCreate, UserUpdate, UserResponse
 from .auth import get_current_active_user
 
@@ -15,7 +19,7 @@ router = APIRouter()
 async def list_users(
     skip: int = 0,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """List all users"""
@@ -41,18 +45,19 @@ async def create_user(
             detail="User with this email or username already exists"
         )
     
-    user = User(
-        email=user_in.email,
-        username=user_in.username,
-        hashed_password=get_password_hash(user_in.password),
-        full_name=user_in.full_name,
-        role=user_in.role,
-        phone=user_in.phone
-    )
+    # End the read transaction so the pooled connection is free while bcrypt runs
+    await db.commit()
+    hashed_password = await get_password_hash_async(user_in.password)
     
-    db.add(user)
+    user = await insert_returning(db, User, {
+        "email": user_in.email,
+        "username": user_in.username,
+        "hashed_password": hashed_password,
+        "full_name": user_in.full_name,
+        "role": user_in.role,
+        "phone": user_in.phone
+    })
     await db.commit()
-    await db.refresh(user)
     
     return user
 
@@ -60,7 +65,7 @@ async def create_user(
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get user by ID"""
@@ -81,18 +86,26 @@ async def update_user(
     current_user: User = Depends(get_current_active_user)
 ):
     """Update user"""
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    update_data = user_in.model_dump(exclude_unset=True)
+    user = await update_returning(db, User, user_id, update_data)
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    update_data = user_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(user, field, value)
+    if update_data.get("is_active") is False:
+        # Deactivation also ends every session
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=datetime.now(timezone.utc))
+        )
     
     await db.commit()
-    await db.refresh(user)
+    # Role and is_active changes must reach authentication immediately
+    principal_cache.invalidate(user_id)
+    if "role" in update_data or "is_active" in update_data:
+        # Outstanding access tokens carry the old claims
+        revocation_list.revoke_user(user_id)
     
     return user
 
@@ -111,4 +124,7 @@ async def delete_user(
         raise HTTPException(status_code=404, detail="User not found")
     
     await db.delete(user)
+    await db.execute(delete(RefreshToken).where(RefreshToken.user_id == user_id))
     await db.commit()
+    principal_cache.invalidate(user_id)
+    revocation_list.revoke_user(user_id)
@@ -0,0 +1,167 @@
+"""
+LitERP command line.
+
+    python -m app.cli db upgrade [revision]   Apply migrations and seed the default admin
+    python -m app.cli db current               Show the database schema revision
+    python -m app.cli db stamp <revision>      Mark an existing database as being at a revision
+    python -m app.cli stats reconcile [--fix]  Recount dashboard counters and report (or repair) drift
+    python -m app.cli tasks rebalance-ranks    Rewrite board ranks of columns with over-long keys
+"""
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import func, select
+
+from .core import async_session_maker, get_password_hash
+from .core import migrations
+from .core.config import settings
+from .core.ranking import rebalance_column
+from .core.stats_counters import reconcile
+from .models.project import Task
+from .models.stats import StatsCounter
+from .models.user import User, UserRole
+
+
+async def seed_admin():
+    async with async_session_maker() as session:
+        result = await session.execute(select(User).where(User.username == "admin"))
+        if result.scalar_one_or_none():
+            return
+
+        admin_user = User(
+            email="admin@literp.com",
+            username="admin",
+            hashed_password=get_password_hash("admin123"),
+            full_name="System Administrator",
+            role=UserRole.ADMIN,
+            is_active=True,
+            is_superuser=True
+        )
+        session.add(admin_user)
+        await session.commit()
+        print("Created default admin user: admin / admin123")
+
+
+async def seed_stats_counters():
+    """Build the dashboard counters once, e.g. right after the migration that adds them."""
+    async with async_session_maker() as session:
+        result = await session.execute(select(StatsCounter).limit(1))
+        if result.scalar_one_or_none():
+            return
+        if await reconcile(session, fix=True):
+            print("Built dashboard stats counters")
+
+
+def db_upgrade(args):
+    if asyncio.run(migrations.is_unversioned_database()):
+        migrations.stamp(migrations.BASELINE_REVISION)
+        print(f"Existing database without a schema revision: stamped at {migrations.BASELINE_REVISION}")
+    migrations.upgrade(args.revision)
+    asyncio.run(seed_admin())
+    if asyncio.run(migrations.current_revision()) == migrations.head_revision():
+        asyncio.run(seed_stats_counters())
+
+
+def db_current(args):
+    current = asyncio.run(migrations.current_revision())
+    head = migrations.head_revision()
+    print(f"current: {current or 'none'}")
+    print(f"head:    {head}")
+
+
+def db_stamp(args):
+    migrations.stamp(args.revision)
+
+
+async def reconcile_stats(fix: bool) -> int:
+    async with async_session_maker() as session:
+        drift = await reconcile(session, fix=fix)
+    for bucket in drift:
+        print(
+            f"{bucket['metric']:<22} {bucket['bucket'] or '-':<24} "
+            f"count {bucket['stored_count']} -> {bucket['actual_count']}  "
+            f"total {bucket['stored_total']:.2f} -> {bucket['actual_total']:.2f}"
+        )
+    if not drift:
+        print("stats counters match")
+        return 0
+    print(f"{len(drift)} bucket(s) drifted" + (", repaired" if fix else "; rerun with --fix to repair"))
+    return 0 if fix else 1
+
+
+def stats_reconcile(args):
+    return asyncio.run(reconcile_stats(args.fix))
+
+
+async def rebalance_ranks(project_id, min_length: int) -> int:
+    async with async_session_maker() as session:
+        query = (
+            select(Task.project_id, Task.status)
+            .group_by(Task.project_id, Task.status)
+            .having(func.max(func.length(Task.rank)) > min_length)
+            .order_by(Task.project_id, Task.status)
+        )
+        if project_id is not None:
+            query = query.where(Task.project_id == project_id)
+        columns = (await session.execute(query)).all()
+    for column_project_id, status in columns:
+        async with async_session_maker() as session:
+            count = await rebalance_column(session, column_project_id, status)
+        print(f"project {column_project_id:<6} {status.value:<12} {count} task(s) reranked")
+    if not columns:
+        print(f"no column has ranks longer than {min_length}")
+    return 0
+
+
+def tasks_rebalance_ranks(args):
+    min_length = settings.TASK_RANK_REBALANCE_LENGTH if args.min_length is None else args.min_length
+    return asyncio.run(rebalance_ranks(args.project, min_length))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="literp")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    db_parser = commands.add_parser("db", help="Database schema management")
+    db_commands = db_parser.add_subparsers(dest="db_command", required=True)
+
+    upgrade_parser = db_commands.add_parser("upgrade", help="Apply migrations and seed initial data")
+    upgrade_parser.add_argument("revision", nargs="?", default="head")
+    upgrade_parser.set_defaults(func=db_upgrade)
+
+    current_parser = db_commands.add_parser("current", help="Show the schema revision")
+    current_parser.set_defaults(func=db_current)
+
+    stamp_parser = db_commands.add_parser("stamp", help="Record a revision without running migrations")
+    stamp_parser.add_argument("revision")
+    stamp_parser.set_defaults(func=db_stamp)
+
+    stats_parser = commands.add_parser("stats", help="Dashboard statistics maintenance")
+    stats_commands = stats_parser.add_subparsers(dest="stats_command", required=True)
+
+    reconcile_parser = stats_commands.add_parser(
+        "reconcile", help="Recount stats_counters from the source tables and report drift"
+    )
+    reconcile_parser.add_argument("--fix", action="store_true", help="Replace drifted counters with the recount")
+    reconcile_parser.set_defaults(func=stats_reconcile)
+
+    tasks_parser = commands.add_parser("tasks", help="Task maintenance")
+    tasks_commands = tasks_parser.add_subparsers(dest="tasks_command", required=True)
+
+    rebalance_parser = tasks_commands.add_parser(
+        "rebalance-ranks", help="Rewrite the board ranks of columns whose longest rank is too long"
+    )
+    rebalance_parser.add_argument("--project", type=int, help="Only this project's columns")
+    rebalance_parser.add_argument(
+        "--min-length", type=int,
+        help="Rebalance columns with a rank longer than this (default TASK_RANK_REBALANCE_LENGTH; 0 for all)"
+    )
+    rebalance_parser.set_defaults(func=tasks_rebalance_ranks)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
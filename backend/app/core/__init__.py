@@ -1,3 +1,6 @@
 from .config import settings
-from .database import Base, get_db, create_tables, async_session_maker
-from .security import verify_password, get_password_hash, create_access_token, decode_token
+from .database import Base, get_db, get_read_db, get_read_session_maker, async_session_maker
+from .security import (
+    verify_password, get_password_hash, verify_password_async, get_password_hash_async,
+    create_access_token, decode_token, create_refresh_token, hash_refresh_token
+)
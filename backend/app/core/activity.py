@@ -0,0 +1,104 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .pagination import decode_cursor, encode_cursor
+from ..models.activity import ActivityAction, ActivityEvent
+from ..models.user import User
+from ..models.project import Project, Task
+from ..models.crm import Lead, Deal
+from ..models.accounting import Invoice
+from ..models.equipment import EquipmentBooking
+from ..models.production import ProductionSchedule
+
+# model -> (module, entity_type, summary)
+ACTIVITY_SOURCES: Dict[type, Tuple[str, str, Callable[[Any], str]]] = {
+    Project: ("projects", "project", lambda p: f"{p.code} {p.name}"),
+    Task: ("projects", "task", lambda t: f"{t.task_key} {t.title}"),
+    Lead: ("crm", "lead", lambda l: l.title),
+    Deal: ("crm", "deal", lambda d: d.name),
+    Invoice: ("accounting", "invoice", lambda i: i.invoice_number),
+    EquipmentBooking: ("equipment", "booking", lambda b: f"Equipment {b.equipment_id} booking {b.id}"),
+    ProductionSchedule: ("production", "schedule", lambda s: s.title),
+}
+
+ACTIVITY_MODULES = sorted({module for module, _, _ in ACTIVITY_SOURCES.values()})
+
+
+def _activity_values(row, action: ActivityAction, actor: Optional[User]) -> Dict[str, Any]:
+    module, entity_type, summary = ACTIVITY_SOURCES[type(row)]
+    return {
+        "module": module,
+        "entity_type": entity_type,
+        "entity_id": row.id,
+        "action": action,
+        "actor_id": actor.id if actor is not None else None,
+        "summary": summary(row)[:255],
+    }
+
+
+async def record_activity(db: AsyncSession, row, action: ActivityAction, actor: Optional[User]):
+    """Append an activity event for `row` in the current transaction; call before commit."""
+    await db.execute(insert(ActivityEvent).values(_activity_values(row, action, actor)))
+
+
+async def record_activities(db: AsyncSession, rows: List[Any], action: ActivityAction, actor: Optional[User]):
+    """record_activity for many rows as one executemany insert."""
+    if rows:
+        await db.execute(insert(ActivityEvent), [_activity_values(row, action, actor) for row in rows])
+
+
+async def activity_feed(
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    module: Optional[str] = None,
+    actor_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    One page of events, newest first, and the cursor of the next page (None
+    on the last one). Pages continue from the (created_at, id) of the event
+    the cursor names, so each page is an index range scan however deep it is
+    and rows written meanwhile do not shift it.
+    """
+    query = (
+        select(ActivityEvent, User.username)
+        .outerjoin(User, User.id == ActivityEvent.actor_id)
+        .order_by(ActivityEvent.created_at.desc(), ActivityEvent.id.desc())
+        .limit(limit + 1)
+    )
+    if module is not None:
+        query = query.where(ActivityEvent.module == module)
+    if actor_id is not None:
+        query = query.where(ActivityEvent.actor_id == actor_id)
+    if cursor is not None:
+        # Compare stored values with stored values, so the timestamp never round-trips through the cursor
+        after = (
+            select(ActivityEvent.created_at, ActivityEvent.id)
+            .where(ActivityEvent.id == decode_cursor(cursor)[0])
+            .subquery()
+        )
+        query = query.where(
+            tuple_(ActivityEvent.created_at, ActivityEvent.id) < tuple_(after.c.created_at, after.c.id)
+        )
+
+    rows = (await db.execute(query)).all()
+    items: List[Dict[str, Any]] = [
+        {
+            "id": event.id,
+            "created_at": event.created_at,
+            "module": event.module,
+            "entity_type": event.entity_type,
+            "entity_id": event.entity_id,
+            "action": event.action.value,
+            "actor_id": event.actor_id,
+            "actor": username,
+            "summary": event.summary,
+        }
+        for event, username in rows[:limit]
+    ]
+    return {
+        "items": items,
+        "next_cursor": encode_cursor(items[-1]["id"]) if len(rows) > limit else None,
+    }
@@ -0,0 +1,54 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+ReadSection = Callable[[AsyncSession], Awaitable[Any]]
+
+
+async def gather_sections(
+    session_maker: async_sessionmaker,
+    sections: Dict[str, ReadSection],
+    timeout: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    fallback: Callable[[], Any] = lambda: None,
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Run independent read-only sections concurrently, each on its own session
+    (and so its own pooled connection), at most `max_concurrency` at a time.
+
+    Returns (results, errors). A section that raises or runs past `timeout`
+    seconds does not fail the others: its result is `fallback()`, so the
+    response keeps its shape, and errors maps its name to "timeout" or
+    "failed". The timeout starts once the section has a slot, so waiting
+    behind other sections never counts against it. Results keep the order
+    of `sections`.
+    """
+    timeout = settings.DB_SECTION_TIMEOUT if timeout is None else timeout
+    max_concurrency = max_concurrency or settings.DB_FANOUT_LIMIT
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    errors: Dict[str, str] = {}
+
+    async def run(section: ReadSection) -> Any:
+        async with session_maker() as session:
+            return await section(session)
+
+    async def guarded(name: str, section: ReadSection) -> Any:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(run(section), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Read section %r timed out after %.1f s", name, timeout)
+                errors[name] = "timeout"
+            except Exception:
+                logger.exception("Read section %r failed", name)
+                errors[name] = "failed"
+        return fallback()
+
+    results = await asyncio.gather(*(guarded(name, section) for name, section in sections.items()))
+    return dict(zip(sections, results)), {name: errors[name] for name in sections if name in errors}
@@ -10,10 +10,58 @@ class Settings(BaseSettings):
     # Security
     SECRET_KEY: str = "your-secret-key-change-in-production-min-32-chars"
     ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15  # Short-lived; role and active state ride in the token
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    TOKEN_CACHE_SIZE: int = 4096  # Verified access tokens memoised until exp; 0 disables
+    
+    # Login throttling (token buckets, checked before any DB lookup or bcrypt)
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_IP_RATE_PER_MINUTE: float = 20.0
+    LOGIN_IP_BURST: int = 10
+    LOGIN_USERNAME_RATE_PER_MINUTE: float = 5.0
+    LOGIN_USERNAME_BURST: int = 5
+    TRUSTED_PROXIES: list[str] = []  # Proxy IPs/CIDRs whose X-Forwarded-For names the client; others' is ignored
+    RATE_LIMIT_BACKEND: Optional[str] = None  # "module:factory" for a shared backend; in-process if unset
+    PASSWORD_HASH_WORKERS: int = 4  # Threads running bcrypt off the event loop
+    PASSWORD_HASH_QUEUE_LIMIT: int = 64  # Queued hashes beyond this are rejected with 503
+    PRINCIPAL_CACHE_SIZE: int = 1024  # Authenticated users kept in memory per worker; 0 disables
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0  # Upper bound on staleness across workers
+    
+    # Dashboard
+    DASHBOARD_CACHE_TTL_SECONDS: float = 300.0  # Ceiling for cached stats sections; writes invalidate sooner; 0 disables
+    DASHBOARD_STREAM_MAX_CONNECTIONS: int = 200  # Open /dashboard/stream connections per worker
+    DASHBOARD_STREAM_QUEUE_SIZE: int = 100  # Undelivered events per connection before it is told to resync
+    DASHBOARD_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    DASHBOARD_STREAM_DEBOUNCE_SECONDS: float = 0.5  # Writes within this window share one stats recompute
+    
+    # Projects
+    TASK_RANK_REBALANCE_LENGTH: int = 24  # Board ranks longer than this get their column rebalanced
+    TASK_BULK_UPDATE_MAX: int = 500  # Tasks per PUT /projects/tasks/bulk request
+    TASK_IMPORT_BATCH_SIZE: int = 1000  # Rows validated and inserted per transaction by task imports
+    TASK_IMPORT_MAX_ERRORS: int = 1000  # Failed rows listed in an import report; the rest are only counted
     
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./literp.db"
+    DATABASE_READ_URL: Optional[str] = None  # Read replica for GET endpoints
+    READ_YOUR_WRITES_SECONDS: int = 5  # Pin a client to the primary after it writes
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True
+    DB_FANOUT_LIMIT: int = 4  # Concurrent sessions one request may open for independent reads
+    DB_SECTION_TIMEOUT: float = 5.0  # Seconds before an independent read section is reported as timed out
+    SLOW_QUERY_MS: float = 200.0  # Log statements slower than this
+    QUERY_BUDGET_MODE: str = "off"  # off | warn | raise; enable in dev and tests
+    QUERY_REPEAT_THRESHOLD: int = 3  # Same statement this often in one request looks like N+1
+    
+    # SQLite profile (only applied to sqlite URLs)
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # Bytes
+    SQLITE_CACHE_SIZE: int = -64000  # Negative means KiB, i.e. ~64 MB
+    SQLITE_BUSY_TIMEOUT: int = 5000  # Milliseconds
+    SQLITE_SINGLE_WRITER: bool = True  # Funnel write transactions through one queue
     
     # CORS
     BACKEND_CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:5173"]
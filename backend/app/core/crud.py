@@ -0,0 +1,95 @@
+from typing import Any, Dict, List, Optional, Sequence, Type, TypeVar
+
+from sqlalchemy import case, insert, literal, select, update
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ModelT = TypeVar("ModelT")
+
+
+async def insert_returning(
+    db: AsyncSession,
+    model: Type[ModelT],
+    values: Dict[str, Any]
+) -> ModelT:
+    """
+    Insert one row with INSERT ... RETURNING and return it fully loaded,
+    including server defaults such as id and created_at, so no refresh() is needed.
+    """
+    result = await db.execute(insert(model).values(values).returning(model))
+    return result.scalar_one()
+
+
+async def update_returning(
+    db: AsyncSession,
+    model: Type[ModelT],
+    object_id: int,
+    values: Dict[Any, Any],
+    options: Sequence[Any] = ()
+) -> Optional[ModelT]:
+    """
+    Apply `values` to one row with a single UPDATE ... WHERE id = :id RETURNING
+    statement and return the updated object, or None if no row matched.
+
+    Values may be SQL expressions referencing the row's current columns, which
+    lets side effects such as "set started_at unless already set" happen in the
+    same statement. Loader `options` (e.g. selectinload) apply to the returned object.
+    """
+    if not values:
+        result = await db.execute(select(model).where(model.id == object_id).options(*options))
+        return result.scalar_one_or_none()
+
+    stmt = update(model).where(model.id == object_id).values(values).returning(model)
+    # from_statement + populate_existing refreshes an instance already in the session
+    result = await db.execute(
+        select(model).from_statement(stmt).options(*options).execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
+async def update_many_returning(
+    db: AsyncSession,
+    model: Type[ModelT],
+    values_by_id: Dict[int, Dict[str, Any]]
+) -> List[ModelT]:
+    """
+    Apply different `values` to several rows with a single UPDATE ... WHERE
+    id IN (...) RETURNING statement and return the updated objects, in no
+    particular order. A column set to one value on every row is assigned
+    directly; otherwise it gets a CASE on id that leaves the other rows as
+    they are. Values may be SQL expressions, as with update_returning.
+    """
+    ids = list(values_by_id)
+    columns: Dict[str, Dict[int, Any]] = {}
+    for object_id, values in values_by_id.items():
+        for key, value in values.items():
+            columns.setdefault(key, {})[object_id] = value
+
+    assignments = {}
+    for key, by_id in columns.items():
+        column = getattr(model, key)
+        first = next(iter(by_id.values()))
+        if len(by_id) == len(ids) and not isinstance(first, ClauseElement) and all(
+            not isinstance(value, ClauseElement) and value == first for value in by_id.values()
+        ):
+            assignments[key] = first
+        else:
+            # literal() binds Python values (enums, dates) with the column's type
+            assignments[key] = case(
+                {
+                    object_id: value if isinstance(value, ClauseElement) else literal(value, column.type)
+                    for object_id, value in by_id.items()
+                },
+                value=model.id,
+                else_=column
+            )
+
+    if not assignments:
+        result = await db.execute(select(model).where(model.id.in_(ids)))
+        return list(result.scalars().all())
+
+    stmt = update(model).where(model.id.in_(ids)).values(assignments).returning(model)
+    result = await db.execute(
+        select(model).from_statement(stmt).execution_options(populate_existing=True)
+    )
+    return list(result.scalars().all())
@@ -1,15 +1,149 @@
+import asyncio
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from .config import settings
+from .pool import InstrumentedAsyncPool
+from .query_stats import instrument_engine
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+
+def _is_sqlite(database_url: str) -> bool:
+    return make_url(database_url).get_backend_name() == "sqlite"
+
+
+def _engine_options(database_url: str) -> dict:
+    url = make_url(database_url)
+    # In-memory SQLite must keep the dialect's single shared connection
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncPool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT)}")
+    cursor.close()
+
+
+# Process-wide writer queue for SQLite. asyncio.Lock wakes waiters in FIFO order.
+_sqlite_writer = asyncio.Lock()
+
+
+class SQLiteWriterSession(AsyncSession):
+    """
+    Session that joins the single SQLite writer queue on its first write and
+    leaves it when the transaction ends. Sessions that only read never wait.
+    """
+
+    _holds_writer = False
+
+    def _has_pending_writes(self) -> bool:
+        return bool(self.new or self.dirty or self.deleted)
+
+    async def _acquire_writer(self):
+        if not self._holds_writer:
+            await _sqlite_writer.acquire()
+            self._holds_writer = True
+
+    def _release_writer(self):
+        if self._holds_writer:
+            self._holds_writer = False
+            _sqlite_writer.release()
+
+    def _writes(self, statement) -> bool:
+        # DML statements write directly, SELECT ... FOR UPDATE reads ahead of a write,
+        # anything else may autoflush pending changes
+        return (
+            getattr(statement, "is_dml", False)
+            or getattr(statement, "_for_update_arg", None) is not None
+            or self._has_pending_writes()
+        )
+
+    async def execute(self, statement, *args, **kwargs):
+        if self._writes(statement):
+            await self._acquire_writer()
+        return await super().execute(statement, *args, **kwargs)
+
+    async def scalar(self, statement, *args, **kwargs):
+        if self._writes(statement):
+            await self._acquire_writer()
+        return await super().scalar(statement, *args, **kwargs)
+
+    async def flush(self, objects=None):
+        if self._has_pending_writes():
+            await self._acquire_writer()
+        await super().flush(objects)
+
+    async def commit(self):
+        if self._has_pending_writes():
+            await self._acquire_writer()
+        try:
+            await super().commit()
+        finally:
+            self._release_writer()
+
+    async def rollback(self):
+        try:
+            await super().rollback()
+        finally:
+            self._release_writer()
+
+    async def close(self):
+        try:
+            await super().close()
+        finally:
+            self._release_writer()
+
+
+engine = create_async_engine(settings.DATABASE_URL, echo=False, **_engine_options(settings.DATABASE_URL))
+instrument_engine(engine)
+
+if _is_sqlite(settings.DATABASE_URL):
+    event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
 
 async_session_maker = async_sessionmaker(
-    engine, 
-    class_=AsyncSession, 
+    engine,
+    class_=(
+        SQLiteWriterSession
+        if _is_sqlite(settings.DATABASE_URL) and settings.SQLITE_SINGLE_WRITER
+        else AsyncSession
+    ),
     expire_on_commit=False
 )
 
+if settings.DATABASE_READ_URL:
+    read_engine = create_async_engine(
+        settings.DATABASE_READ_URL, echo=False, **_engine_options(settings.DATABASE_READ_URL)
+    )
+    instrument_engine(read_engine)
+    if _is_sqlite(settings.DATABASE_READ_URL):
+        event.listen(read_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    read_session_maker = async_sessionmaker(
+        read_engine,
+        class_=AsyncSession,
+        expire_on_commit=False
+    )
+else:
+    read_engine = engine
+    read_session_maker = async_session_maker
+
+# Set after a successful write so the client's next reads see its own changes
+PRIMARY_PIN_COOKIE = "literp_read_primary"
+PRIMARY_PIN_HEADER = "X-Read-Primary"
+
 
 class Base(DeclarativeBase):
     pass
@@ -23,6 +157,22 @@ async def get_db():
             await session.close()
 
 
-async def create_tables():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+def is_pinned_to_primary(request: Request) -> bool:
+    return (
+        request.cookies.get(PRIMARY_PIN_COOKIE) is not None
+        or request.headers.get(PRIMARY_PIN_HEADER) is not None
+    )
+
+
+def get_read_session_maker(request: Request) -> async_sessionmaker:
+    """Session factory for read-only handlers that open several sessions, e.g. to query concurrently."""
+    return async_session_maker if is_pinned_to_primary(request) else read_session_maker
+
+
+async def get_read_db(request: Request):
+    """Session for read-only handlers; uses the replica unless the client is pinned to the primary."""
+    async with get_read_session_maker(request)() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
@@ -0,0 +1,65 @@
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import DBAPIError
+
+from .database import engine
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# The revision matching the schema create_all built before migrations were introduced
+BASELINE_REVISION = "0001"
+
+
+class SchemaOutOfDateError(RuntimeError):
+    pass
+
+
+def alembic_config() -> Config:
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    return config
+
+
+def head_revision() -> Optional[str]:
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+async def is_unversioned_database() -> bool:
+    """True for a database created by create_all: it has tables but no alembic_version."""
+    async with engine.connect() as conn:
+        tables = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+    return "users" in tables and "alembic_version" not in tables
+
+
+def upgrade(revision: str = "head"):
+    command.upgrade(alembic_config(), revision)
+
+
+def stamp(revision: str):
+    command.stamp(alembic_config(), revision)
+
+
+async def current_revision() -> Optional[str]:
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+            return result.scalar_one_or_none()
+    except DBAPIError:
+        # alembic_version does not exist until the first upgrade
+        return None
+
+
+async def verify_schema_revision():
+    """Fail fast unless the database has been migrated to the revision this code expects."""
+    expected = head_revision()
+    current = await current_revision()
+    if current != expected:
+        raise SchemaOutOfDateError(
+            f"Database schema is at revision {current or 'none'}, expected {expected}. "
+            "Run `python -m app.cli db upgrade` before starting the server."
+        )
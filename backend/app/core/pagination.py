@@ -0,0 +1,26 @@
+import base64
+import binascii
+from typing import Tuple
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(*values: int) -> str:
+    """An opaque page cursor holding the sort key of the last row returned."""
+    text = ":".join(str(value) for value in values)
+    return base64.urlsafe_b64encode(text.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int = 1) -> Tuple[int, ...]:
+    """The `size` integers encode_cursor packed into `cursor`."""
+    try:
+        values = tuple(
+            int(part) for part in base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode().split(":")
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor("Invalid cursor")
+    if len(values) != size:
+        raise InvalidCursor("Invalid cursor")
+    return values
@@ -0,0 +1,73 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from .config import settings
+
+InvalidationListener = Callable[[int], Any]
+
+
+class PrincipalCache:
+    """
+    TTL + LRU cache of authenticated users' column values, keyed by user id.
+
+    Entries are plain dicts rather than ORM instances so a cached principal is
+    never shared between sessions. Each worker has its own cache; register an
+    invalidation listener to fan invalidations out to other workers, whose
+    receiving side should call invalidate(user_id, propagate=False).
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._listeners: List[InvalidationListener] = []
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, user_id: int, values: Dict[str, Any]):
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, values)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int, propagate: bool = True):
+        self._entries.pop(user_id, None)
+        if propagate:
+            for listener in self._listeners:
+                listener(user_id)
+
+    def clear(self):
+        self._entries.clear()
+
+    def add_invalidation_listener(self, listener: InvalidationListener):
+        """Call `listener(user_id)` whenever a principal is invalidated in this worker."""
+        self._listeners.append(listener)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,89 @@
+import asyncio
+from typing import Any, Dict, Set, Tuple
+
+from .config import settings
+
+Event = Tuple[str, Any]
+
+# Sent instead of the dropped events when a subscriber's queue overflowed
+RESYNC: Event = ("resync", {})
+
+
+class TooManySubscribers(RuntimeError):
+    """The per-worker subscriber cap is reached."""
+
+    def __init__(self):
+        super().__init__("Too many live connections, try again later")
+
+
+class Subscription:
+    """One subscriber's bounded queue of (event, data) pairs."""
+
+    def __init__(self, queue_size: int):
+        self._queue: "asyncio.Queue[Event]" = asyncio.Queue(maxsize=queue_size)
+        self._overflowed = False
+
+    def put(self, event: Event):
+        if self._overflowed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A slow reader loses its backlog and is told to refetch, instead of growing without bound
+            self._overflowed = True
+
+    async def get(self) -> Event:
+        if self._overflowed:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._overflowed = False
+            return RESYNC
+        return await self._queue.get()
+
+
+class PubSub:
+    """
+    In-process fan-out of events to subscribers. publish() never blocks: each
+    subscriber has its own bounded queue and overflow turns into a single
+    RESYNC event. Events reach subscribers of this worker only; forward them
+    from another worker's publisher to reach its subscribers.
+    """
+
+    def __init__(self, max_subscribers: int, queue_size: int):
+        self.max_subscribers = max_subscribers
+        self.queue_size = queue_size
+        self._subscribers: Set[Subscription] = set()
+        self.published = 0
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def subscribe(self) -> Subscription:
+        if len(self._subscribers) >= self.max_subscribers:
+            raise TooManySubscribers()
+        subscription = Subscription(self.queue_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscribers.discard(subscription)
+
+    def publish(self, event: str, data: Any):
+        self.published += 1
+        for subscription in self._subscribers:
+            subscription.put((event, data))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "subscribers": len(self._subscribers),
+            "max_subscribers": self.max_subscribers,
+            "queue_size": self.queue_size,
+            "published": self.published,
+        }
+
+
+dashboard_events = PubSub(
+    max_subscribers=settings.DASHBOARD_STREAM_MAX_CONNECTIONS,
+    queue_size=settings.DASHBOARD_STREAM_QUEUE_SIZE
+)
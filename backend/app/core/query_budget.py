@@ -0,0 +1,49 @@
+import logging
+from typing import Dict, List, Mapping
+
+from .config import settings
+from .query_stats import RequestQueries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """A request ran more statements than its route allows, or repeated one like an N+1 loop."""
+
+
+def repeated_statements(queries: RequestQueries, threshold: int) -> Dict[str, int]:
+    """Statements executed at least `threshold` times in one request."""
+    return {statement: count for statement, count in queries.shapes.items() if count >= threshold}
+
+
+def query_budget_problems(route: str, queries: RequestQueries, budgets: Mapping[str, int]) -> List[str]:
+    problems = []
+    # Batched routes (see count_batch) get their budget and repeat threshold once per batch
+    batches = max(queries.batches, 1)
+
+    budget = budgets.get(route)
+    if budget is None:
+        if queries.count:
+            problems.append(f"{route} ran {queries.count} queries but has no query budget")
+    elif queries.count > budget * batches:
+        per_batch = f" per batch, {batches} batches" if queries.batches else ""
+        problems.append(f"{route} ran {queries.count} queries, budget is {budget}{per_batch}")
+
+    for statement, count in repeated_statements(queries, settings.QUERY_REPEAT_THRESHOLD * batches).items():
+        problems.append(f"{route} ran the same statement {count} times (likely N+1): {statement}")
+
+    return problems
+
+
+def enforce_query_budget(route: str, queries: RequestQueries, budgets: Mapping[str, int]):
+    """Warn about or raise on budget violations, depending on QUERY_BUDGET_MODE."""
+    if settings.QUERY_BUDGET_MODE == "off":
+        return
+
+    problems = query_budget_problems(route, queries, budgets)
+    if not problems:
+        return
+    if settings.QUERY_BUDGET_MODE == "raise":
+        raise QueryBudgetExceeded("; ".join(problems))
+    for problem in problems:
+        logger.warning(problem)
@@ -0,0 +1,153 @@
+import logging
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Longest statement text kept for "slowest statement" reporting
+MAX_STATEMENT_CHARS = 500
+
+
+class RequestQueries:
+    """SQL statements executed while handling one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement: Optional[str] = None
+        # Parameterised statement text -> executions; repeats hint at N+1 loading
+        self.shapes: Counter = Counter()
+        # Batches processed by routes that work through their input in batches
+        self.batches = 0
+
+    def observe(self, statement: str, elapsed_ms: float):
+        self.count += 1
+        self.shapes[statement] += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_ms:.1f};desc="{self.count} queries"'
+
+
+class RouteStats:
+    """Per-route totals of query count, DB time and the slowest statement seen."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[str, Dict[str, Any]] = {}
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+    def record(self, route: str, queries: RequestQueries):
+        with self._lock:
+            stats = self._routes.setdefault(route, {
+                "requests": 0,
+                "queries": 0,
+                "db_time_ms": 0.0,
+                "max_queries": 0,
+                "slowest_ms": 0.0,
+                "slowest_statement": None,
+            })
+            stats["requests"] += 1
+            stats["queries"] += queries.count
+            stats["db_time_ms"] += queries.total_ms
+            stats["max_queries"] = max(stats["max_queries"], queries.count)
+            if queries.slowest_ms > stats["slowest_ms"]:
+                stats["slowest_ms"] = queries.slowest_ms
+                stats["slowest_statement"] = queries.slowest_statement
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            routes = sorted(self._routes.items(), key=lambda item: item[1]["db_time_ms"], reverse=True)
+            return {
+                route: {
+                    **stats,
+                    "db_time_ms": round(stats["db_time_ms"], 3),
+                    "avg_queries": round(stats["queries"] / stats["requests"], 2),
+                    "avg_db_time_ms": round(stats["db_time_ms"] / stats["requests"], 3),
+                    "slowest_ms": round(stats["slowest_ms"], 3),
+                }
+                for route, stats in routes
+            }
+
+
+route_stats = RouteStats()
+
+_current_queries: ContextVar[Optional[RequestQueries]] = ContextVar("current_queries", default=None)
+
+
+def start_request() -> RequestQueries:
+    """Begin collecting statements for the current request."""
+    queries = RequestQueries()
+    _current_queries.set(queries)
+    return queries
+
+
+def count_batch():
+    """
+    Mark the start of one batch in a route that processes its input in
+    batches; its query budget and repeat check then apply per batch.
+    """
+    queries = _current_queries.get()
+    if queries is not None:
+        queries.batches += 1
+
+
+def params_shape(parameters: Any, executemany: bool) -> str:
+    """Describe bound parameters by type only, so values never reach the log."""
+    def shape(params):
+        if isinstance(params, dict):
+            return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in params.items()) + "}"
+        if isinstance(params, (list, tuple)):
+            return "(" + ", ".join(type(value).__name__ for value in params) + ")"
+        return type(params).__name__
+
+    if executemany and parameters:
+        return f"{len(parameters)} x {shape(parameters[0])}"
+    return shape(parameters)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info["query_start"].pop()) * 1000
+    statement = statement[:MAX_STATEMENT_CHARS]
+
+    queries = _current_queries.get()
+    if queries is not None:
+        queries.observe(statement, elapsed_ms)
+
+    if elapsed_ms >= settings.SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query (%.1f ms) params=%s: %s",
+            elapsed_ms, params_shape(parameters, executemany), statement
+        )
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute does not fire for failed statements
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+
+def instrument_engine(engine):
+    """Time every statement run through `engine` and attribute it to the current request."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
@@ -0,0 +1,167 @@
+import asyncio
+import contextvars
+import logging
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import bindparam, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .config import settings
+from .database import async_session_maker
+from ..models.project import Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+# Ranks are base-36 fractions compared as plain strings ("i" sorts between
+# "h" and "j", "hz" between "h" and "i"). They never end in "0", so there is
+# always room before any rank.
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+_VALUE = {digit: value for value, digit in enumerate(DIGITS)}
+STEP_WIDTH = 6
+
+
+def _midpoint(low: str, high: Optional[str]) -> str:
+    """Shortest digit string strictly between fractions `low` and `high` (None = 1)."""
+    if high is not None:
+        common = 0
+        while common < len(high) and (low[common] if common < len(low) else "0") == high[common]:
+            common += 1
+        if common:
+            return high[:common] + _midpoint(low[common:], high[common:])
+    low_digit = _VALUE[low[0]] if low else 0
+    high_digit = _VALUE[high[0]] if high is not None else len(DIGITS)
+    if high_digit - low_digit > 1:
+        return DIGITS[(low_digit + high_digit) // 2]
+    if high is not None and len(high) > 1:
+        return high[0]
+    return DIGITS[low_digit] + _midpoint(low[1:], None)
+
+
+def _step(rank: str, delta: int) -> Optional[str]:
+    """`rank` moved by one unit in its last digit at STEP_WIDTH digits or more; None on over/underflow."""
+    digits = [_VALUE[digit] for digit in rank.ljust(max(len(rank), STEP_WIDTH), "0")]
+    index = len(digits) - 1
+    while index >= 0:
+        digits[index] += delta
+        if 0 <= digits[index] < len(DIGITS):
+            break
+        digits[index] %= len(DIGITS)
+        index -= 1
+    if index < 0:
+        return None
+    stepped = "".join(DIGITS[value] for value in digits).rstrip("0")
+    return stepped or None
+
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    A rank that sorts after `before` and before `after`; None stands for the
+    start or end of the column. Adding at either end takes the smallest step
+    at STEP_WIDTH digits rather than halving the gap to the end, so a column
+    can grow by about a billion appends before ranks get longer.
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"{before!r} does not sort before {after!r}")
+    if before and after is None:
+        return _step(before, 1) or _midpoint(before, None)
+    if after and before is None:
+        return _step(after, -1) or _midpoint("", after)
+    return _midpoint(before or "", after)
+
+
+def ranks_between(before: Optional[str], after: Optional[str], count: int) -> List[str]:
+    """`count` ascending ranks between `before` and `after`, evenly spread so they stay short."""
+    if count <= 0:
+        return []
+    middle = _midpoint(before or "", after)
+    half = count // 2
+    return ranks_between(before, middle, half) + [middle] + ranks_between(middle, after, count - half - 1)
+
+
+async def last_rank(db: AsyncSession, project_id, status: TaskStatus) -> Optional[str]:
+    """The highest rank in one board column; `project_id` may be a SQL expression."""
+    result = await db.execute(
+        select(Task.rank)
+        .where(Task.project_id == project_id, Task.status == status)
+        .order_by(Task.rank.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def last_ranks(
+    db: AsyncSession, columns: Iterable[Tuple[int, TaskStatus]]
+) -> Dict[Tuple[int, TaskStatus], str]:
+    """last_rank for several (project_id, status) columns in one query; empty columns are left out."""
+    result = await db.execute(
+        select(Task.project_id, Task.status, func.max(Task.rank))
+        .where(tuple_(Task.project_id, Task.status).in_(list(columns)))
+        .group_by(Task.project_id, Task.status)
+    )
+    return {(project_id, status): rank for project_id, status, rank in result}
+
+
+async def rebalance_column(db: AsyncSession, project_id: int, status: TaskStatus) -> int:
+    """Rewrite the ranks of one column as short, evenly spread keys, keeping the order. Commits."""
+    result = await db.execute(
+        select(Task.id)
+        .where(Task.project_id == project_id, Task.status == status)
+        .order_by(Task.rank, Task.id)
+        .with_for_update()
+    )
+    task_ids = result.scalars().all()
+    if task_ids:
+        # Core executemany on the table: an ORM bulk update would also bump updated_at
+        await db.execute(
+            update(Task.__table__).where(Task.__table__.c.id == bindparam("task_id")).values(rank=bindparam("new_rank")),
+            [
+                {"task_id": task_id, "new_rank": rank}
+                for task_id, rank in zip(task_ids, ranks_between(None, None, len(task_ids)))
+            ]
+        )
+    await db.commit()
+    return len(task_ids)
+
+
+class RankRebalancer:
+    """
+    Rebalances a column in the background once a write leaves a rank longer
+    than TASK_RANK_REBALANCE_LENGTH, e.g. after many drops into the same gap.
+    Each column is queued at most once at a time.
+    """
+
+    def __init__(self, max_length: int):
+        self.max_length = max_length
+        self._pending: Set[Tuple[int, TaskStatus]] = set()
+        self.rebalanced = 0
+
+    def check(self, task: Task):
+        """Call after commit with the written task."""
+        if task.rank is not None and len(task.rank) > self.max_length:
+            self.schedule(task.project_id, task.status)
+
+    def schedule(self, project_id: int, status: TaskStatus):
+        column = (project_id, status)
+        if column in self._pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._pending.add(column)
+        # A fresh context keeps the job's SQL out of the writing request's query stats
+        loop.create_task(self._rebalance(column), context=contextvars.Context())
+
+    async def _rebalance(self, column: Tuple[int, TaskStatus]):
+        try:
+            async with async_session_maker() as db:
+                count = await rebalance_column(db, *column)
+            self.rebalanced += 1
+            logger.info("Rebalanced %d task ranks in project %d, column %s", count, column[0], column[1].value)
+        except Exception:
+            logger.exception("Rebalancing task ranks failed for project %d, column %s", column[0], column[1].value)
+        finally:
+            self._pending.discard(column)
+
+
+rank_rebalancer = RankRebalancer(max_length=settings.TASK_RANK_REBALANCE_LENGTH)
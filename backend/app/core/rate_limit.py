@@ -0,0 +1,109 @@
+import importlib
+import ipaddress
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+from starlette.requests import Request
+
+from .config import settings
+
+
+class RateLimitExceeded(RuntimeError):
+    """A token bucket is empty; retry after `retry_after` seconds."""
+
+    def __init__(self, retry_after: float):
+        super().__init__("Too many login attempts, try again later")
+        self.retry_after = retry_after
+
+
+class TokenBucketBackend(ABC):
+    """
+    Storage for token buckets. Subclass and point RATE_LIMIT_BACKEND at a
+    factory to share buckets between workers (e.g. Redis with a Lua script);
+    take() must be atomic per key.
+    """
+
+    @abstractmethod
+    async def take(self, key: str, rate_per_second: float, burst: int) -> float:
+        """Take one token from `key`'s bucket. Return 0 if allowed, else seconds until a token is available."""
+
+
+class InMemoryTokenBucketBackend(TokenBucketBackend):
+    """Per-process buckets, least recently used evicted beyond `max_keys`."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, tuple]" = OrderedDict()
+
+    async def take(self, key: str, rate_per_second: float, burst: int) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (float(burst), now))
+        tokens = min(float(burst), tokens + (now - updated) * rate_per_second)
+
+        if tokens >= 1:
+            self._buckets[key] = (tokens - 1, now)
+            retry_after = 0.0
+        else:
+            self._buckets[key] = (tokens, now)
+            retry_after = (1 - tokens) / rate_per_second
+
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+def _load_backend(path: Optional[str]) -> TokenBucketBackend:
+    if not path:
+        return InMemoryTokenBucketBackend()
+    module_name, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module_name), attr)()
+
+
+def _is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in ipaddress.ip_network(proxy, strict=False) for proxy in settings.TRUSTED_PROXIES)
+
+
+def client_ip(request: Request) -> Optional[str]:
+    """
+    The address the request came from. X-Forwarded-For is read right to left
+    and each hop is believed only while the address that appended it is a
+    TRUSTED_PROXIES entry, so a client cannot pick its own bucket by sending
+    the header itself.
+    """
+    if request.client is None:
+        return None
+    address = request.client.host
+    hops = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+    while hops and _is_trusted_proxy(address):
+        address = hops.pop()
+    return address
+
+
+class LoginRateLimiter:
+    """Token buckets per client IP and per username, checked before any password work."""
+
+    def __init__(self, backend: TokenBucketBackend):
+        self.backend = backend
+
+    async def check(self, client_ip: Optional[str], username: str):
+        if not settings.LOGIN_RATE_LIMIT_ENABLED:
+            return
+        checks = [
+            (f"login:user:{username.strip().lower()}", settings.LOGIN_USERNAME_RATE_PER_MINUTE, settings.LOGIN_USERNAME_BURST),
+        ]
+        if client_ip:
+            checks.insert(0, (f"login:ip:{client_ip}", settings.LOGIN_IP_RATE_PER_MINUTE, settings.LOGIN_IP_BURST))
+        for key, per_minute, burst in checks:
+            retry_after = await self.backend.take(key, per_minute / 60, burst)
+            if retry_after > 0:
+                raise RateLimitExceeded(retry_after)
+
+
+login_rate_limiter = LoginRateLimiter(_load_backend(settings.RATE_LIMIT_BACKEND))
@@ -1,3 +1,10 @@
+import asyncio
+import hashlib
+import secrets
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
@@ -15,20 +22,110 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+class PasswordHasherBusy(RuntimeError):
+    """More password hashes are queued than PASSWORD_HASH_QUEUE_LIMIT allows."""
+
+
+# bcrypt releases the GIL, so a small thread pool keeps it off the event loop
+_password_pool = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+_password_jobs = 0
+
+
+async def _run_in_password_pool(func, *args):
+    global _password_jobs
+    if _password_jobs >= settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE_LIMIT:
+        raise PasswordHasherBusy("Too many password checks in progress")
+    _password_jobs += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_password_pool, func, *args)
+    finally:
+        _password_jobs -= 1
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the bounded password pool, for use in request handlers."""
+    return await _run_in_password_pool(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash on the bounded password pool, for use in request handlers."""
+    return await _run_in_password_pool(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+    # Fractional iat so per-user revocation cut-offs are exact
+    to_encode.update({"exp": expire, "iat": time.time(), "jti": uuid.uuid4().hex, "type": "access"})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
+class DecodedTokenCache:
+    """
+    Bounded LRU of verified token payloads keyed by the token's SHA-256, kept
+    until the token's own exp. Only successfully verified tokens are stored.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, digest: bytes) -> Optional[dict]:
+        payload = self._entries.get(digest)
+        if payload is None or payload["exp"] <= time.time():
+            if payload is not None:
+                del self._entries[digest]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return payload
+
+    def set(self, digest: bytes, payload: dict):
+        if self.max_size <= 0 or "exp" not in payload:
+            return
+        self._entries[digest] = payload
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+
+decoded_token_cache = DecodedTokenCache(max_size=settings.TOKEN_CACHE_SIZE)
+
+
 def decode_token(token: str) -> Optional[dict]:
+    digest = hashlib.sha256(token.encode()).digest()
+    payload = decoded_token_cache.get(digest)
+    if payload is not None:
+        # Copy so callers cannot alter the cached claims
+        return dict(payload)
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         return None
+    decoded_token_cache.set(digest, payload)
+    return dict(payload)
+
+
+def create_refresh_token() -> str:
+    """Opaque random refresh token; only its hash is stored server-side."""
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
@@ -0,0 +1,77 @@
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .config import settings
+
+InvalidationListener = Callable[[str], Any]
+
+
+class SectionCache:
+    """
+    Cache of computed dashboard sections, keyed by section name.
+
+    Write handlers call invalidate(section) after committing; ttl_seconds is
+    only a ceiling for writes that bypass the API. Each section carries a
+    generation number so a value computed while a write committed is not
+    stored over the invalidation. Per-worker like PrincipalCache: register a
+    listener to fan invalidations out, receivers call invalidate(section,
+    propagate=False).
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        # section -> (computed at, wall-clock seconds; value)
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._generations: Dict[str, int] = {}
+        self._listeners: List[InvalidationListener] = []
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, section: str) -> Optional[Tuple[float, Any]]:
+        """(computed_at, value) for a live entry, else None."""
+        entry = self._entries.get(section)
+        if entry is None or time.time() - entry[0] >= self.ttl_seconds:
+            self._entries.pop(section, None)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def generation(self, section: str) -> int:
+        return self._generations.get(section, 0)
+
+    def set(self, section: str, value: Any, generation: int, computed_at: float):
+        """Store `value` unless `section` was invalidated since `generation` was read."""
+        if self.ttl_seconds <= 0 or self.generation(section) != generation:
+            return
+        self._entries[section] = (computed_at, value)
+
+    def invalidate(self, section: str, propagate: bool = True):
+        self._generations[section] = self.generation(section) + 1
+        self._entries.pop(section, None)
+        if propagate:
+            for listener in self._listeners:
+                listener(section)
+
+    def clear(self):
+        for section in list(self._entries):
+            self.invalidate(section, propagate=False)
+
+    def add_invalidation_listener(self, listener: InvalidationListener):
+        """Call `listener(section)` whenever a section is invalidated in this worker."""
+        self._listeners.append(listener)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            "ttl_seconds": self.ttl_seconds,
+            "sections": {
+                section: round(now - computed_at, 3)
+                for section, (computed_at, _) in sorted(self._entries.items())
+            },
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+dashboard_cache = SectionCache(ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS)
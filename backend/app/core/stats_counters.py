@@ -0,0 +1,225 @@
+import datetime
+import enum
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Boolean, Date, Enum, delete, func, insert, literal, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.stats import StatsCounter
+from ..models.project import Project, Task
+from ..models.crm import Client, Lead, Deal
+from ..models.accounting import Invoice
+from ..models.equipment import Equipment
+from ..models.hr import Employee, LeaveRequest
+from ..models.production import ProductionSchedule
+
+CENT = Decimal("0.01")
+
+
+def _money(value: Any) -> Decimal:
+    return Decimal(str(value or 0)).quantize(CENT)
+
+
+def _encode(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
+def _decode(column, part: str) -> Any:
+    if part == "":
+        return None
+    if isinstance(column.type, Enum):
+        return column.type.enum_class[part]
+    if isinstance(column.type, Boolean):
+        return part == "1"
+    if isinstance(column.type, Date):
+        return datetime.date.fromisoformat(part)
+    return part
+
+
+class CounterSpec:
+    """Rows of one table counted per distinct value of `columns`, optionally summing `amount`."""
+
+    def __init__(self, metric: str, columns: Tuple, amount=None):
+        self.metric = metric
+        self.columns = columns
+        self.amount = amount
+        self.keys = {column.key for column in columns} | ({amount.key} if amount is not None else set())
+
+    def tracks(self, values: Dict[str, Any]) -> bool:
+        """Whether writing `values` can move a row to another bucket or change its amount."""
+        return not self.keys.isdisjoint(values)
+
+    def bucket(self, values: Iterable[Any]) -> str:
+        return "|".join(_encode(value) for value in values)
+
+    def parse(self, bucket: str) -> Tuple:
+        return tuple(_decode(column, part) for column, part in zip(self.columns, bucket.split("|")))
+
+    def row_bucket(self, row) -> str:
+        return self.bucket(getattr(row, column.key) for column in self.columns)
+
+    def row_amount(self, row) -> Decimal:
+        return _money(getattr(row, self.amount.key)) if self.amount is not None else Decimal(0)
+
+
+# Keep buckets coarse: the dashboard filters them in Python, so the table stays small
+COUNTERS: Dict[type, CounterSpec] = {
+    Project: CounterSpec("projects", (Project.status, Project.is_archived)),
+    Task: CounterSpec("tasks", (Task.status,)),
+    Client: CounterSpec("clients", (Client.is_active,)),
+    Lead: CounterSpec("leads", (Lead.status,)),
+    Deal: CounterSpec("deals", (Deal.stage,), amount=Deal.amount),
+    Invoice: CounterSpec("invoices", (Invoice.status,), amount=Invoice.balance_due),
+    Equipment: CounterSpec("equipment", (Equipment.is_active, Equipment.status)),
+    Employee: CounterSpec("employees", (Employee.is_active,)),
+    LeaveRequest: CounterSpec("leave_requests", (LeaveRequest.status,)),
+    # Date first, so "upcoming" is a bucket >= today range
+    ProductionSchedule: CounterSpec("production_schedules", (ProductionSchedule.date, ProductionSchedule.status)),
+}
+
+
+async def lock_counted(db: AsyncSession, model, row_id: int, values: Optional[Dict[str, Any]] = None):
+    """
+    The counted columns of row `row_id`, locked until commit, to pass as `old`
+    to apply_counters. None if the row does not exist or `values` (the update
+    about to be applied) changes none of them.
+    """
+    spec = COUNTERS[model]
+    if values is not None and not spec.tracks(values):
+        return None
+    columns = spec.columns + ((spec.amount,) if spec.amount is not None else ())
+    result = await db.execute(select(*columns).where(model.id == row_id).with_for_update())
+    return result.one_or_none()
+
+
+async def apply_counters(db: AsyncSession, model, old, new):
+    """
+    Move one row of `model` from `old`'s bucket to `new`'s in the current
+    transaction; pass old=None for an insert and new=None for a delete.
+    """
+    await apply_counter_changes(db, model, [(old, new)])
+
+
+async def apply_counter_changes(db: AsyncSession, model, changes: Iterable[Tuple[Any, Any]]):
+    """apply_counters for many (old, new) pairs of `model` rows, netted into one upsert."""
+    spec = COUNTERS[model]
+    deltas: Dict[str, List] = {}
+    for old, new in changes:
+        for row, sign in ((old, -1), (new, 1)):
+            if row is not None:
+                delta = deltas.setdefault(spec.row_bucket(row), [0, Decimal(0)])
+                delta[0] += sign
+                delta[1] += sign * spec.row_amount(row)
+
+    rows = [
+        {"metric": spec.metric, "bucket": bucket, "count": count, "total": total}
+        for bucket, (count, total) in sorted(deltas.items())
+        if count or total
+    ]
+    if not rows:
+        return
+
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(StatsCounter).values(rows)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[StatsCounter.metric, StatsCounter.bucket],
+            set_={
+                "count": StatsCounter.count + stmt.excluded.count,
+                "total": StatsCounter.total + stmt.excluded.total,
+            }
+        )
+    )
+
+
+class CounterSnapshot:
+    """Loaded counters with bucket values decoded back to their column types."""
+
+    def __init__(self, counters: Iterable[StatsCounter]):
+        specs = {spec.metric: spec for spec in COUNTERS.values()}
+        self._buckets: Dict[str, List[Tuple[Tuple, int, Decimal]]] = {}
+        for counter in counters:
+            spec = specs.get(counter.metric)
+            if spec is not None:
+                self._buckets.setdefault(counter.metric, []).append(
+                    (spec.parse(counter.bucket), counter.count, _money(counter.total))
+                )
+
+    def _matching(self, model, where: Optional[Callable[..., bool]]):
+        for values, count, total in self._buckets.get(COUNTERS[model].metric, []):
+            if where is None or where(*values):
+                yield count, total
+
+    def count(self, model, where: Optional[Callable[..., bool]] = None) -> int:
+        """Rows of `model` in buckets whose column values satisfy `where(*values)`."""
+        return sum(count for count, _ in self._matching(model, where))
+
+    def total(self, model, where: Optional[Callable[..., bool]] = None) -> float:
+        return float(sum((total for _, total in self._matching(model, where)), Decimal(0)))
+
+
+async def load_counters(db: AsyncSession, *criteria) -> CounterSnapshot:
+    result = await db.execute(select(StatsCounter).where(*criteria))
+    return CounterSnapshot(result.scalars().all())
+
+
+async def recount(db: AsyncSession) -> Dict[Tuple[str, str], Tuple[int, Decimal]]:
+    """Every counter recomputed from the counted tables with GROUP BY."""
+    counts = {}
+    for spec in COUNTERS.values():
+        amount = func.sum(spec.amount) if spec.amount is not None else literal(0)
+        result = await db.execute(
+            select(*spec.columns, func.count(), amount).group_by(*spec.columns)
+        )
+        for *values, count, total in result:
+            counts[(spec.metric, spec.bucket(values))] = (count, _money(total))
+    return counts
+
+
+async def reconcile(db: AsyncSession, fix: bool = False) -> List[Dict[str, Any]]:
+    """
+    Compare stats_counters with a full recount and return the buckets that
+    drifted. With fix=True the stored counters are replaced by the recount,
+    with writers to stats_counters held off until commit.
+    """
+    if fix and db.bind.dialect.name == "postgresql":
+        await db.execute(text("LOCK TABLE stats_counters IN EXCLUSIVE MODE"))
+
+    query = select(StatsCounter)
+    result = await db.execute(query.with_for_update() if fix else query)
+    stored = {(c.metric, c.bucket): (c.count, _money(c.total)) for c in result.scalars().all()}
+    actual = await recount(db)
+
+    drift = []
+    for key in sorted(stored.keys() | actual.keys()):
+        stored_count, stored_total = stored.get(key, (0, Decimal(0)))
+        actual_count, actual_total = actual.get(key, (0, Decimal(0)))
+        if stored_count != actual_count or stored_total != actual_total:
+            drift.append({
+                "metric": key[0],
+                "bucket": key[1],
+                "stored_count": stored_count,
+                "actual_count": actual_count,
+                "stored_total": float(stored_total),
+                "actual_total": float(actual_total),
+            })
+
+    if fix and drift:
+        await db.execute(delete(StatsCounter))
+        if actual:
+            await db.execute(insert(StatsCounter), [
+                {"metric": metric, "bucket": bucket, "count": count, "total": total}
+                for (metric, bucket), (count, total) in actual.items()
+            ])
+        await db.commit()
+    return drift
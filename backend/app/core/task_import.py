@@ -0,0 +1,134 @@
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+from ..schemas.project import TaskCreate
+
+# Longest line (CSV: record) accepted, so one runaway line cannot exhaust memory
+MAX_LINE_LENGTH = 1 << 20
+
+# (line number, column values) or (line number, why the line could not be read)
+ImportRow = Tuple[int, Union[Dict[str, Any], str]]
+
+
+class ImportFileError(ValueError):
+    """The upload cannot be read any further, e.g. it is not UTF-8."""
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream as UTF-8 text and yield it line by line, without line endings."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+            if len(pending) > MAX_LINE_LENGTH:
+                raise ImportFileError(f"A line is longer than {MAX_LINE_LENGTH} characters")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise ImportFileError("The file is not UTF-8 text")
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def read_csv(lines: AsyncIterator[str]) -> AsyncIterator[ImportRow]:
+    """
+    Rows of a CSV file with a header row, as {header: value}. A record
+    continues over line breaks inside quoted fields and is numbered by the
+    line it starts on.
+    """
+    header: Optional[List[str]] = None
+    record: List[str] = []
+    record_length = quotes = start = 0
+    number = 0
+    async for line in lines:
+        number += 1
+        if not record:
+            start = number
+        record.append(line)
+        record_length += len(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            if record_length > MAX_LINE_LENGTH:
+                raise ImportFileError(f"The record starting on line {start} has an unterminated quoted field")
+            continue
+
+        text = "\n".join(record)
+        record, record_length, quotes = [], 0, 0
+        if not text.strip():
+            continue
+        fields = next(csv.reader([text]))
+        if header is None:
+            header = [field.strip().lower() for field in fields]
+            continue
+        if len(fields) > len(header):
+            yield start, f"Has {len(fields)} fields, the header has {len(header)}"
+            continue
+        yield start, dict(zip(header, fields))
+
+    if record:
+        yield start, "Unterminated quoted field"
+
+
+async def read_ndjson(lines: AsyncIterator[str]) -> AsyncIterator[ImportRow]:
+    """Rows of a newline-delimited JSON file, one object per line."""
+    number = 0
+    async for line in lines:
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            values = json.loads(line)
+        except ValueError as exc:
+            yield number, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(values, dict):
+            yield number, "Expected a JSON object"
+            continue
+        yield number, values
+
+
+# Content type -> reader
+IMPORT_READERS: Dict[str, Callable[[AsyncIterator[str]], AsyncIterator[ImportRow]]] = {
+    "text/csv": read_csv,
+    "application/x-ndjson": read_ndjson,
+    "application/jsonl": read_ndjson,
+}
+
+
+async def batched(rows: AsyncIterator[ImportRow], size: int) -> AsyncIterator[List[ImportRow]]:
+    batch: List[ImportRow] = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def parse_task(values: Dict[str, Any], project_id: int, created_by_id: int) -> TaskCreate:
+    """
+    Validate one imported row as a task of `project_id`. Empty cells count as
+    missing, and created_by_id defaults to the importing user. Raises
+    ValidationError.
+    """
+    values = {key: value for key, value in values.items() if value not in ("", None)}
+    return TaskCreate.model_validate({
+        "created_by_id": created_by_id,
+        **values,
+        "project_id": project_id,
+    })
+
+
+def validation_messages(exc: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    ]
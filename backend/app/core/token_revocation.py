@@ -0,0 +1,61 @@
+import time
+from typing import Any, Callable, Dict, List
+
+from .config import settings
+
+RevocationListener = Callable[[str, Any], Any]
+
+
+class TokenRevocationList:
+    """
+    In-memory list of access tokens that must stop working before they expire.
+
+    Holds revoked token ids (jti) and per-user "issued before" cut-offs. Both
+    only need to outlive the longest access token, so entries are pruned once
+    ACCESS_TOKEN_EXPIRE_MINUTES has passed and the list stays small. Register a
+    listener to broadcast revocations to other workers; receivers replay them
+    with propagate=False.
+    """
+
+    def __init__(self):
+        self._tokens: Dict[str, float] = {}
+        self._users: Dict[int, float] = {}
+        self._listeners: List[RevocationListener] = []
+
+    def _prune(self):
+        now = time.time()
+        self._tokens = {jti: exp for jti, exp in self._tokens.items() if exp > now}
+        oldest_live = now - settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        self._users = {user_id: cutoff for user_id, cutoff in self._users.items() if cutoff > oldest_live}
+
+    def revoke_token(self, jti: str, expires_at: float, propagate: bool = True):
+        self._prune()
+        self._tokens[jti] = expires_at
+        if propagate:
+            for listener in self._listeners:
+                listener("token", (jti, expires_at))
+
+    def revoke_user(self, user_id: int, propagate: bool = True):
+        """Reject every access token issued to `user_id` before now."""
+        self._prune()
+        self._users[user_id] = time.time()
+        if propagate:
+            for listener in self._listeners:
+                listener("user", user_id)
+
+    def is_revoked(self, payload: Dict[str, Any]) -> bool:
+        if payload.get("jti") in self._tokens:
+            return True
+        cutoff = self._users.get(int(payload["sub"]))
+        return cutoff is not None and payload.get("iat", 0) < cutoff
+
+    def add_listener(self, listener: RevocationListener):
+        """Call `listener(kind, value)` for each revocation made in this worker."""
+        self._listeners.append(listener)
+
+    def stats(self) -> Dict[str, int]:
+        self._prune()
+        return {"revoked_tokens": len(self._tokens), "revoked_users": len(self._users)}
+
+
+revocation_list = TokenRevocationList()
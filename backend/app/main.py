@@ -1,36 +1,25 @@
-from fastapi import FastAPI
+import math
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from .core import settings, create_tables, get_password_hash, async_session_maker
+from .core import settings
+from .core.database import PRIMARY_PIN_COOKIE
+from .core.migrations import verify_schema_revision
+from .core.security import PasswordHasherBusy
+from .core.rate_limit import RateLimitExceeded
+from .core.pubsub import TooManySubscribers
+from .core.query_stats import route_stats, start_request
+from .core.query_budget import enforce_query_budget
 from .api.routes import api_router
-from .models.user import User, UserRole
+from .api.query_budgets import ROUTE_QUERY_BUDGETS
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: Create tables and seed initial data
-    await create_tables()
-    
-    # Create default admin user if not exists
-    async with async_session_maker() as session:
-        from sqlalchemy import select
-        result = await session.execute(select(User).where(User.username == "admin"))
-        admin = result.scalar_one_or_none()
-        
-        if not admin:
-            admin_user = User(
-                email="admin@literp.com",
-                username="admin",
-                hashed_password=get_password_hash("admin123"),
-                full_name="System Administrator",
-                role=UserRole.ADMIN,
-                is_active=True,
-                is_superuser=True
-            )
-            session.add(admin_user)
-            await session.commit()
-            print("Created default admin user: admin / admin123")
+    # Startup: schema is managed by `python -m app.cli db upgrade`; only check it is current
+    await verify_schema_revision()
     
     yield
     # Shutdown
@@ -55,6 +44,55 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"})
+
+
+@app.exception_handler(RateLimitExceeded)
+async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))}
+    )
+
+
+@app.exception_handler(TooManySubscribers)
+async def too_many_subscribers_handler(request: Request, exc: TooManySubscribers):
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "5"})
+
+
+# Attribute SQL statements and DB time to the matched route
+@app.middleware("http")
+async def time_sql_per_route(request: Request, call_next):
+    queries = start_request()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    if route is not None:
+        route_key = f"{request.method} {route.path}"
+        route_stats.record(route_key, queries)
+        enforce_query_budget(route_key, queries, ROUTE_QUERY_BUDGETS)
+    response.headers.append("Server-Timing", queries.server_timing())
+    return response
+
+
+# Read-your-writes: after a successful write, keep the client's reads on the primary
+if settings.DATABASE_READ_URL:
+    @app.middleware("http")
+    async def pin_writers_to_primary(request: Request, call_next):
+        response = await call_next(request)
+        if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                "1",
+                max_age=settings.READ_YOUR_WRITES_SECONDS,
+                httponly=True,
+                samesite="lax"
+            )
+        return response
+
 # Include API routes
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
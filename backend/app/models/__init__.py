@@ -1,8 +1,10 @@
 # Database Models
-from .user import User
+from .user import User, RefreshToken
 from .hr import Employee, Department, LeaveRequest, Attendance
 from .project import Project, Task, Sprint, Comment, TaskAttachment
 from .crm import Client, Contact, Lead, Deal, Interaction
 from .accounting import Invoice, InvoiceItem, Expense, Budget, PaymentRecord
 from .equipment import Equipment, EquipmentBooking, MaintenanceRecord
 from .production import ProductionSchedule, CrewAssignment, Location, ShootDay
+from .stats import StatsCounter
+from .activity import ActivityEvent
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text, Numeric, Date
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text, Numeric, Date, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -116,6 +116,13 @@ class Invoice(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_invoices_status_created", "status", "created_at"),
+        Index("ix_invoices_client_created", "client_id", "created_at"),
+        Index("ix_invoices_project_created", "project_id", "created_at"),
+        Index("ix_invoices_created_at", "created_at"),
+    )
+
     # Relationships
     client = relationship("Client", back_populates="invoices")
     project = relationship("Project", back_populates="invoices")
@@ -143,6 +150,10 @@ class InvoiceItem(Base):
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_invoice_items_invoice_id", "invoice_id"),
+    )
+
     # Relationships
     invoice = relationship("Invoice", back_populates="items")
 
@@ -193,6 +204,13 @@ class Expense(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_expenses_status_created", "status", "created_at"),
+        Index("ix_expenses_project_created", "project_id", "created_at"),
+        Index("ix_expenses_employee_created", "employee_id", "created_at"),
+        Index("ix_expenses_created_at", "created_at"),
+    )
+
     # Relationships
     project = relationship("Project", back_populates="expenses")
 
@@ -225,6 +243,10 @@ class Budget(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_budgets_project_id", "project_id"),
+    )
+
 
 class PaymentRecord(Base):
     __tablename__ = "payment_records"
@@ -244,5 +266,9 @@ class PaymentRecord(Base):
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_payment_records_invoice_id", "invoice_id"),
+    )
+
     # Relationships
     invoice = relationship("Invoice", back_populates="payments")
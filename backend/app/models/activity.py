@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Index
+from sqlalchemy.sql import func
+import enum
+from ..core.database import Base
+
+
+class ActivityAction(str, enum.Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    PAYMENT_RECORDED = "payment_recorded"
+
+
+class ActivityEvent(Base):
+    """
+    Append-only log of writes across modules, read newest first by the
+    dashboard activity feed. Rows are written by the handlers in the same
+    transaction as the change they describe (see core/activity.py) and never
+    updated. entity_id is not a foreign key so events outlive their rows.
+    """
+    __tablename__ = "activity_events"
+
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    module = Column(String(32), nullable=False)  # e.g. projects, crm
+    entity_type = Column(String(32), nullable=False)  # e.g. task, deal
+    entity_id = Column(Integer, nullable=False)
+    action = Column(Enum(ActivityAction), nullable=False)
+    actor_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    summary = Column(String(255), nullable=False)  # e.g. "PRJ-1-12 Color grade"
+
+    # Keyset pagination walks (created_at, id) backwards, optionally within one module or actor
+    __table_args__ = (
+        Index("ix_activity_events_created_id", "created_at", "id"),
+        Index("ix_activity_events_module_created_id", "module", "created_at", "id"),
+        Index("ix_activity_events_actor_created_id", "actor_id", "created_at", "id"),
+    )
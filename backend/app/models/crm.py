@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text, Numeric, Date
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text, Numeric, Date, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -99,6 +99,11 @@ class Client(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_clients_is_active", "is_active"),
+        Index("ix_clients_account_manager_id", "account_manager_id"),
+    )
+
     # Relationships
     contacts = relationship("Contact", back_populates="client")
     projects = relationship("Project", back_populates="client")
@@ -136,6 +141,10 @@ class Contact(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_contacts_active_client", "client_id", postgresql_where=(is_active == True), sqlite_where=(is_active == True)),
+    )
+
     # Relationships
     client = relationship("Client", back_populates="contacts")
     leads = relationship("Lead", back_populates="contact")
@@ -181,6 +190,12 @@ class Lead(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_leads_status", "status"),
+        Index("ix_leads_assigned_to_id", "assigned_to_id"),
+        Index("ix_leads_created_at", "created_at"),
+    )
+
     # Relationships
     contact = relationship("Contact", back_populates="leads")
 
@@ -223,6 +238,12 @@ class Deal(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_deals_stage_amount", "stage", "amount"),
+        Index("ix_deals_client_id", "client_id"),
+        Index("ix_deals_owner_id", "owner_id"),
+    )
+
     # Relationships
     client = relationship("Client", back_populates="deals")
 
@@ -255,5 +276,11 @@ class Interaction(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_interactions_client_created", "client_id", "created_at"),
+        Index("ix_interactions_deal_created", "deal_id", "created_at"),
+        Index("ix_interactions_created_at", "created_at"),
+    )
+
     # Relationships
     client = relationship("Client", back_populates="interactions")
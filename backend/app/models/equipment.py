@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text, Numeric, Date
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text, Numeric, Date, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -108,6 +108,12 @@ class Equipment(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        # list_equipment and dashboard only look at active equipment
+        Index("ix_equipment_active_status", "status", postgresql_where=(is_active == True), sqlite_where=(is_active == True)),
+        Index("ix_equipment_active_category", "category", postgresql_where=(is_active == True), sqlite_where=(is_active == True)),
+    )
+
     # Relationships
     bookings = relationship("EquipmentBooking", back_populates="equipment")
     maintenance_records = relationship("MaintenanceRecord", back_populates="equipment")
@@ -148,6 +154,14 @@ class EquipmentBooking(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        # Overlap check in create_booking and per-equipment listing
+        Index("ix_equipment_bookings_equipment_window", "equipment_id", "start_date", "end_date"),
+        Index("ix_equipment_bookings_status_start", "status", "start_date"),
+        Index("ix_equipment_bookings_project_start", "project_id", "start_date"),
+        Index("ix_equipment_bookings_start_date", "start_date"),
+    )
+
     # Relationships
     equipment = relationship("Equipment", back_populates="bookings")
 
@@ -186,5 +200,9 @@ class MaintenanceRecord(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_maintenance_records_equipment_created", "equipment_id", "created_at"),
+    )
+
     # Relationships
     equipment = relationship("Equipment", back_populates="maintenance_records")
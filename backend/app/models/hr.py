@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text, Numeric, Date
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text, Numeric, Date, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -84,6 +84,11 @@ class Employee(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_employees_department_id", "department_id"),
+        Index("ix_employees_is_active", "is_active"),
+    )
+
     # Relationships
     user = relationship("User", back_populates="employee")
     department = relationship("Department", back_populates="employees", foreign_keys=[department_id])
@@ -111,6 +116,11 @@ class LeaveRequest(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_leave_requests_status", "status"),
+        Index("ix_leave_requests_employee_id", "employee_id"),
+    )
+
     # Relationships
     employee = relationship("Employee", back_populates="leave_requests")
 
@@ -133,5 +143,9 @@ class Attendance(Base):
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_attendance_employee_date", "employee_id", "date"),
+    )
+
     # Relationships
     employee = relationship("Employee", back_populates="attendance_records")
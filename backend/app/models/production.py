@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text, Numeric, Date, Time
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text, Numeric, Date, Time, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -105,6 +105,12 @@ class ProductionSchedule(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_production_schedules_date_status", "date", "status"),
+        Index("ix_production_schedules_status_date", "status", "date"),
+        Index("ix_production_schedules_project_date", "project_id", "date"),
+    )
+
     # Relationships
     project = relationship("Project", back_populates="schedules")
     crew_assignments = relationship("CrewAssignment", back_populates="schedule")
@@ -142,6 +148,11 @@ class CrewAssignment(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_crew_assignments_schedule_id", "schedule_id"),
+        Index("ix_crew_assignments_employee_id", "employee_id"),
+    )
+
     # Relationships
     schedule = relationship("ProductionSchedule", back_populates="crew_assignments")
     employee = relationship("Employee", back_populates="crew_assignments")
@@ -204,6 +215,10 @@ class Location(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_locations_active_type", "location_type", postgresql_where=(is_active == True), sqlite_where=(is_active == True)),
+    )
+
     # Relationships
     schedules = relationship("ProductionSchedule", back_populates="location")
 
@@ -246,5 +261,9 @@ class ShootDay(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_shoot_days_schedule_date", "schedule_id", "date"),
+    )
+
     # Relationships
     schedule = relationship("ProductionSchedule", back_populates="shoot_days")
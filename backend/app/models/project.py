@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text, Numeric, Date
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text, Numeric, Date, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -94,9 +94,20 @@ class Project(Base):
     
     is_archived = Column(Boolean, default=False)
     
+    # Number for the next task key (<code>-<n>); incremented in the transaction that inserts the task
+    next_task_number = Column(Integer, nullable=False, default=1, server_default="1")
+    
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        # list_projects and dashboard only look at non-archived projects
+        Index("ix_projects_active_status", "status", postgresql_where=(is_archived == False), sqlite_where=(is_archived == False)),
+        Index("ix_projects_active_client", "client_id", postgresql_where=(is_archived == False), sqlite_where=(is_archived == False)),
+        Index("ix_projects_status", "status"),
+        Index("ix_projects_recent", "updated_at", "created_at"),
+    )
+
     # Relationships
     client = relationship("Client", back_populates="projects")
     tasks = relationship("Task", back_populates="project")
@@ -121,6 +132,10 @@ class Sprint(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_sprints_project_id", "project_id"),
+    )
+
     # Relationships
     project = relationship("Project", back_populates="sprints")
     tasks = relationship("Task", back_populates="sprint")
@@ -162,6 +177,7 @@ class Task(Base):
     
     # Kanban position
     position = Column(Integer, default=0)
+    rank = Column(String(64), nullable=False)  # Order within the board column; see core/ranking.py
     
     # Labels/Tags (JSON string)
     labels = Column(Text, nullable=True)
@@ -169,6 +185,21 @@ class Task(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_tasks_project_position", "project_id", "position"),
+        Index("ix_tasks_project_status_position", "project_id", "status", "position"),
+        Index("ix_tasks_project_status_rank", "project_id", "status", "rank"),
+        Index("ix_tasks_sprint_position", "sprint_id", "position"),
+        Index("ix_tasks_assignee_status_due", "assignee_id", "status", "due_date"),
+        # Keyset pages of /projects/tasks/all continue after a (position, id) pair
+        Index("ix_tasks_status_position_id", "status", "position", "id"),
+        Index("ix_tasks_position_id", "position", "id"),
+        Index("ix_tasks_assignee_position_id", "assignee_id", "position", "id"),
+        Index("ix_tasks_parent_task_id", "parent_task_id"),
+        Index("ix_tasks_created_by_id", "created_by_id"),
+        Index("ix_tasks_recent", "updated_at", "created_at"),
+    )
+
     # Relationships
     project = relationship("Project", back_populates="tasks")
     sprint = relationship("Sprint", back_populates="tasks")
@@ -193,6 +224,11 @@ class Comment(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_comments_task_created", "task_id", "created_at"),
+        Index("ix_comments_author_id", "author_id"),
+    )
+
     # Relationships
     task = relationship("Task", back_populates="comments")
     author = relationship("User", back_populates="comments")
@@ -212,5 +248,9 @@ class TaskAttachment(Base):
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_task_attachments_task_id", "task_id"),
+    )
+
     # Relationships
     task = relationship("Task", back_populates="attachments")
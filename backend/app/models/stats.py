@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, Numeric
+from ..core.database import Base
+
+
+class StatsCounter(Base):
+    """
+    Running row count (and optional summed amount) of one table per distinct
+    value of the columns it is bucketed by, e.g. tasks per status. Maintained
+    by the write handlers in the same transaction as the rows they count; see
+    core/stats_counters.py for the metrics and `app.cli stats reconcile`.
+    """
+    __tablename__ = "stats_counters"
+
+    metric = Column(String(64), primary_key=True)
+    bucket = Column(String(128), primary_key=True)  # Bucket column values joined by "|"
+    count = Column(Integer, nullable=False, default=0)
+    total = Column(Numeric(18, 2), nullable=False, default=0)
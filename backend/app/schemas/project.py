@@ -155,6 +155,7 @@ class TaskResponse(TaskBase):
     stage: Optional[str] = None
     scene_number: Optional[str] = None
     position: int
+    rank: str
     labels: Optional[str] = None
     created_at: datetime
 
@@ -162,6 +163,59 @@ class TaskResponse(TaskBase):
         from_attributes = True
 
 
+class TaskPage(BaseModel):
+    items: List[TaskResponse]
+    next_cursor: Optional[str] = None  # None on the last page
+
+
+class TaskMove(BaseModel):
+    """
+    Drop a task on the board between two neighbours of the target column;
+    omit both to append it. status defaults to the neighbours' column, then
+    to the task's own.
+    """
+    status: Optional[TaskStatus] = None
+    before_id: Optional[int] = None  # Task that ends up directly above
+    after_id: Optional[int] = None  # Task that ends up directly below
+
+
+class TaskPatch(TaskUpdate):
+    id: int
+
+
+class TaskBulkUpdate(BaseModel):
+    """
+    Apply `changes` to every task in `ids`, and each patch to its own task;
+    a patch overrides `changes` for a task listed in both.
+    """
+    ids: List[int] = []
+    changes: Optional[TaskUpdate] = None
+    patches: List[TaskPatch] = []
+
+
+class TaskImportRowError(BaseModel):
+    line: int  # Line of the file the row starts on
+    errors: List[str]
+
+
+class TaskImportResult(BaseModel):
+    created: int
+    failed: int
+    errors: List[TaskImportRowError]  # The first TASK_IMPORT_MAX_ERRORS failed rows
+    aborted: Optional[str] = None  # Why reading stopped before the end of the file
+
+
+class BoardColumn(BaseModel):
+    status: TaskStatus
+    count: int
+    tasks: List[TaskResponse]
+
+
+class BoardResponse(BaseModel):
+    project_id: int
+    columns: List[BoardColumn]
+
+
 class CommentBase(BaseModel):
     content: str
 
@@ -0,0 +1,213 @@
+"""
+Time the figures behind GET /dashboard/stats on a seeded database, computed
+three ways: one COUNT/SUM statement per figure, one conditional-aggregate
+statement per section (COUNT(*) FILTER (WHERE ...)), and the stats_counters
+snapshot the endpoint reads when its cache is cold.
+
+Usage (from backend/):
+    python scripts/bench_dashboard_stats.py                 # 300k tasks, 30 runs
+    python scripts/bench_dashboard_stats.py --tasks 1000000 --runs 50
+
+The other tables are seeded in proportion to --tasks. The first two
+strategies are the statements the endpoint used to run, kept here so the
+comparison stays reproducible.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def seed(path: str, tasks: int):
+    random.seed(1)
+    scale = tasks / 300_000
+    n = lambda count: max(int(count * scale), 10)
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO clients (name, code, is_active, client_type) VALUES (?, ?, ?, 'BRAND')",
+        [(f"c{i}", f"C{i}", i % 7 != 0) for i in range(n(5000))]
+    )
+    conn.executemany(
+        "INSERT INTO projects (name, code, is_archived, status, project_type) VALUES (?, ?, ?, ?, 'COMMERCIAL')",
+        [(f"p{i}", f"P{i}", i % 10 == 0, random.choice(["PLANNING", "PRODUCTION", "COMPLETED", "CANCELLED", "ON_HOLD"]))
+         for i in range(n(20000))]
+    )
+    conn.executemany(
+        "INSERT INTO tasks (project_id, task_key, title, status, priority, task_type, created_by_id, position, rank) "
+        "VALUES (?, ?, 't', ?, 'MEDIUM', 'TASK', 1, ?, ?)",
+        [(random.randint(1, n(20000)), f"K-{i}", random.choice(["BACKLOG", "TODO", "IN_PROGRESS", "IN_REVIEW", "DONE", "BLOCKED"]), i, f"{i:08d}")
+         for i in range(tasks)]
+    )
+    conn.executemany(
+        "INSERT INTO leads (title, status, source) VALUES ('l', ?, 'WEBSITE')",
+        [(random.choice(["NEW", "CONTACTED", "QUALIFIED", "LOST"]),) for _ in range(n(50000))]
+    )
+    conn.executemany(
+        "INSERT INTO deals (name, client_id, stage, amount) VALUES ('d', ?, ?, ?)",
+        [(random.randint(1, n(5000)), random.choice(["DISCOVERY", "PROPOSAL", "NEGOTIATION", "CLOSED_WON", "CLOSED_LOST"]), random.randint(100, 10000))
+         for _ in range(n(100000))]
+    )
+    conn.executemany(
+        "INSERT INTO invoices (invoice_number, client_id, issue_date, due_date, status, balance_due) VALUES (?, ?, '2026-01-01', '2026-02-01', ?, ?)",
+        [(f"I{i}", random.randint(1, n(5000)), random.choice(["DRAFT", "SENT", "VIEWED", "PARTIAL", "PAID", "OVERDUE", "CANCELLED"]), random.randint(1, 5000))
+         for i in range(n(100000))]
+    )
+    conn.executemany(
+        "INSERT INTO equipment (name, code, category, status, is_active) VALUES ('e', ?, 'CAMERA', ?, ?)",
+        [(f"E{i}", random.choice(["AVAILABLE", "IN_USE", "MAINTENANCE", "RETIRED"]), i % 9 != 0) for i in range(n(10000))]
+    )
+    employees = n(5000)
+    conn.executemany(
+        "INSERT INTO users (email, username, hashed_password, is_active) VALUES (?, ?, 'x', 1)",
+        [(f"u{i}@example.com", f"u{i}") for i in range(employees)]
+    )
+    conn.executemany(
+        "INSERT INTO employees (user_id, employee_code, job_title, hire_date, is_active) VALUES (?, ?, 'j', '2020-01-01', ?)",
+        [(i + 2, f"EMP{i}", i % 11 != 0) for i in range(employees)]
+    )
+    conn.executemany(
+        "INSERT INTO leave_requests (employee_id, leave_type, start_date, end_date, status, total_days) VALUES (?, 'ANNUAL', '2026-01-01', '2026-01-02', ?, 1)",
+        [(random.randint(1, employees), random.choice(["PENDING", "APPROVED", "REJECTED"])) for _ in range(n(50000))]
+    )
+    conn.executemany(
+        "INSERT INTO production_schedules (project_id, title, date, status, shoot_type) VALUES (?, 's', ?, ?, 'ON_LOCATION')",
+        [(random.randint(1, n(20000)), f"20{22 + i % 8}-{1 + i % 12:02d}-01", random.choice(["TENTATIVE", "CONFIRMED", "COMPLETED", "CANCELLED"]))
+         for i in range(n(100000))]
+    )
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+def strategies():
+    from sqlalchemy import func, select
+    from app.api.routes.dashboard import DASHBOARD_SECTIONS, load_dashboard_counters
+    from app.models.accounting import Invoice, InvoiceStatus
+    from app.models.crm import Client, Deal, DealStage, Lead, LeadStatus
+    from app.models.equipment import Equipment, EquipmentStatus
+    from app.models.hr import Employee, LeaveRequest, LeaveStatus
+    from app.models.production import ProductionSchedule, ScheduleStatus
+    from app.models.project import Project, ProjectStatus, Task, TaskStatus
+
+    active_project = (Project.is_archived == False, Project.status.notin_([ProjectStatus.COMPLETED, ProjectStatus.CANCELLED]))
+    open_deal = Deal.stage.notin_([DealStage.CLOSED_WON, DealStage.CLOSED_LOST])
+    pending_invoice = Invoice.status.in_([InvoiceStatus.SENT, InvoiceStatus.VIEWED, InvoiceStatus.PARTIAL])
+    upcoming_shoot = (
+        ProductionSchedule.date >= datetime.utcnow().date(),
+        ProductionSchedule.status.in_([ScheduleStatus.TENTATIVE, ScheduleStatus.CONFIRMED]),
+    )
+
+    per_metric = [
+        select(func.count(Project.id)).where(*active_project),
+        select(func.count(Project.id)).where(Project.status == ProjectStatus.COMPLETED),
+        select(func.count(Task.id)),
+        select(func.count(Task.id)).where(Task.status == TaskStatus.IN_PROGRESS),
+        select(func.count(Task.id)).where(Task.status == TaskStatus.DONE),
+        select(func.count(Client.id)).where(Client.is_active == True),
+        select(func.count(Lead.id)).where(Lead.status == LeadStatus.NEW),
+        select(func.count(Deal.id)).where(open_deal),
+        select(func.sum(Deal.amount)).where(open_deal),
+        select(func.count(Invoice.id)).where(pending_invoice),
+        select(func.sum(Invoice.balance_due)).where(pending_invoice),
+        select(func.count(Invoice.id)).where(Invoice.status == InvoiceStatus.OVERDUE),
+        select(func.count(Equipment.id)).where(Equipment.is_active == True, Equipment.status == EquipmentStatus.AVAILABLE),
+        select(func.count(Equipment.id)).where(Equipment.is_active == True, Equipment.status == EquipmentStatus.IN_USE),
+        select(func.count(Employee.id)).where(Employee.is_active == True),
+        select(func.count(LeaveRequest.id)).where(LeaveRequest.status == LeaveStatus.PENDING),
+        select(func.count(ProductionSchedule.id)).where(*upcoming_shoot),
+    ]
+    aggregate = [
+        select(func.count().filter(*active_project), func.count().filter(Project.status == ProjectStatus.COMPLETED)),
+        select(
+            func.count(),
+            func.count().filter(Task.status == TaskStatus.IN_PROGRESS),
+            func.count().filter(Task.status == TaskStatus.DONE)
+        ).select_from(Task),
+        select(
+            select(func.count()).select_from(Client).where(Client.is_active == True).scalar_subquery(),
+            select(func.count()).select_from(Lead).where(Lead.status == LeadStatus.NEW).scalar_subquery(),
+            func.count().filter(open_deal),
+            func.sum(Deal.amount).filter(open_deal)
+        ).select_from(Deal),
+        select(
+            func.count().filter(pending_invoice),
+            func.sum(Invoice.balance_due).filter(pending_invoice),
+            func.count().filter(Invoice.status == InvoiceStatus.OVERDUE)
+        ),
+        select(
+            func.count().filter(Equipment.status == EquipmentStatus.AVAILABLE),
+            func.count().filter(Equipment.status == EquipmentStatus.IN_USE)
+        ).where(Equipment.is_active == True),
+        select(
+            select(func.count()).select_from(Employee).where(Employee.is_active == True).scalar_subquery(),
+            select(func.count()).select_from(LeaveRequest).where(LeaveRequest.status == LeaveStatus.PENDING).scalar_subquery()
+        ),
+        select(func.count()).select_from(ProductionSchedule).where(*upcoming_shoot),
+    ]
+
+    def statements(queries):
+        async def compute(db):
+            for query in queries:
+                (await db.execute(query)).all()
+            return len(queries)
+        return compute
+
+    async def counters(db):
+        snapshot = await load_dashboard_counters(db)
+        for section in DASHBOARD_SECTIONS.values():
+            section(snapshot)
+        return 1
+
+    return {"per-metric": statements(per_metric), "aggregate": statements(aggregate), "counters": counters}
+
+
+async def run(runs: int):
+    from app.core.database import async_session_maker
+
+    for name, compute in strategies().items():
+        latencies = []
+        for _ in range(runs + 1):
+            async with async_session_maker() as db:
+                started = time.perf_counter()
+                queries = await compute(db)
+                latencies.append((time.perf_counter() - started) * 1000)
+        # The first run warms the page cache
+        latencies = sorted(latencies[1:])
+        p95 = latencies[max(-(-len(latencies) * 95 // 100) - 1, 0)]
+        print(f"{name:<10} {queries:2d} queries  p50 {statistics.median(latencies):8.2f} ms  p95 {p95:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=300_000, help="Tasks to seed; other tables scale with it")
+    parser.add_argument("--runs", type=int, default=30, help="Timed runs per strategy")
+    args = parser.parse_args()
+
+    path = tempfile.mktemp(suffix=".db")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{path}"
+    try:
+        subprocess.run([sys.executable, "-m", "app.cli", "db", "upgrade"], cwd=BACKEND_DIR, env=os.environ, check=True, capture_output=True)
+        seed(path, args.tasks)
+        subprocess.run(
+            [sys.executable, "-m", "app.cli", "stats", "reconcile", "--fix"],
+            cwd=BACKEND_DIR, env=os.environ, check=True, capture_output=True
+        )
+        sys.path.insert(0, BACKEND_DIR)
+        asyncio.run(run(args.runs))
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Latency of cheap requests (/health, /auth/me) while a burst of logins runs
+bcrypt, with bcrypt called inline on the event loop and on the bounded
+password pool (PASSWORD_HASH_WORKERS threads).
+
+Usage (from backend/):
+    python scripts/bench_password_hashing.py                # 16 concurrent logins
+    python scripts/bench_password_hashing.py --logins 64
+
+Requests go through the app in-process, so the numbers are handler time
+without network.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def summary(latencies: List[float]) -> str:
+    latencies = sorted(latencies)
+    p99 = latencies[max(-(-len(latencies) * 99 // 100) - 1, 0)]
+    return f"p50 {statistics.median(latencies):7.1f} ms  p99 {p99:7.1f} ms  max {latencies[-1]:7.1f} ms  (n={len(latencies)})"
+
+
+async def run(logins: int):
+    import httpx
+    from app.core import security
+    from app.main import app
+
+    pooled = security._run_in_password_pool
+
+    async def inline(func, *args):
+        return func(*args)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.post("/api/v1/auth/login/json", json={"username": "admin", "password": "admin123"})
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        for mode, runner in (("inline", inline), ("pool", pooled)):
+            security._run_in_password_pool = runner
+            latencies: Dict[str, List[float]] = {"/health": [], "/api/v1/auth/me": []}
+            done = asyncio.Event()
+
+            async def probe(path: str):
+                while not done.is_set():
+                    started = time.perf_counter()
+                    await client.get(path, headers=headers)
+                    latencies[path].append((time.perf_counter() - started) * 1000)
+                    await asyncio.sleep(0.005)
+
+            async def login() -> int:
+                response = await client.post("/api/v1/auth/login/json", json={"username": "admin", "password": "admin123"})
+                return response.status_code
+
+            probes = [asyncio.create_task(probe(path)) for path in latencies]
+            started = time.perf_counter()
+            statuses = await asyncio.gather(*(login() for _ in range(logins)))
+            elapsed = time.perf_counter() - started
+            done.set()
+            await asyncio.gather(*probes)
+
+            print(f"{mode}: {logins} logins in {elapsed * 1000:.0f} ms, statuses {sorted(set(statuses))}")
+            for path, values in latencies.items():
+                print(f"  {path:<16} {summary(values)}")
+        security._run_in_password_pool = pooled
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=16, help="Concurrent logins in the burst")
+    args = parser.parse_args()
+
+    path = tempfile.mktemp(suffix=".db")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{path}"
+    os.environ["LOGIN_RATE_LIMIT_ENABLED"] = "false"
+    os.environ["PASSWORD_HASH_QUEUE_LIMIT"] = str(max(args.logins, 64))
+    subprocess.run([sys.executable, "-m", "app.cli", "db", "upgrade"], cwd=BACKEND_DIR, env=os.environ, check=True, capture_output=True)
+    sys.path.insert(0, BACKEND_DIR)
+    try:
+        asyncio.run(run(args.logins))
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Concurrent commits and reads on a SQLite file database, with SQLite's
+defaults (rollback journal, synchronous=FULL, no writer queue) and with the
+app's profile (WAL, synchronous=NORMAL, mmap, larger cache, single-writer
+queue).
+
+Usage (from backend/):
+    python scripts/bench_sqlite_writes.py                   # 20 writers x 100 commits, 4 readers
+    python scripts/bench_sqlite_writes.py --writers 50 --commits 40
+
+Each profile runs in its own process on a fresh database, since the SQLite
+settings are read once at import.
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROFILES = {
+    "defaults": {
+        "SQLITE_JOURNAL_MODE": "DELETE",
+        "SQLITE_SYNCHRONOUS": "FULL",
+        "SQLITE_MMAP_SIZE": "0",
+        "SQLITE_CACHE_SIZE": "-2000",
+        "SQLITE_SINGLE_WRITER": "false",
+    },
+    "profile": {},
+}
+
+
+async def run(writers: int, commits: int, readers: int):
+    from sqlalchemy import func, select
+    from app.core.database import async_session_maker
+    from app.models.crm import Client
+
+    errors = []
+    committed = reads = 0
+    done = asyncio.Event()
+
+    async def writer(number: int):
+        nonlocal committed
+        for i in range(commits):
+            try:
+                async with async_session_maker() as db:
+                    db.add(Client(name="Bench", code=f"B{number}-{i}"))
+                    await db.commit()
+                committed += 1
+            except Exception as exc:
+                errors.append(type(exc).__name__)
+
+    async def reader():
+        nonlocal reads
+        while not done.is_set():
+            async with async_session_maker() as db:
+                await db.execute(select(func.count(Client.id)))
+            reads += 1
+
+    reader_tasks = [asyncio.create_task(reader()) for _ in range(readers)]
+    started = time.perf_counter()
+    await asyncio.gather(*(writer(number) for number in range(writers)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await asyncio.gather(*reader_tasks)
+
+    print(
+        f"{os.environ['BENCH_PROFILE']:<9} {committed} commits in {elapsed:.2f} s = {committed / elapsed:6.0f}/s, "
+        f"{reads / elapsed:6.0f} reads/s, {len(errors)} errors {sorted(set(errors)) if errors else ''}"
+    )
+
+
+def run_profile(name: str, args):
+    path = tempfile.mktemp(suffix=".db")
+    env = dict(os.environ, **PROFILES[name], DATABASE_URL=f"sqlite+aiosqlite:///{path}", BENCH_PROFILE=name)
+    try:
+        subprocess.run([sys.executable, "-m", "app.cli", "db", "upgrade"], cwd=BACKEND_DIR, env=env, check=True, capture_output=True)
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--run",
+             "--writers", str(args.writers), "--commits", str(args.commits), "--readers", str(args.readers)],
+            cwd=BACKEND_DIR, env=env, check=True
+        )
+    finally:
+        for suffix in ("", "-wal", "-shm", "-journal"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writers", type=int, default=20, help="Concurrent sessions committing one insert at a time")
+    parser.add_argument("--commits", type=int, default=100, help="Commits per writer")
+    parser.add_argument("--readers", type=int, default=4, help="Concurrent sessions reading while the writers run")
+    parser.add_argument("--profile", choices=[*PROFILES, "both"], default="both")
+    parser.add_argument("--run", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        sys.path.insert(0, BACKEND_DIR)
+        asyncio.run(run(args.writers, args.commits, args.readers))
+        return
+    for name in PROFILES if args.profile == "both" else [args.profile]:
+        run_profile(name, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Page through GET /api/v1/projects/tasks/all on a seeded SQLite database and
+report per-page latency by depth, for OFFSET paging (`skip`) and keyset
+paging (`cursor`).
+
+Usage (from backend/):
+    python scripts/bench_task_pages.py                      # 1M tasks, 100 per page
+    python scripts/bench_task_pages.py --tasks 200000 --db /tmp/tasks.db
+
+The database is created in a temporary file and removed afterwards, unless
+--db is given; an existing --db is reused as is. Requests go through the app
+in-process, so the numbers are handler plus SQL time without network.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATUSES = ["BACKLOG", "TODO", "IN_PROGRESS", "IN_REVIEW", "BLOCKED", "DONE"]
+
+
+def seed(path: str, tasks: int):
+    """A migrated database with `tasks` tasks over 1000 projects; positions repeat, as on real boards."""
+    env = dict(os.environ, DATABASE_URL=f"sqlite+aiosqlite:///{path}")
+    subprocess.run([sys.executable, "-m", "app.cli", "db", "upgrade"], cwd=BACKEND_DIR, env=env, check=True, capture_output=True)
+    random.seed(1)
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO projects (name, code, is_archived, status, project_type, next_task_number) VALUES (?, ?, 0, 'PLANNING', 'COMMERCIAL', 1)",
+        [(f"Project {i}", f"P{i}") for i in range(1000)]
+    )
+    for start in range(0, tasks, 50000):
+        conn.executemany(
+            "INSERT INTO tasks (project_id, task_key, title, status, priority, task_type, created_by_id, position, rank, logged_hours)"
+            " VALUES (?, ?, ?, ?, 'MEDIUM', 'TASK', 1, ?, 'i', 0)",
+            [
+                (random.randint(1, 1000), f"T-{i}", f"Task {i}", random.choice(STATUSES), random.randint(0, 999))
+                for i in range(start, min(start + 50000, tasks))
+            ]
+        )
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+def summary(latencies: List[float]) -> str:
+    latencies = sorted(latencies)
+    p95 = latencies[max(int(len(latencies) * 0.95) - 1, 0)]
+    return f"p50 {statistics.median(latencies):7.2f} ms  p95 {p95:7.2f} ms  (n={len(latencies)})"
+
+
+async def run(tasks: int, limit: int, offset_samples: int):
+    import httpx
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        response = await client.post("/api/v1/auth/login/json", json={"username": "admin", "password": "admin123"})
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        async def get(params: Dict) -> Dict:
+            response = await client.get("/api/v1/projects/tasks/all", params=params, headers=headers)
+            response.raise_for_status()
+            return response.json()
+
+        # Keyset: walk every page, bucketing latency by how deep the page is
+        buckets: List[List[float]] = [[] for _ in range(10)]
+        seen = 0
+        cursor = ""
+        while cursor is not None:
+            started = time.perf_counter()
+            page = await get({"limit": limit, "cursor": cursor})
+            buckets[min(seen * 10 // tasks, 9)].append((time.perf_counter() - started) * 1000)
+            seen += len(page["items"])
+            cursor = page["next_cursor"]
+        print(f"cursor: paged through {seen} of {tasks} tasks, {limit} per page")
+        for decile, latencies in enumerate(buckets):
+            if latencies:
+                print(f"  depth {decile * 10:3d}-{decile * 10 + 10:3d}%  {summary(latencies)}")
+
+        # OFFSET: a few pages at the start of each decile
+        print(f"skip: {offset_samples} pages at each depth")
+        for decile in range(10):
+            skip = tasks * decile // 10
+            latencies = []
+            for _ in range(offset_samples):
+                started = time.perf_counter()
+                await get({"limit": limit, "skip": skip})
+                latencies.append((time.perf_counter() - started) * 1000)
+            print(f"  skip {skip:>9d}       {summary(latencies)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=100, help="Tasks per page")
+    parser.add_argument("--offset-samples", type=int, default=5, help="OFFSET pages timed at each depth")
+    parser.add_argument("--db", help="SQLite file to use; seeded if it does not exist")
+    args = parser.parse_args()
+
+    path = args.db or tempfile.mktemp(suffix=".db")
+    if not os.path.exists(path):
+        started = time.perf_counter()
+        seed(path, args.tasks)
+        print(f"seeded {args.tasks} tasks in {time.perf_counter() - started:.0f} s")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{path}"
+    os.environ.setdefault("LOGIN_RATE_LIMIT_ENABLED", "false")
+    sys.path.insert(0, BACKEND_DIR)
+    try:
+        asyncio.run(run(args.tasks, args.limit, args.offset_samples))
+    finally:
+        if not args.db:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
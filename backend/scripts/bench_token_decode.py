@@ -0,0 +1,76 @@
+"""
+Per-request auth overhead, get_token_payload then get_current_active_user,
+with the decoded-token cache off (TOKEN_CACHE_SIZE=0) and at its default
+size.
+
+Usage (from backend/):
+    python scripts/bench_token_decode.py                    # 20000 requests from 50 users
+    python scripts/bench_token_decode.py --requests 100000 --users 500
+
+Each profile runs in its own process, since the cache size is read once at
+import. The dependencies are awaited directly, so the numbers leave out
+routing and the database.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROFILES = {
+    "no-cache": {"TOKEN_CACHE_SIZE": "0"},
+    "cache": {},
+}
+
+
+async def run(requests: int, users: int):
+    from app.api.routes.auth import get_current_active_user, get_token_payload
+    from app.core import create_access_token
+    from app.core.security import decoded_token_cache
+
+    tokens = [
+        create_access_token({"sub": str(user_id), "username": f"u{user_id}", "role": "employee", "active": True, "su": False})
+        for user_id in range(1, users + 1)
+    ]
+
+    samples = []
+    for _ in range(5):
+        started = time.perf_counter()
+        for i in range(requests):
+            payload = await get_token_payload(tokens[i % users])
+            await get_current_active_user(payload)
+        samples.append((time.perf_counter() - started) / requests * 1e6)
+
+    print(f"{os.environ['BENCH_PROFILE']:<9} {statistics.median(samples):6.1f} us/request  {decoded_token_cache.stats()}")
+
+
+def run_profile(name: str, args):
+    env = dict(os.environ, **PROFILES[name], BENCH_PROFILE=name)
+    subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--run", "--requests", str(args.requests), "--users", str(args.users)],
+        cwd=BACKEND_DIR, env=env, check=True
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000, help="Authenticated requests per round")
+    parser.add_argument("--users", type=int, default=50, help="Distinct access tokens the requests cycle through")
+    parser.add_argument("--profile", choices=[*PROFILES, "both"], default="both")
+    parser.add_argument("--run", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        sys.path.insert(0, BACKEND_DIR)
+        asyncio.run(run(args.requests, args.users))
+        return
+    for name in PROFILES if args.profile == "both" else [args.profile]:
+        run_profile(name, args)
+
+
+if __name__ == "__main__":
+    main()
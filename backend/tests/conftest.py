@@ -0,0 +1,56 @@
+"""
+The suite runs against a throwaway SQLite database built by `db upgrade`,
+with QUERY_BUDGET_MODE=raise: a request over its route's query budget fails
+the test that made it.
+"""
+import os
+import shutil
+import tempfile
+
+_database_dir = tempfile.mkdtemp(prefix="literp-tests-")
+DATABASE_PATH = os.path.join(_database_dir, "literp.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DATABASE_PATH}"
+os.environ.pop("DATABASE_READ_URL", None)
+os.environ["QUERY_BUDGET_MODE"] = "raise"
+os.environ["LOGIN_RATE_LIMIT_ENABLED"] = "false"
+
+import httpx
+import pytest
+import pytest_asyncio
+from pytest_asyncio import is_async_test
+
+from app.cli import seed_admin
+from app.core import migrations
+from app.main import app
+
+API = "/api/v1"
+
+
+def pytest_collection_modifyitems(items):
+    # One event loop for the run: pooled connections and module-level locks outlive a test
+    session_loop = pytest.mark.asyncio(scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    migrations.upgrade()
+    yield DATABASE_PATH
+    shutil.rmtree(_database_dir, ignore_errors=True)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client(database):
+    await seed_admin()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def admin_headers(client):
+    response = await client.post(f"{API}/auth/login/json", json={"username": "admin", "password": "admin123"})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
@@ -0,0 +1,58 @@
+"""
+gather_sections keeps every section's result in shape when one fails or
+times out, and only times a section from when it gets a slot.
+"""
+import asyncio
+import contextlib
+
+from app.core.concurrent_reads import gather_sections
+from app.core.config import settings
+
+API = settings.API_V1_STR
+
+
+@contextlib.asynccontextmanager
+async def no_session():
+    yield None
+
+
+async def test_failed_and_slow_sections_fall_back_and_are_reported():
+    async def ok(db):
+        return [1]
+
+    async def broken(db):
+        raise RuntimeError("boom")
+
+    async def slow(db):
+        await asyncio.sleep(1)
+        return [2]
+
+    results, errors = await gather_sections(
+        no_session, {"ok": ok, "broken": broken, "slow": slow}, timeout=0.1, fallback=list
+    )
+    assert results == {"ok": [1], "broken": [], "slow": []}
+    assert errors == {"broken": "failed", "slow": "timeout"}
+
+
+async def test_waiting_for_a_slot_does_not_count_against_the_timeout():
+    async def section(db):
+        await asyncio.sleep(0.15)
+        return ["done"]
+
+    # One slot: the third section waits 0.3 s for it, longer than its 0.25 s timeout
+    results, errors = await gather_sections(
+        no_session, {"a": section, "b": section, "c": section}, timeout=0.25, max_concurrency=1, fallback=list
+    )
+    assert errors == {}
+    assert results == {"a": ["done"], "b": ["done"], "c": ["done"]}
+
+
+async def test_recent_activity_honours_limit(client, admin_headers):
+    for number in range(3):
+        await client.post(f"{API}/crm/leads", json={"title": f"Recent {number}"}, headers=admin_headers)
+
+    response = await client.get(f"{API}/dashboard/recent-activity", params={"limit": 2}, headers=admin_headers)
+    body = response.json()
+    assert body["errors"] == {}
+    assert len(body["recent_leads"]) == 2
+    assert all(isinstance(body[feed], list) for feed in ("recent_projects", "recent_tasks", "recent_leads"))
@@ -0,0 +1,106 @@
+"""
+Create endpoints write their row with one INSERT ... RETURNING and build
+the response from it, with no SELECT to reload the row after the commit.
+Reads before the insert (duplicate checks, the next board rank) are fine.
+"""
+import re
+import uuid
+from typing import List
+
+import pytest
+
+import app.main
+from app.core.config import settings
+from app.core.query_stats import RequestQueries, start_request
+
+API = settings.API_V1_STR
+
+
+@pytest.fixture
+def request_queries(monkeypatch) -> List[RequestQueries]:
+    """The query_stats collector of every request made during the test."""
+    collected: List[RequestQueries] = []
+
+    def collecting_start_request():
+        queries = start_request()
+        collected.append(queries)
+        return queries
+
+    monkeypatch.setattr(app.main, "start_request", collecting_start_request)
+    return collected
+
+
+def statements_on(queries: RequestQueries, table: str) -> List[str]:
+    """Statements that read or write `table`, in the order they first ran."""
+    touches = re.compile(rf"\b(?:FROM|INTO|UPDATE|JOIN)\s+{table}\b", re.IGNORECASE)
+    return [statement for statement, count in queries.shapes.items() for _ in range(count) if touches.search(statement)]
+
+
+@pytest.fixture(scope="module")
+async def parents(client, admin_headers):
+    """One of each row the created rows point at."""
+    suffix = uuid.uuid4().hex[:6]
+
+    async def create(path, body):
+        response = await client.post(API + path, json=body, headers=admin_headers)
+        assert response.status_code < 300, response.text
+        return response.json()["id"]
+
+    users = [
+        await create("/users/", {"email": f"{name}{suffix}@example.com", "username": f"{name}{suffix}", "password": "pw"})
+        for name in ("staff", "hire")
+    ]
+    project = await create("/projects/", {"name": "Returning", "code": f"RP{suffix}"})
+    client_id = await create("/crm/clients", {"name": "Returning", "code": f"RC{suffix}"})
+    employee = await create("/hr/employees", {"employee_code": f"RE{suffix}", "job_title": "Crew", "hire_date": "2026-01-01", "user_id": users[0]})
+    equipment = await create("/equipment/", {"name": "Cam", "code": f"RQ{suffix}", "category": "camera"})
+    schedule = await create("/production/schedules", {"title": "Shoot", "date": "2026-01-01", "project_id": project})
+    task = await create("/projects/tasks", {"title": "Task", "project_id": project, "created_by_id": 1})
+    return {
+        "suffix": suffix, "hire": users[1], "project": project, "client": client_id, "employee": employee,
+        "equipment": equipment, "schedule": schedule, "task": task,
+    }
+
+
+CREATES = [
+    ("/users/", "users", lambda p: {"email": f"r{p['suffix']}@example.com", "username": f"r{p['suffix']}", "password": "pw"}),
+    ("/hr/departments", "departments", lambda p: {"name": "Returning", "code": f"RD{p['suffix']}"}),
+    ("/hr/employees", "employees", lambda p: {"employee_code": f"RF{p['suffix']}", "job_title": "Crew", "hire_date": "2026-01-01", "user_id": p["hire"]}),
+    ("/hr/leave-requests", "leave_requests", lambda p: {"employee_id": p["employee"], "leave_type": "annual", "start_date": "2026-01-01", "end_date": "2026-01-02"}),
+    ("/hr/attendance", "attendance", lambda p: {"employee_id": p["employee"], "date": "2026-01-01"}),
+    ("/projects/", "projects", lambda p: {"name": "Returning", "code": f"RS{p['suffix']}"}),
+    ("/projects/sprints", "sprints", lambda p: {"name": "Sprint", "start_date": "2026-01-01", "end_date": "2026-01-10", "project_id": p["project"]}),
+    ("/projects/tasks", "tasks", lambda p: {"title": "Task", "project_id": p["project"], "created_by_id": 1}),
+    ("/projects/tasks/{task}/comments", "comments", lambda p: {"content": "c", "task_id": p["task"], "author_id": 1}),
+    ("/crm/clients", "clients", lambda p: {"name": "Returning", "code": f"RT{p['suffix']}"}),
+    ("/crm/contacts", "contacts", lambda p: {"first_name": "A", "last_name": "B", "client_id": p["client"]}),
+    ("/crm/leads", "leads", lambda p: {"title": "Lead"}),
+    ("/crm/deals", "deals", lambda p: {"name": "Deal", "client_id": p["client"], "amount": 100}),
+    ("/crm/interactions", "interactions", lambda p: {"interaction_type": "call", "subject": "s", "created_by_id": 1, "client_id": p["client"]}),
+    ("/accounting/invoices", "invoices", lambda p: {
+        "invoice_number": f"RI{p['suffix']}", "client_id": p["client"], "issue_date": "2026-01-01", "due_date": "2026-02-01",
+        "items": [{"description": "x", "quantity": 1, "unit_price": 10}, {"description": "y", "quantity": 2, "unit_price": 5}],
+    }),
+    ("/accounting/expenses", "expenses", lambda p: {"category": "crew", "description": "x", "amount": 3, "expense_date": "2026-01-01"}),
+    ("/accounting/budgets", "budgets", lambda p: {"category": "production", "name": "B", "allocated_amount": 10, "project_id": p["project"]}),
+    ("/equipment/", "equipment", lambda p: {"name": "Cam", "code": f"RU{p['suffix']}", "category": "camera"}),
+    ("/equipment/bookings", "equipment_bookings", lambda p: {"start_date": "2026-03-01T00:00:00", "end_date": "2026-03-02T00:00:00", "equipment_id": p["equipment"], "booked_by_id": 1}),
+    ("/equipment/maintenance", "maintenance_records", lambda p: {"maintenance_type": "routine", "description": "m", "equipment_id": p["equipment"]}),
+    ("/production/locations", "locations", lambda p: {"name": "Stage"}),
+    ("/production/schedules", "production_schedules", lambda p: {"title": "Shoot", "date": "2026-01-01", "project_id": p["project"]}),
+    ("/production/crew", "crew_assignments", lambda p: {"role": "director", "schedule_id": p["schedule"], "employee_id": p["employee"]}),
+    ("/production/shoot-days", "shoot_days", lambda p: {"date": "2026-01-01", "schedule_id": p["schedule"]}),
+]
+
+
+@pytest.mark.parametrize("path, table, body", CREATES, ids=[table for _, table, _ in CREATES])
+async def test_create_is_one_insert_returning(client, admin_headers, parents, request_queries, path, table, body):
+    response = await client.post(API + path.format(**parents), json=body(parents), headers=admin_headers)
+    assert response.status_code < 300, response.text
+    assert response.json()["id"]
+
+    statements = statements_on(request_queries[-1], table)
+    inserts = [index for index, statement in enumerate(statements) if statement.lstrip().upper().startswith("INSERT")]
+    assert len(inserts) == 1, f"{len(inserts)} INSERTs into {table}: {statements}"
+    assert "RETURNING" in statements[inserts[0]].upper()
+    assert statements[inserts[0] + 1:] == [], f"{table} was read again after the INSERT"
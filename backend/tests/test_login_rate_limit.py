@@ -0,0 +1,59 @@
+"""
+Login buckets are keyed by the client behind the proxy: X-Forwarded-For is
+used when the peer is a TRUSTED_PROXIES entry and ignored otherwise.
+"""
+import uuid
+
+import pytest
+
+from app.core.config import settings
+from app.core.rate_limit import InMemoryTokenBucketBackend, TokenBucketBackend, login_rate_limiter
+
+API = settings.API_V1_STR
+
+
+@pytest.fixture
+def throttled(monkeypatch):
+    """Fresh buckets allowing two attempts per IP; usernames never run out."""
+    monkeypatch.setattr(settings, "LOGIN_RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(settings, "LOGIN_IP_RATE_PER_MINUTE", 0.001)
+    monkeypatch.setattr(settings, "LOGIN_IP_BURST", 2)
+    monkeypatch.setattr(settings, "LOGIN_USERNAME_BURST", 100)
+    monkeypatch.setattr(login_rate_limiter, "backend", InMemoryTokenBucketBackend())
+
+
+async def attempts(client, forwarded_for: str, count: int):
+    statuses = []
+    for _ in range(count):
+        response = await client.post(
+            f"{API}/auth/login/json",
+            json={"username": f"nobody-{uuid.uuid4().hex[:6]}", "password": "wrong"},
+            headers={"X-Forwarded-For": forwarded_for},
+        )
+        statuses.append(response.status_code)
+    return statuses
+
+
+async def test_forwarded_clients_get_separate_buckets(client, throttled, monkeypatch):
+    # The test client connects from 127.0.0.1, standing in for nginx
+    monkeypatch.setattr(settings, "TRUSTED_PROXIES", ["127.0.0.0/8"])
+
+    assert await attempts(client, "203.0.113.1", 3) == [401, 401, 429]
+    assert await attempts(client, "203.0.113.2", 2) == [401, 401]
+    # A client-sent hop ahead of the one nginx appended does not change the bucket
+    assert await attempts(client, "198.51.100.7, 203.0.113.1", 1) == [429]
+
+
+async def test_forwarded_for_from_untrusted_peer_is_ignored(client, throttled, monkeypatch):
+    monkeypatch.setattr(settings, "TRUSTED_PROXIES", [])
+
+    assert await attempts(client, "203.0.113.1", 2) == [401, 401]
+    assert await attempts(client, "203.0.113.2", 1) == [429]
+
+
+def test_backend_without_take_fails_when_created():
+    class Incomplete(TokenBucketBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,195 @@
+"""
+Every budgeted route is exercised, twice so the second round runs with rows
+already present, under QUERY_BUDGET_MODE=raise: a route that goes over its
+budget in app/api/query_budgets.py, or repeats a statement like an N+1
+loop, raises QueryBudgetExceeded out of the request and fails the test.
+"""
+import uuid
+
+import pytest
+
+from app.api.query_budgets import ROUTE_QUERY_BUDGETS
+from app.core.config import settings
+from app.core.query_budget import QueryBudgetExceeded, query_budget_problems
+from app.core.query_stats import RequestQueries, route_stats
+from app.main import app
+
+API = settings.API_V1_STR
+
+# Long-lived event stream; its one query runs when it connects
+NOT_WALKED = {"GET /api/v1/dashboard/stream"}
+
+
+def api_routes():
+    return {
+        f"{method} {route.path}"
+        for route in app.routes
+        if getattr(route, "methods", None) and route.path.startswith(API)
+        for method in route.methods - {"HEAD"}
+    }
+
+
+def test_budgets_name_existing_routes():
+    assert set(ROUTE_QUERY_BUDGETS) - api_routes() == set()
+
+
+def test_problems_over_budget_and_repeats():
+    queries = RequestQueries()
+    for _ in range(3):
+        queries.observe("SELECT 1", 0.1)
+    problems = query_budget_problems("GET /x", queries, {"GET /x": 2})
+    assert any("ran 3 queries, budget is 2" in problem for problem in problems)
+    assert any("same statement 3 times" in problem for problem in problems)
+    assert "GET /x ran 3 queries but has no query budget" in query_budget_problems("GET /x", queries, {})
+
+
+async def test_request_over_budget_raises(client, admin_headers, monkeypatch):
+    monkeypatch.setitem(ROUTE_QUERY_BUDGETS, "GET /api/v1/users/", 0)
+    with pytest.raises(QueryBudgetExceeded):
+        await client.get(f"{API}/users/", headers=admin_headers)
+
+
+async def walk(client, headers, rep: str):
+    async def call(method, path, body=None, **kwargs):
+        if body is not None:
+            kwargs["json"] = body
+        kwargs["headers"] = {**headers, **kwargs.get("headers", {})}
+        response = await client.request(method, API + path, **kwargs)
+        assert response.status_code < 400, f"{method} {path}: {response.status_code} {response.text}"
+        return response.json() if response.content else None
+
+    login = await call("POST", "/auth/login/json", {"username": "admin", "password": "admin123"})
+    await call("POST", "/auth/login", data={"username": "admin", "password": "admin123"})
+    rotated = await call("POST", "/auth/refresh", {"refresh_token": login["refresh_token"]})
+    await client.post(f"{API}/auth/logout", json={"refresh_token": rotated["refresh_token"]})
+    await call("GET", "/auth/me")
+
+    user = await call("POST", "/users/", {"email": f"b{rep}@example.com", "username": f"b{rep}", "password": "pw"})
+    await call("GET", "/users/")
+    await call("GET", f"/users/{user['id']}")
+    await call("PUT", f"/users/{user['id']}", {"full_name": "Budget"})
+
+    dept = await call("POST", "/hr/departments", {"name": f"D{rep}", "code": f"BD{rep}"})
+    await call("GET", "/hr/departments")
+    await call("GET", f"/hr/departments/{dept['id']}")
+    await call("PUT", f"/hr/departments/{dept['id']}", {"name": "DD"})
+    employee = await call("POST", "/hr/employees", {"employee_code": f"BE{rep}", "job_title": "x", "hire_date": "2026-01-01", "user_id": user["id"]})
+    await call("GET", "/hr/employees")
+    await call("GET", f"/hr/employees/{employee['id']}")
+    await call("PUT", f"/hr/employees/{employee['id']}", {"job_title": "y"})
+    leave = await call("POST", "/hr/leave-requests", {"employee_id": employee["id"], "leave_type": "annual", "start_date": "2026-01-01", "end_date": "2026-01-02"})
+    await call("GET", "/hr/leave-requests")
+    await call("PUT", f"/hr/leave-requests/{leave['id']}", {"status": "approved"})
+    await call("POST", "/hr/attendance", {"employee_id": employee["id"], "date": "2026-01-01"})
+    await call("GET", "/hr/attendance")
+
+    project = await call("POST", "/projects/", {"name": "P", "code": f"BP{rep}"})
+    await call("GET", "/projects/")
+    await call("GET", f"/projects/{project['id']}")
+    await call("PUT", f"/projects/{project['id']}", {"name": "PP"})
+    sprint = await call("POST", "/projects/sprints", {"name": "S", "start_date": "2026-01-01", "end_date": "2026-01-10", "project_id": project["id"]})
+    await call("GET", f"/projects/{project['id']}/sprints")
+    await call("PUT", f"/projects/sprints/{sprint['id']}", {"name": "SS"})
+    task = await call("POST", "/projects/tasks", {"title": "T", "project_id": project["id"], "created_by_id": 1, "assignee_id": 1})
+    other = await call("POST", "/projects/tasks", {"title": "T2", "project_id": project["id"], "created_by_id": 1})
+    await call(
+        "POST", f"/projects/{project['id']}/tasks/import",
+        content=b"title,priority\nImported 1,high\nImported 2,low\n", headers={"Content-Type": "text/csv"}
+    )
+    await call("GET", "/projects/tasks/all")
+    await call("GET", "/projects/tasks/all", params={"cursor": ""})
+    await call("GET", f"/projects/{project['id']}/tasks")
+    await call("GET", f"/projects/{project['id']}/board")
+    await call("GET", f"/projects/tasks/{task['id']}")
+    await call("PUT", f"/projects/tasks/{task['id']}", {"status": "in_progress"})
+    await call("PUT", f"/projects/tasks/{other['id']}/move", {"status": "in_progress", "before_id": task["id"]})
+    await call("PUT", "/projects/tasks/bulk", {"ids": [task["id"], other["id"]], "changes": {"priority": "high"}})
+    await call("POST", f"/projects/tasks/{task['id']}/comments", {"content": "c", "task_id": task["id"], "author_id": 1})
+    await call("GET", f"/projects/tasks/{task['id']}/comments")
+    await call("DELETE", f"/projects/tasks/{other['id']}")
+
+    crm_client = await call("POST", "/crm/clients", {"name": "C", "code": f"BC{rep}"})
+    await call("GET", "/crm/clients")
+    await call("GET", f"/crm/clients/{crm_client['id']}")
+    await call("PUT", f"/crm/clients/{crm_client['id']}", {"name": "CC"})
+    contact = await call("POST", "/crm/contacts", {"first_name": "A", "last_name": "B", "client_id": crm_client["id"]})
+    await call("GET", "/crm/contacts")
+    await call("GET", f"/crm/contacts/{contact['id']}")
+    await call("PUT", f"/crm/contacts/{contact['id']}", {"first_name": "AA"})
+    lead = await call("POST", "/crm/leads", {"title": "L"})
+    await call("GET", "/crm/leads")
+    await call("GET", f"/crm/leads/{lead['id']}")
+    await call("PUT", f"/crm/leads/{lead['id']}", {"title": "LL"})
+    deal = await call("POST", "/crm/deals", {"name": "D", "client_id": crm_client["id"], "amount": 100})
+    await call("GET", "/crm/deals")
+    await call("GET", f"/crm/deals/{deal['id']}")
+    await call("PUT", f"/crm/deals/{deal['id']}", {"probability": 50})
+    await call("POST", "/crm/interactions", {"interaction_type": "call", "subject": "s", "created_by_id": 1, "client_id": crm_client["id"]})
+    await call("GET", "/crm/interactions")
+
+    invoice = await call("POST", "/accounting/invoices", {
+        "invoice_number": f"BI{rep}", "client_id": crm_client["id"], "issue_date": "2026-01-01", "due_date": "2026-02-01",
+        "items": [{"description": "x", "quantity": 1, "unit_price": 10}, {"description": "y", "quantity": 2, "unit_price": 5}],
+    })
+    await call("GET", "/accounting/invoices")
+    await call("GET", f"/accounting/invoices/{invoice['id']}")
+    await call("PUT", f"/accounting/invoices/{invoice['id']}", {"status": "sent"})
+    await call("POST", f"/accounting/invoices/{invoice['id']}/payments", {"invoice_id": invoice["id"], "amount": 5, "payment_date": "2026-01-05", "payment_method": "bank_transfer"})
+    await call("GET", f"/accounting/invoices/{invoice['id']}/payments")
+    expense = await call("POST", "/accounting/expenses", {"category": "crew", "description": "x", "amount": 3, "expense_date": "2026-01-01"})
+    await call("GET", "/accounting/expenses")
+    await call("GET", f"/accounting/expenses/{expense['id']}")
+    await call("PUT", f"/accounting/expenses/{expense['id']}", {"status": "approved"})
+    budget = await call("POST", "/accounting/budgets", {"category": "production", "name": "B", "allocated_amount": 10, "project_id": project["id"]})
+    await call("GET", "/accounting/budgets")
+    await call("PUT", f"/accounting/budgets/{budget['id']}", {"spent_amount": 4})
+
+    equipment = await call("POST", "/equipment/", {"name": "Cam", "code": f"BQ{rep}", "category": "camera"})
+    await call("GET", "/equipment/")
+    await call("GET", f"/equipment/{equipment['id']}")
+    await call("PUT", f"/equipment/{equipment['id']}", {"name": "Cam2"})
+    booking = await call("POST", "/equipment/bookings", {"start_date": "2026-04-01T00:00:00", "end_date": "2026-04-02T00:00:00", "equipment_id": equipment["id"], "booked_by_id": 1})
+    await call("GET", "/equipment/bookings/all")
+    await call("GET", f"/equipment/{equipment['id']}/bookings")
+    await call("PUT", f"/equipment/bookings/{booking['id']}", {"status": "checked_out"})
+    maintenance = await call("POST", "/equipment/maintenance", {"maintenance_type": "routine", "description": "m", "equipment_id": equipment["id"], "next_maintenance_date": "2026-06-01"})
+    await call("GET", f"/equipment/{equipment['id']}/maintenance")
+    await call("PUT", f"/equipment/maintenance/{maintenance['id']}", {"description": "mm"})
+
+    location = await call("POST", "/production/locations", {"name": "L"})
+    await call("GET", "/production/locations")
+    await call("GET", f"/production/locations/{location['id']}")
+    await call("PUT", f"/production/locations/{location['id']}", {"name": "LL"})
+    schedule = await call("POST", "/production/schedules", {"title": "S", "date": "2026-01-01", "project_id": project["id"]})
+    await call("GET", "/production/schedules")
+    await call("GET", f"/production/schedules/{schedule['id']}")
+    await call("PUT", f"/production/schedules/{schedule['id']}", {"title": "SS"})
+    crew = await call("POST", "/production/crew", {"role": "director", "schedule_id": schedule["id"], "employee_id": employee["id"]})
+    await call("GET", f"/production/schedules/{schedule['id']}/crew")
+    await call("PUT", f"/production/crew/{crew['id']}", {"notes": "n"})
+    shoot_day = await call("POST", "/production/shoot-days", {"date": "2026-01-01", "schedule_id": schedule["id"]})
+    await call("GET", f"/production/schedules/{schedule['id']}/shoot-days")
+    await call("PUT", f"/production/shoot-days/{shoot_day['id']}", {"notes": "n"})
+
+    await call("GET", "/dashboard/stats")
+    await call("GET", "/dashboard/recent-activity")
+    await call("GET", "/dashboard/my-tasks")
+    await call("GET", "/dashboard/activity")
+
+    await call("DELETE", f"/production/crew/{crew['id']}")
+    spare_schedule = await call("POST", "/production/schedules", {"title": "Spare", "date": "2026-01-02", "project_id": project["id"]})
+    await call("DELETE", f"/production/schedules/{spare_schedule['id']}")
+    await call("DELETE", f"/equipment/{equipment['id']}")
+    await call("DELETE", f"/projects/{project['id']}")
+    spare = await call("POST", "/users/", {"email": f"bz{rep}@example.com", "username": f"bz{rep}", "password": "pw"})
+    await call("DELETE", f"/users/{spare['id']}")
+
+
+async def test_routes_stay_within_budgets(client, admin_headers):
+    route_stats.reset()
+    suffix = uuid.uuid4().hex[:6]
+    for round_number in range(2):
+        await walk(client, admin_headers, f"{suffix}{round_number}")
+
+    walked = set(route_stats.snapshot())
+    assert set(ROUTE_QUERY_BUDGETS) - NOT_WALKED - walked == set(), "budgeted routes this test does not exercise"
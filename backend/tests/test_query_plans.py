@@ -0,0 +1,205 @@
+"""
+The filtered list and dashboard routes must find their rows through an
+index. Their SELECTs are captured from real requests and explained against
+a copy of the test database filled with enough rows, and ANALYZEd, that the
+planner picks the indexes it would in production.
+"""
+import random
+import re
+import sqlite3
+from typing import Dict, Iterable, List, Set, Tuple
+
+import pytest
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.database import engine
+
+API = settings.API_V1_STR
+ROWS = 20000
+
+ROUTES = [
+    "/projects/?status=planning", "/projects/?client_id=1", "/projects/1/sprints",
+    "/projects/tasks/all?status=todo", "/projects/tasks/all?assignee_id=1",
+    "/projects/tasks/all?cursor=", "/projects/1/tasks", "/projects/1/tasks?status=todo",
+    "/projects/1/tasks?sprint_id=1", "/projects/tasks/1/comments", "/projects/1/board",
+    "/crm/contacts?client_id=1", "/crm/leads?status=new", "/crm/leads?assigned_to_id=1",
+    "/crm/deals?stage=proposal", "/crm/deals?client_id=1", "/crm/deals?owner_id=1",
+    "/crm/interactions?client_id=1", "/crm/interactions?deal_id=1", "/crm/interactions",
+    "/accounting/invoices?status=sent", "/accounting/invoices?client_id=1",
+    "/accounting/invoices?project_id=1", "/accounting/invoices/1/payments",
+    "/accounting/expenses?status=pending", "/accounting/expenses?project_id=1",
+    "/accounting/expenses?employee_id=1", "/accounting/budgets?project_id=1",
+    "/equipment/bookings/all?status=pending", "/equipment/bookings/all?equipment_id=1",
+    "/equipment/bookings/all?project_id=1", "/equipment/1/bookings", "/equipment/1/maintenance",
+    "/hr/employees?department_id=1", "/hr/leave-requests?status=pending",
+    "/hr/leave-requests?employee_id=1", "/hr/attendance?employee_id=1",
+    "/production/schedules?project_id=1", "/production/schedules?status=confirmed",
+    "/production/schedules/1/crew", "/production/schedules/1/shoot-days",
+    "/dashboard/recent-activity", "/dashboard/my-tasks", "/dashboard/activity",
+]
+
+
+def insert(conn: sqlite3.Connection, table: str, rows: Iterable[Dict]):
+    rows = list(rows)
+    columns = list(rows[0])
+    conn.executemany(
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+        [tuple(row[column] for column in columns) for row in rows]
+    )
+
+
+def seed(conn: sqlite3.Connection):
+    """Rows spread over many parents and every status, so no filter below matches most of a table."""
+    pick = random.Random(4).choice
+    some = random.Random(4).randint
+    day = lambda i: f"2026-{1 + i % 12:02d}-{1 + i % 28:02d}"
+    insert(conn, "clients", ({"name": f"Client {i}", "code": f"QC{i}", "is_active": i % 10 != 0} for i in range(500)))
+    insert(conn, "departments", ({"name": f"Dept {i}", "code": f"QD{i}", "is_active": True} for i in range(50)))
+    insert(conn, "employees", (
+        {"employee_code": f"QE{i}", "job_title": "Crew", "hire_date": day(i), "department_id": some(1, 50), "is_active": True}
+        for i in range(2000)
+    ))
+    insert(conn, "projects", (
+        {"name": f"Project {i}", "code": f"QP{i}", "is_archived": i % 10 == 0, "next_task_number": 1,
+         "status": pick(["PLANNING", "PRODUCTION", "POST_PRODUCTION", "COMPLETED"]), "project_type": "COMMERCIAL",
+         "client_id": some(1, 500)}
+        for i in range(2000)
+    ))
+    insert(conn, "sprints", (
+        {"project_id": some(1, 2000), "name": "Sprint", "start_date": day(i), "end_date": day(i + 10)}
+        for i in range(2000)
+    ))
+    insert(conn, "tasks", (
+        {"project_id": some(1, 2000), "task_key": f"QT-{i}", "title": "Task", "rank": "i", "position": some(0, 999),
+         "status": pick(["BACKLOG", "TODO", "IN_PROGRESS", "IN_REVIEW", "BLOCKED", "DONE"]), "priority": "MEDIUM",
+         "task_type": "TASK", "assignee_id": some(1, 500), "created_by_id": 1, "sprint_id": some(1, 2000),
+         "logged_hours": 0, "due_date": day(i)}
+        for i in range(ROWS)
+    ))
+    insert(conn, "comments", ({"task_id": some(1, ROWS), "author_id": 1, "content": "c"} for _ in range(ROWS)))
+    insert(conn, "invoices", (
+        {"invoice_number": f"QI{i}", "client_id": some(1, 500), "project_id": some(1, 2000), "issue_date": day(i),
+         "due_date": day(i + 30), "status": pick(["DRAFT", "SENT", "PAID", "OVERDUE", "PARTIAL"]), "created_at": day(i)}
+        for i in range(ROWS)
+    ))
+    insert(conn, "invoice_items", (
+        {"invoice_id": some(1, ROWS), "description": "i", "quantity": 1, "unit_price": 1, "amount": 1} for _ in range(ROWS)
+    ))
+    insert(conn, "payment_records", (
+        {"invoice_id": some(1, ROWS), "amount": 1, "payment_date": day(i), "payment_method": "CASH"} for i in range(ROWS)
+    ))
+    insert(conn, "expenses", (
+        {"expense_number": f"QX{i}", "category": "CREW", "description": "e", "amount": 1, "expense_date": day(i),
+         "status": pick(["PENDING", "APPROVED", "REJECTED", "REIMBURSED"]), "project_id": some(1, 2000),
+         "employee_id": some(1, 2000), "created_at": day(i)}
+        for i in range(ROWS)
+    ))
+    insert(conn, "budgets", (
+        {"project_id": some(1, 2000), "category": "CREW", "name": "b", "allocated_amount": 1} for _ in range(ROWS)
+    ))
+    insert(conn, "equipment", (
+        {"name": f"Kit {i}", "code": f"QK{i}", "category": pick(["CAMERA", "LENS", "AUDIO"]),
+         "status": pick(["AVAILABLE", "IN_USE", "MAINTENANCE"]), "is_active": True}
+        for i in range(2000)
+    ))
+    insert(conn, "equipment_bookings", (
+        {"equipment_id": some(1, 2000), "booked_by_id": 1, "project_id": some(1, 2000), "start_date": day(i),
+         "end_date": day(i + 2), "status": pick(["PENDING", "CONFIRMED", "CHECKED_OUT", "RETURNED", "CANCELLED"])}
+        for i in range(ROWS)
+    ))
+    insert(conn, "maintenance_records", (
+        {"equipment_id": some(1, 2000), "maintenance_type": "ROUTINE", "description": "m"} for _ in range(ROWS)
+    ))
+    insert(conn, "leave_requests", (
+        {"employee_id": some(1, 2000), "leave_type": "ANNUAL", "start_date": day(i), "end_date": day(i + 1),
+         "total_days": 1, "status": pick(["PENDING", "APPROVED", "REJECTED", "CANCELLED"])}
+        for i in range(ROWS)
+    ))
+    insert(conn, "attendance", ({"employee_id": some(1, 2000), "date": day(i)} for i in range(ROWS)))
+    insert(conn, "production_schedules", (
+        {"project_id": some(1, 2000), "title": "Shoot", "date": day(i), "shoot_type": "STUDIO",
+         "status": pick(["TENTATIVE", "CONFIRMED", "COMPLETED", "POSTPONED", "CANCELLED"])}
+        for i in range(ROWS)
+    ))
+    insert(conn, "crew_assignments", ({"schedule_id": some(1, ROWS), "role": "DIRECTOR"} for _ in range(ROWS)))
+    insert(conn, "shoot_days", ({"schedule_id": some(1, ROWS), "date": day(i)} for i in range(ROWS)))
+    insert(conn, "contacts", (
+        {"client_id": some(1, 500), "first_name": "A", "last_name": "B", "is_active": True} for _ in range(ROWS)
+    ))
+    insert(conn, "leads", (
+        {"title": "Lead", "status": pick(["NEW", "CONTACTED", "QUALIFIED", "WON", "LOST"]),
+         "assigned_to_id": some(1, 500), "created_at": day(i)}
+        for i in range(ROWS)
+    ))
+    insert(conn, "deals", (
+        {"name": "Deal", "client_id": some(1, 500), "owner_id": some(1, 500), "amount": some(1, 10000),
+         "stage": pick(["DISCOVERY", "PROPOSAL", "NEGOTIATION", "CLOSED_WON", "CLOSED_LOST"])}
+        for _ in range(ROWS)
+    ))
+    insert(conn, "interactions", (
+        {"client_id": some(1, 500), "deal_id": some(1, ROWS), "interaction_type": "CALL", "subject": "s",
+         "created_by_id": 1, "created_at": day(i)}
+        for i in range(ROWS)
+    ))
+    conn.commit()
+    conn.execute("ANALYZE")
+
+
+def full_scans(plan: List[Tuple], tables: Set[str]) -> List[str]:
+    """
+    Plan steps that read a whole table rather than seeking or scanning an
+    index. Scans of subqueries (e.g. the board's window over one project's
+    tasks) only read rows that were already found.
+    """
+    scans = []
+    for step in plan:
+        match = re.match(r"SCAN (\w+)", step[3])
+        if match and match.group(1) in tables and " INDEX " not in step[3]:
+            scans.append(step[3])
+    return scans
+
+
+@pytest.fixture(scope="module")
+def seeded(database, tmp_path_factory):
+    path = tmp_path_factory.mktemp("plans") / "seeded.db"
+    source = sqlite3.connect(database)
+    conn = sqlite3.connect(path)
+    source.backup(conn)
+    source.close()
+    seed(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+async def route_selects(client, admin_headers):
+    """{route: [(sql, params)]} of the SELECTs each route runs."""
+    captured: Dict[str, List[Tuple[str, tuple]]] = {}
+    current: List[Tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            current.append((statement, tuple(parameters)))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        for route in ROUTES:
+            current.clear()
+            response = await client.get(API + route, headers=admin_headers)
+            assert response.status_code < 500, f"{route}: {response.text}"
+            captured[route] = list(current)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+    return captured
+
+
+async def test_route_queries_use_indexes(seeded, route_selects):
+    tables = {name for name, in seeded.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    problems = []
+    for route, statements in route_selects.items():
+        for statement, parameters in statements:
+            plan = seeded.execute("EXPLAIN QUERY PLAN " + statement, parameters).fetchall()
+            for step in full_scans(plan, tables):
+                problems.append(f"{route}: {step} in {' '.join(statement.split())[:200]}")
+    assert not problems, "\n".join(problems)
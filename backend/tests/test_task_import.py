@@ -0,0 +1,34 @@
+"""
+Task imports check the project before reading the file, so a missing
+project is a 404 however many rows are invalid.
+"""
+import uuid
+
+from app.core.config import settings
+
+API = settings.API_V1_STR
+
+INVALID_ROWS = b"title,priority\n,urgent\n,\n"
+
+
+async def import_csv(client, headers, project_id: int, body: bytes):
+    return await client.post(
+        f"{API}/projects/{project_id}/tasks/import",
+        content=body, headers={**headers, "Content-Type": "text/csv"},
+    )
+
+
+async def test_missing_project_is_404_even_with_only_invalid_rows(client, admin_headers):
+    response = await import_csv(client, admin_headers, 999_999, INVALID_ROWS)
+    assert response.status_code == 404
+
+
+async def test_invalid_rows_are_reported_for_an_existing_project(client, admin_headers):
+    response = await client.post(
+        f"{API}/projects/", json={"name": "Import", "code": f"I{uuid.uuid4().hex[:6].upper()}"}, headers=admin_headers
+    )
+    response = await import_csv(client, admin_headers, response.json()["id"], INVALID_ROWS + b"Good row,high\n")
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["created"], report["failed"]) == (1, 2)
+    assert [error["line"] for error in report["errors"]] == [2, 3]
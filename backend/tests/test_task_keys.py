@@ -0,0 +1,57 @@
+"""
+Task keys come from the project's next_task_number, reserved in the same
+transaction as the insert, so parallel creates never hand out a key twice.
+"""
+import asyncio
+import uuid
+
+from app.api.routes.projects import reserve_task_numbers
+from app.core.config import settings
+from app.core.database import async_session_maker
+
+API = settings.API_V1_STR
+
+PARALLEL_CREATES = 2000
+RACING_SESSIONS = 20
+
+
+async def test_parallel_creates_get_unique_keys(client, admin_headers):
+    code = f"K{uuid.uuid4().hex[:6].upper()}"
+    response = await client.post(f"{API}/projects/", json={"name": "Keys", "code": code}, headers=admin_headers)
+    project_id = response.json()["id"]
+
+    async def create(number: int):
+        return await client.post(
+            f"{API}/projects/tasks",
+            json={"title": f"Task {number}", "project_id": project_id, "created_by_id": 1},
+            headers=admin_headers,
+        )
+
+    responses = await asyncio.gather(*(create(number) for number in range(PARALLEL_CREATES)))
+    assert [response.status_code for response in responses] == [201] * PARALLEL_CREATES
+
+    keys = [response.json()["task_key"] for response in responses]
+    assert sorted(keys) == sorted(f"{code}-{number}" for number in range(1, PARALLEL_CREATES + 1))
+
+
+async def test_sessions_racing_to_reserve_get_distinct_numbers(client, admin_headers):
+    code = f"R{uuid.uuid4().hex[:6].upper()}"
+    response = await client.post(f"{API}/projects/", json={"name": "Race", "code": code}, headers=admin_headers)
+    project_id = response.json()["id"]
+    # All sessions are open before any reserves, and each yields between reserving and committing
+    started = asyncio.Barrier(RACING_SESSIONS)
+
+    async def reserve(count: int):
+        async with async_session_maker() as db:
+            await started.wait()
+            reserved = await reserve_task_numbers(db, project_id, count)
+            await asyncio.sleep(0.01)
+            await db.commit()
+        return reserved
+
+    counts = [1 + session % 3 for session in range(RACING_SESSIONS)]
+    reserved = await asyncio.gather(*(reserve(count) for count in counts))
+
+    numbers = [first + offset for (_, first), count in zip(reserved, counts) for offset in range(count)]
+    assert sorted(numbers) == list(range(1, sum(counts) + 1))
+    assert {project_code for project_code, _ in reserved} == {code}
@@ -1,5 +1,5 @@
-import React from 'react';
-import { useQuery } from '@tanstack/react-query';
+import React, { useEffect, useState } from 'react';
+import { useQuery, useQueryClient } from '@tanstack/react-query';
 import {
   FolderKanban,
   CheckCircle2,
@@ -35,15 +35,86 @@ const StatCard: React.FC<{
   </Card>
 );
 
+const RECENT_ACTIVITY_SIZE = 5;
+
+// Keeps 'dashboard-stats' and 'recent-activity' current from /dashboard/stream; true while connected
+const useDashboardStream = (): boolean => {
+  const queryClient = useQueryClient();
+  const [live, setLive] = useState(false);
+
+  useEffect(() => {
+    const controller = new AbortController();
+    let retryDelay = 1000;
+
+    const onEvent = (event: string, data: any) => {
+      if (event === 'stats') {
+        // Only changed metrics are sent; the first event is the full snapshot
+        setLive(true);
+        retryDelay = 1000;
+        queryClient.setQueryData<DashboardStats>(['dashboard-stats'], (old) => {
+          const merged: any = { ...(old || {}) };
+          for (const [section, values] of Object.entries(data)) {
+            merged[section] = values && typeof values === 'object' ? { ...merged[section], ...values } : values;
+          }
+          return merged;
+        });
+      } else if (event === 'activity') {
+        // A feed that failed to load is incomplete; fetch it again rather than patch it
+        const current: any = queryClient.getQueryData(['recent-activity']);
+        if (current?.errors?.[data.feed]) {
+          queryClient.invalidateQueries({ queryKey: ['recent-activity'] });
+          return;
+        }
+        queryClient.setQueryData(['recent-activity'], (old: any) => {
+          if (!old || !Array.isArray(old[data.feed])) return old;
+          const items = old[data.feed].filter((item: any) => item.id !== data.item.id);
+          return { ...old, [data.feed]: [data.item, ...items].slice(0, RECENT_ACTIVITY_SIZE) };
+        });
+      } else if (event === 'resync') {
+        queryClient.invalidateQueries({ queryKey: ['dashboard-stats'] });
+        queryClient.invalidateQueries({ queryKey: ['recent-activity'] });
+      }
+    };
+
+    const connect = async (reconnecting: boolean) => {
+      while (!controller.signal.aborted) {
+        let delay = retryDelay;
+        try {
+          // Activity published while disconnected was missed
+          if (reconnecting) queryClient.invalidateQueries({ queryKey: ['recent-activity'] });
+          await dashboardApi.stream(onEvent, controller.signal);
+        } catch (error: any) {
+          if (controller.signal.aborted) return;
+          if (error?.retryAfter) delay = error.retryAfter * 1000;
+        }
+        setLive(false);
+        reconnecting = true;
+        await new Promise((resolve) => setTimeout(resolve, delay));
+        retryDelay = Math.min(retryDelay * 2, 30000);
+      }
+    };
+    connect(false);
+
+    return () => controller.abort();
+  }, [queryClient]);
+
+  return live;
+};
+
 export const Dashboard: React.FC = () => {
+  const live = useDashboardStream();
+
+  // While the stream is connected it keeps these current, so skip refetching them
   const { data: stats, isLoading } = useQuery<DashboardStats>({
     queryKey: ['dashboard-stats'],
     queryFn: dashboardApi.getStats,
+    ...(live && { staleTime: Infinity }),
   });
 
   const { data: recentActivity } = useQuery({
     queryKey: ['recent-activity'],
     queryFn: dashboardApi.getRecentActivity,
+    ...(live && { staleTime: Infinity }),
   });
 
   const { data: myTasks } = useQuery({
@@ -159,7 +230,9 @@ export const Dashboard: React.FC = () => {
             <h3 className="text-lg font-semibold text-gray-900">Recent Projects</h3>
           </div>
           <div className="space-y-3">
-            {recentActivity?.recent_projects?.length === 0 ? (
+            {recentActivity?.errors?.recent_projects ? (
+              <p className="text-gray-500 text-sm">Recent projects could not be loaded</p>
+            ) : recentActivity?.recent_projects?.length === 0 ? (
               <p className="text-gray-500 text-sm">No recent projects</p>
             ) : (
               recentActivity?.recent_projects?.map((project: any) => (
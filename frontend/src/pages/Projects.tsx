@@ -3,7 +3,7 @@ import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { Plus, Search, MoreVertical, Calendar, Users } from 'lucide-react';
 import { Card, Button, Input, Badge, getStatusBadgeVariant, Modal, Select } from '../components/ui';
 import { projectsApi, tasksApi } from '../services/api';
-import { Project, Task, TaskStatus } from '../types';
+import { Board, Project, TaskStatus } from '../types';
 import { useAuthStore } from '../store/authStore';
 import { format } from 'date-fns';
 
@@ -42,9 +42,9 @@ export const Projects: React.FC = () => {
     queryFn: () => projectsApi.list(),
   });
 
-  const { data: tasks, isLoading: tasksLoading } = useQuery<Task[]>({
-    queryKey: ['tasks', selectedProject?.id],
-    queryFn: () => selectedProject ? tasksApi.listByProject(selectedProject.id) : Promise.resolve([]),
+  const { data: board, isLoading: tasksLoading } = useQuery<Board>({
+    queryKey: ['board', selectedProject?.id],
+    queryFn: () => tasksApi.board(selectedProject!.id),
     enabled: !!selectedProject,
   });
 
@@ -59,14 +59,18 @@ export const Projects: React.FC = () => {
   const createTaskMutation = useMutation({
     mutationFn: tasksApi.create,
     onSuccess: () => {
+      queryClient.invalidateQueries({ queryKey: ['board'] });
       queryClient.invalidateQueries({ queryKey: ['tasks'] });
       setShowTaskModal(false);
     },
   });
 
-  const updateTaskMutation = useMutation({
-    mutationFn: ({ id, data }: { id: number; data: any }) => tasksApi.update(id, data),
-    onSuccess: () => {
+  // On success and on 409 (the column was reordered meanwhile) alike, reload the board
+  const moveTaskMutation = useMutation({
+    mutationFn: ({ id, data }: { id: number; data: { status?: TaskStatus; before_id?: number; after_id?: number } }) =>
+      tasksApi.move(id, data),
+    onSettled: () => {
+      queryClient.invalidateQueries({ queryKey: ['board'] });
       queryClient.invalidateQueries({ queryKey: ['tasks'] });
     },
   });
@@ -104,10 +108,25 @@ export const Projects: React.FC = () => {
     e.dataTransfer.setData('taskId', taskId.toString());
   };
 
+  // Dropped on empty column space: append to the column
   const handleDrop = (e: React.DragEvent, newStatus: TaskStatus) => {
     e.preventDefault();
     const taskId = parseInt(e.dataTransfer.getData('taskId'));
-    updateTaskMutation.mutate({ id: taskId, data: { status: newStatus } });
+    moveTaskMutation.mutate({ id: taskId, data: { status: newStatus } });
+  };
+
+  // Dropped on a card: place the task just above it
+  const handleDropOnTask = (e: React.DragEvent, newStatus: TaskStatus, targetId: number) => {
+    e.preventDefault();
+    e.stopPropagation();
+    const taskId = parseInt(e.dataTransfer.getData('taskId'));
+    if (taskId === targetId) return;
+    const others = (board?.columns.find((c) => c.status === newStatus)?.tasks || []).filter((t) => t.id !== taskId);
+    const index = others.findIndex((t) => t.id === targetId);
+    moveTaskMutation.mutate({
+      id: taskId,
+      data: { status: newStatus, before_id: index > 0 ? others[index - 1].id : undefined, after_id: targetId },
+    });
   };
 
   const handleDragOver = (e: React.DragEvent) => {
@@ -196,7 +215,8 @@ export const Projects: React.FC = () => {
               {/* Kanban Columns */}
               <div className="flex gap-4 overflow-x-auto pb-4">
                 {taskStatusColumns.map((column) => {
-                  const columnTasks = tasks?.filter((t) => t.status === column.status) || [];
+                  const boardColumn = board?.columns.find((c) => c.status === column.status);
+                  const columnTasks = boardColumn?.tasks || [];
                   return (
                     <div
                       key={column.status}
@@ -208,7 +228,7 @@ export const Projects: React.FC = () => {
                         <div className="flex items-center justify-between">
                           <span className="font-medium text-sm text-gray-700">{column.label}</span>
                           <span className="text-xs bg-white px-2 py-0.5 rounded-full text-gray-600">
-                            {columnTasks.length}
+                            {boardColumn?.count ?? 0}
                           </span>
                         </div>
                       </div>
@@ -223,6 +243,7 @@ export const Projects: React.FC = () => {
                               key={task.id}
                               draggable
                               onDragStart={(e) => handleDragStart(e, task.id)}
+                              onDrop={(e) => handleDropOnTask(e, column.status, task.id)}
                               className="bg-white p-3 rounded-lg shadow-sm border border-gray-100 cursor-move hover:shadow-md transition-shadow"
                             >
                               <div className="flex items-start justify-between">
@@ -4,6 +4,8 @@ const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000/api/
 
 export const api = axios.create({
   baseURL: API_BASE_URL,
+  // Send the read-your-writes cookie so reads after a write hit the primary
+  withCredentials: true,
   headers: {
     'Content-Type': 'application/json',
   },
@@ -21,12 +23,39 @@ api.interceptors.request.use(
   (error) => Promise.reject(error)
 );
 
+// Access tokens are short-lived; concurrent 401s share one refresh
+let refreshing: Promise<string> | null = null;
+
+const refreshAccessToken = async (): Promise<string> => {
+  const refreshToken = localStorage.getItem('refresh_token');
+  if (!refreshToken) throw new Error('No refresh token');
+  const response = await axios.post(`${API_BASE_URL}/auth/refresh`, { refresh_token: refreshToken });
+  localStorage.setItem('token', response.data.access_token);
+  localStorage.setItem('refresh_token', response.data.refresh_token);
+  return response.data.access_token;
+};
+
 // Response interceptor for error handling
 api.interceptors.response.use(
   (response) => response,
-  (error) => {
+  async (error) => {
+    const original = error.config;
+    if (error.response?.status === 401 && original && !original._retried && !['/auth/login', '/auth/refresh', '/auth/logout'].includes(original.url)) {
+      original._retried = true;
+      try {
+        refreshing = refreshing || refreshAccessToken();
+        const token = await refreshing;
+        original.headers.Authorization = `Bearer ${token}`;
+        return api(original);
+      } catch {
+        // Fall through to the login redirect
+      } finally {
+        refreshing = null;
+      }
+    }
     if (error.response?.status === 401) {
       localStorage.removeItem('token');
+      localStorage.removeItem('refresh_token');
       window.location.href = '/login';
     }
     return Promise.reject(error);
@@ -48,6 +77,9 @@ export const authApi = {
     const response = await api.get('/auth/me');
     return response.data;
   },
+  logout: async (refreshToken: string) => {
+    await api.post('/auth/logout', { refresh_token: refreshToken });
+  },
 };
 
 // Projects API
@@ -75,7 +107,7 @@ export const projectsApi = {
 
 // Tasks API
 export const tasksApi = {
-  listAll: async (params?: { status?: string; assignee_id?: number }) => {
+  listAll: async (params?: { status?: string; assignee_id?: number; skip?: number; limit?: number; cursor?: string }) => {
     const response = await api.get('/projects/tasks/all', { params });
     return response.data;
   },
@@ -83,6 +115,10 @@ export const tasksApi = {
     const response = await api.get(`/projects/${projectId}/tasks`, { params });
     return response.data;
   },
+  board: async (projectId: number, params?: { limit?: number }) => {
+    const response = await api.get(`/projects/${projectId}/board`, { params });
+    return response.data;
+  },
   get: async (id: number) => {
     const response = await api.get(`/projects/tasks/${id}`);
     return response.data;
@@ -95,6 +131,22 @@ export const tasksApi = {
     const response = await api.put(`/projects/tasks/${id}`, data);
     return response.data;
   },
+  move: async (id: number, data: { status?: string; before_id?: number; after_id?: number }) => {
+    const response = await api.put(`/projects/tasks/${id}/move`, data);
+    return response.data;
+  },
+  bulkUpdate: async (data: { ids?: number[]; changes?: any; patches?: ({ id: number } & Record<string, any>)[] }) => {
+    const response = await api.put('/projects/tasks/bulk', data);
+    return response.data;
+  },
+  // CSV with a header row or NDJSON; the file is sent as the raw request body
+  importFile: async (projectId: number, file: File) => {
+    const contentType = /\.(nd)?jsonl?$/i.test(file.name) ? 'application/x-ndjson' : 'text/csv';
+    const response = await api.post(`/projects/${projectId}/tasks/import`, file, {
+      headers: { 'Content-Type': contentType },
+    });
+    return response.data;
+  },
   delete: async (id: number) => {
     await api.delete(`/projects/tasks/${id}`);
   },
@@ -365,10 +417,59 @@ export const dashboardApi = {
     const response = await api.get('/dashboard/recent-activity');
     return response.data;
   },
+  getActivity: async (params?: { cursor?: string; limit?: number; module?: string; actor_id?: number }) => {
+    const response = await api.get('/dashboard/activity', { params });
+    return response.data;
+  },
   getMyTasks: async () => {
     const response = await api.get('/dashboard/my-tasks');
     return response.data;
   },
+  // Server-sent events; EventSource cannot send the Authorization header, so read them with fetch.
+  // Resolves when the server closes the stream, rejects on errors and when `signal` aborts
+  stream: async (onEvent: (event: string, data: any) => void, signal: AbortSignal) => {
+    const open = () => fetch(`${API_BASE_URL}/dashboard/stream`, {
+      headers: { Authorization: `Bearer ${localStorage.getItem('token')}`, Accept: 'text/event-stream' },
+      credentials: 'include',
+      signal,
+    });
+    let response = await open();
+    if (response.status === 401) {
+      try {
+        refreshing = refreshing || refreshAccessToken();
+        await refreshing;
+      } finally {
+        refreshing = null;
+      }
+      response = await open();
+    }
+    if (!response.ok || !response.body) {
+      throw Object.assign(new Error(`Dashboard stream failed: ${response.status}`), {
+        retryAfter: Number(response.headers.get('Retry-After')) || undefined,
+      });
+    }
+
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = '';
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) return;
+      buffer += value;
+      let end;
+      while ((end = buffer.indexOf('\n\n')) >= 0) {
+        const block = buffer.slice(0, end);
+        buffer = buffer.slice(end + 2);
+        let event = 'message';
+        const data: string[] = [];
+        // Lines starting with ':' are heartbeats
+        for (const line of block.split('\n')) {
+          if (line.startsWith('event:')) event = line.slice(6).trim();
+          else if (line.startsWith('data:')) data.push(line.slice(5).trimStart());
+        }
+        if (data.length) onEvent(event, JSON.parse(data.join('\n')));
+      }
+    }
+  },
 };
 
 // Users API
@@ -30,6 +30,7 @@ export const useAuthStore = create<AuthState>()(
           const response = await authApi.login(username, password);
           const token = response.access_token;
           localStorage.setItem('token', token);
+          localStorage.setItem('refresh_token', response.refresh_token);
           
           set({ token, isLoading: false });
           
@@ -46,7 +47,12 @@ export const useAuthStore = create<AuthState>()(
       },
 
       logout: () => {
+        const refreshToken = localStorage.getItem('refresh_token');
+        if (refreshToken) {
+          authApi.logout(refreshToken).catch(() => undefined);
+        }
         localStorage.removeItem('token');
+        localStorage.removeItem('refresh_token');
         set({ user: null, token: null, isAuthenticated: false });
       },
 
@@ -60,6 +66,7 @@ export const useAuthStore = create<AuthState>()(
           set({ user, token, isAuthenticated: true, isLoading: false });
         } catch {
           localStorage.removeItem('token');
+          localStorage.removeItem('refresh_token');
           set({ user: null, token: null, isAuthenticated: false, isLoading: false });
         }
       },
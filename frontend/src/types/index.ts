@@ -74,10 +74,22 @@ export interface Task {
   stage: string | null;
   scene_number: string | null;
   position: number;
+  rank: string;
   labels: string | null;
   created_at: string;
 }
 
+export interface BoardColumn {
+  status: TaskStatus;
+  count: number;
+  tasks: Task[];
+}
+
+export interface Board {
+  project_id: number;
+  columns: BoardColumn[];
+}
+
 export type TaskStatus = 'backlog' | 'todo' | 'in_progress' | 'in_review' | 'blocked' | 'done';
 export type TaskPriority = 'lowest' | 'low' | 'medium' | 'high' | 'highest';
 export type TaskType = 'task' | 'bug' | 'story' | 'epic' | 'subtask' | 'milestone';
@@ -352,4 +364,22 @@ export interface DashboardStats {
   production: {
     upcoming_shoots: number;
   };
+  cache_age_seconds: number;
+}
+
+export interface ActivityEvent {
+  id: number;
+  created_at: string;
+  module: string;
+  entity_type: string;
+  entity_id: number;
+  action: 'created' | 'updated' | 'deleted' | 'payment_recorded';
+  actor_id?: number;
+  actor?: string;
+  summary: string;
+}
+
+export interface ActivityFeedPage {
+  items: ActivityEvent[];
+  next_cursor: string | null;
 }